@@ -1,8 +1,9 @@
 use pyo3::prelude::*;
+use pyo3::types::PyList;
 
 mod iter;
 
-use crate::frame::{TinyFrame, TinyColumn as FrameColumn, ValueEnum};
+use crate::frame::TinyFrame;
 
 #[pyclass]
 pub struct TinyCol {
@@ -22,21 +23,16 @@ impl TinyCol {
         let frame = self.frame.borrow(py);
         let col = frame.columns.get(&self.name)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", self.name)))?;
-        let type_str = match col {
-            FrameColumn::Int(_) => "Int",
-            FrameColumn::Float(_) => "Float",
-            FrameColumn::Str(_) => "Str",
-            FrameColumn::Bool(_) => "Bool",
-            FrameColumn::OptInt(_) => "OptInt",
-            FrameColumn::OptFloat(_) => "OptFloat",
-            FrameColumn::OptStr(_) => "OptStr",
-            FrameColumn::OptBool(_) => "OptBool",
-            FrameColumn::Mixed(_) => "Mixed",
-            FrameColumn::OptMixed(_) => "OptMixed",
-            FrameColumn::PyObject(_) => "PyObject",
-            FrameColumn::OptPyObject(_) => "OptPyObject",
-        };
-        Ok(type_str.into())
+        Ok(col.type_str().into())
+    }
+
+    /// Number of null values, counted without converting any value to Python.
+    #[getter]
+    pub fn null_count(&self, py: Python) -> PyResult<usize> {
+        let frame = self.frame.borrow(py);
+        let col = frame.columns.get(&self.name)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", self.name)))?;
+        Ok(col.null_count())
     }
 
     fn __repr__(&self, py: Python) -> PyResult<String> {
@@ -44,6 +40,14 @@ impl TinyCol {
         Ok(format!("TinyCol(name='{}', type='{}')", self.name, type_str))
     }
 
+    /// Return the column values as a Python list, converted in a single pass.
+    pub fn to_list(&self, py: Python) -> PyResult<Py<PyList>> {
+        let frame = self.frame.borrow(py);
+        let col = frame.columns.get(&self.name)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", self.name)))?;
+        Ok(crate::frame::convert::column_to_list(&frame, col, py))
+    }
+
     fn __iter__(slf: PyRef<Self>, py: Python) -> PyResult<Py<iter::TinyColIter>> {
         iter::TinyColIter::new(slf, py)
     }
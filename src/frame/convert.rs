@@ -1,136 +1,306 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyDict, PyList};
-use std::collections::{HashMap, HashSet};
+use pyo3::buffer::PyBuffer;
+use pyo3::types::{PyAny, PyBool, PyDict, PyFloat, PyList, PyLong, PyString};
+use std::collections::HashMap;
 use crate::frame::{TinyFrame, TinyColumn, ValueEnum};
 
-pub fn from_dicts_impl(py: Python, records: &PyAny) -> PyResult<TinyFrame> {
+pub fn from_dicts_impl(_py: Python, records: &PyAny) -> PyResult<TinyFrame> {
     let records_list: Vec<&PyDict> = records.extract()?;
     if records_list.is_empty() {
         return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Input list is empty"));
     }
 
-    let mut col_names: Vec<String> = Vec::new();
+    // Reuse the first record's key objects for every lookup: their hashes are
+    // cached, so rows are probed without building a new PyString per cell.
+    let mut col_keys: Vec<(&PyAny, String)> = Vec::new();
     for key in records_list[0].keys() {
-        col_names.push(key.extract::<String>()?);
+        col_keys.push((key, key.extract::<String>()?));
     }
 
     let num_rows = records_list.len();
-    let mut columns: HashMap<String, TinyColumn> = HashMap::new();
+    let mut columns: HashMap<String, TinyColumn> = HashMap::with_capacity(col_keys.len());
     let mut py_objects: HashMap<u64, PyObject> = HashMap::new();
 
-    for col in &col_names {
-        let mut types_present = HashSet::new();
+    for (key, col) in col_keys {
+        let mut builder = ColumnBuilder::Empty { nulls: 0, capacity: num_rows };
         let mut has_none = false;
-        let mut value_enum_vals: Vec<Option<ValueEnum>> = Vec::new();
 
         for row in &records_list {
-            let val_opt = row.get_item(col);
-
-            if let Ok(Some(val)) = val_opt {
-                if val.is_none() {
+            let value = match row.get_item(key) {
+                Ok(Some(val)) if !val.is_none() => val,
+                _ => {
                     has_none = true;
-                    value_enum_vals.push(None);
+                    builder.push(None);
                     continue;
                 }
+            };
 
-                if val.is_instance(py.get_type::<pyo3::types::PyBool>())? {
-                    types_present.insert("Bool");
-                    value_enum_vals.push(Some(ValueEnum::Bool(val.extract()?)));
-                } else if val.is_instance(py.get_type::<pyo3::types::PyLong>())? {
-                    types_present.insert("Int");
-                    value_enum_vals.push(Some(ValueEnum::Int(val.extract()?)));
-                } else if val.is_instance(py.get_type::<pyo3::types::PyFloat>())? {
-                    types_present.insert("Float");
-                    value_enum_vals.push(Some(ValueEnum::Float(val.extract()?)));
-                } else if val.is_instance(py.get_type::<pyo3::types::PyString>())? {
-                    types_present.insert("Str");
-                    value_enum_vals.push(Some(ValueEnum::Str(val.extract()?)));
-                } else {
-                    let obj_id = val.as_ptr() as u64;
-                    py_objects.insert(obj_id, val.into());
-                    types_present.insert("PyObject");
-                    value_enum_vals.push(Some(ValueEnum::PyObjectId(obj_id)));
-                }
-            } else {
-                has_none = true;
-                value_enum_vals.push(None);
-            }
+            builder.push(Some(to_value(value, &mut py_objects)?));
         }
 
-        let final_col = if types_present.len() == 1 && !has_none {
-            match types_present.iter().next().unwrap().as_ref() {
-                "Int" => TinyColumn::Int(value_enum_vals.iter().map(|x| match x { Some(ValueEnum::Int(i)) => *i, _ => unreachable!() }).collect()),
-                "Float" => TinyColumn::Float(value_enum_vals.iter().map(|x| match x { Some(ValueEnum::Float(f)) => *f, _ => unreachable!() }).collect()),
-                "Bool" => TinyColumn::Bool(value_enum_vals.iter().map(|x| match x { Some(ValueEnum::Bool(b)) => *b, _ => unreachable!() }).collect()),
-                "Str" => TinyColumn::Str(value_enum_vals.iter().map(|x| match x { Some(ValueEnum::Str(s)) => s.clone(), _ => unreachable!() }).collect()),
-                "PyObject" => TinyColumn::PyObject(value_enum_vals.iter().map(|x| match x { Some(ValueEnum::PyObjectId(id)) => *id, _ => unreachable!() }).collect()),
-                _ => unreachable!(),
-            }
-        } else if types_present.len() == 1 && has_none {
-            match types_present.iter().next().unwrap().as_ref() {
-                "Int" => TinyColumn::OptInt(value_enum_vals.iter().map(|x| x.as_ref().and_then(|v| match v { ValueEnum::Int(i) => Some(*i), _ => None })).collect()),
-                "Float" => TinyColumn::OptFloat(value_enum_vals.iter().map(|x| x.as_ref().and_then(|v| match v { ValueEnum::Float(f) => Some(*f), _ => None })).collect()),
-                "Bool" => TinyColumn::OptBool(value_enum_vals.iter().map(|x| x.as_ref().and_then(|v| match v { ValueEnum::Bool(b) => Some(*b), _ => None })).collect()),
-                "Str" => TinyColumn::OptStr(value_enum_vals.iter().map(|x| x.as_ref().and_then(|v| match v { ValueEnum::Str(s) => Some(s.clone()), _ => None })).collect()),
-                "PyObject" => TinyColumn::OptPyObject(value_enum_vals.iter().map(|x| x.as_ref().and_then(|v| match v { ValueEnum::PyObjectId(id) => Some(*id), _ => None })).collect()),
-                _ => unreachable!(),
+        columns.insert(col, builder.finish(has_none, num_rows));
+    }
+
+    Ok(TinyFrame { columns, length: num_rows, py_objects })
+}
+
+pub fn from_arrays_impl(py: Python, arrays: &PyDict) -> PyResult<TinyFrame> {
+    if arrays.is_empty() {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Input dict is empty"));
+    }
+
+    let mut columns: HashMap<String, TinyColumn> = HashMap::with_capacity(arrays.len());
+    let mut py_objects: HashMap<u64, PyObject> = HashMap::new();
+    let mut length = None;
+
+    for (key, values) in arrays.iter() {
+        let col: String = key.extract()?;
+        let (column, num_rows) = array_to_column(py, values, &mut py_objects)?;
+
+        match length {
+            Some(expected) if expected != num_rows => {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Column '{}' has {} values, expected {}",
+                    col, num_rows, expected
+                )));
             }
+            _ => length = Some(num_rows),
+        }
+        columns.insert(col, column);
+    }
+
+    Ok(TinyFrame { columns, length: length.unwrap_or(0), py_objects })
+}
+
+// One column of `from_arrays` and its length. A one-dimensional buffer of
+// int64 or float64 items is copied as a block; anything else is read value
+// by value, through `tolist()` when it has one so NumPy scalars arrive as
+// Python ints, floats and bools.
+fn array_to_column(py: Python, values: &PyAny, py_objects: &mut HashMap<u64, PyObject>) -> PyResult<(TinyColumn, usize)> {
+    if let Ok(buffer) = PyBuffer::<i64>::get(values) {
+        if buffer.dimensions() == 1 {
+            let v = buffer.to_vec(py)?;
+            let num_rows = v.len();
+            return Ok((TinyColumn::Int(v), num_rows));
+        }
+    }
+    if let Ok(buffer) = PyBuffer::<f64>::get(values) {
+        if buffer.dimensions() == 1 {
+            let v = buffer.to_vec(py)?;
+            let num_rows = v.len();
+            return Ok((TinyColumn::Float(v), num_rows));
+        }
+    }
+
+    let values = if values.hasattr("tolist")? { values.call_method0("tolist")? } else { values };
+    let values: Vec<&PyAny> = values.extract()?;
+    let num_rows = values.len();
+    let mut builder = ColumnBuilder::Empty { nulls: 0, capacity: num_rows };
+    let mut has_none = false;
+
+    for value in &values {
+        if value.is_none() {
+            has_none = true;
+            builder.push(None);
         } else {
-            // If mixed and has None, use OptMixed
-            if has_none {
-                TinyColumn::OptMixed(value_enum_vals)
-            } else {
-                TinyColumn::Mixed(value_enum_vals.into_iter().map(|x| x.expect("Unexpected None in Mixed column")).collect())
+            builder.push(Some(to_value(value, py_objects)?));
+        }
+    }
+
+    Ok((builder.finish(has_none, num_rows), num_rows))
+}
+
+// Typed value of a non-null cell; anything other than a bool, int, float or
+// str is kept as a Python object
+fn to_value(value: &PyAny, py_objects: &mut HashMap<u64, PyObject>) -> PyResult<ValueEnum> {
+    // Bool is checked before int since bool is an int subclass
+    Ok(if value.is_instance_of::<PyBool>() {
+        ValueEnum::Bool(value.extract()?)
+    } else if value.is_instance_of::<PyLong>() {
+        ValueEnum::Int(value.extract()?)
+    } else if value.is_instance_of::<PyFloat>() {
+        ValueEnum::Float(value.extract()?)
+    } else if value.is_instance_of::<PyString>() {
+        ValueEnum::Str(value.extract()?)
+    } else {
+        let obj_id = value.as_ptr() as u64;
+        py_objects.insert(obj_id, value.into());
+        ValueEnum::PyObjectId(obj_id)
+    })
+}
+
+// Typed buffer for one column while records are read. It takes the type of
+// the first non-null value and falls back to Mixed when another type shows up,
+// so single-typed columns are filled directly without a ValueEnum pass.
+enum ColumnBuilder {
+    // Only nulls so far; `capacity` sizes the typed buffer once a value arrives
+    Empty { nulls: usize, capacity: usize },
+    Int(Vec<Option<i64>>),
+    Float(Vec<Option<f64>>),
+    Bool(Vec<Option<bool>>),
+    Str(Vec<Option<String>>),
+    PyObject(Vec<Option<u64>>),
+    Mixed(Vec<Option<ValueEnum>>),
+}
+
+impl ColumnBuilder {
+    fn push(&mut self, value: Option<ValueEnum>) {
+        match (&mut *self, value) {
+            (ColumnBuilder::Empty { nulls, .. }, None) => *nulls += 1,
+            (ColumnBuilder::Empty { nulls, capacity }, Some(value)) => {
+                let (nulls, capacity) = (*nulls, *capacity);
+                *self = match value {
+                    ValueEnum::Int(_) => ColumnBuilder::Int(null_buffer(nulls, capacity)),
+                    ValueEnum::Float(_) => ColumnBuilder::Float(null_buffer(nulls, capacity)),
+                    ValueEnum::Bool(_) => ColumnBuilder::Bool(null_buffer(nulls, capacity)),
+                    ValueEnum::Str(_) => ColumnBuilder::Str(null_buffer(nulls, capacity)),
+                    ValueEnum::PyObjectId(_) => ColumnBuilder::PyObject(null_buffer(nulls, capacity)),
+                };
+                self.push(Some(value));
+            }
+            (ColumnBuilder::Int(v), None) => v.push(None),
+            (ColumnBuilder::Float(v), None) => v.push(None),
+            (ColumnBuilder::Bool(v), None) => v.push(None),
+            (ColumnBuilder::Str(v), None) => v.push(None),
+            (ColumnBuilder::PyObject(v), None) => v.push(None),
+            (ColumnBuilder::Mixed(v), value) => v.push(value),
+            (ColumnBuilder::Int(v), Some(ValueEnum::Int(x))) => v.push(Some(x)),
+            (ColumnBuilder::Float(v), Some(ValueEnum::Float(x))) => v.push(Some(x)),
+            (ColumnBuilder::Bool(v), Some(ValueEnum::Bool(x))) => v.push(Some(x)),
+            (ColumnBuilder::Str(v), Some(ValueEnum::Str(x))) => v.push(Some(x)),
+            (ColumnBuilder::PyObject(v), Some(ValueEnum::PyObjectId(x))) => v.push(Some(x)),
+            (_, Some(value)) => {
+                let mut mixed = std::mem::replace(self, ColumnBuilder::Empty { nulls: 0, capacity: 0 }).into_mixed();
+                mixed.push(Some(value));
+                *self = ColumnBuilder::Mixed(mixed);
             }
-        };
+        }
+    }
 
-        columns.insert(col.clone(), final_col);
+    fn into_mixed(self) -> Vec<Option<ValueEnum>> {
+        match self {
+            ColumnBuilder::Empty { nulls, .. } => vec![None; nulls],
+            ColumnBuilder::Int(v) => v.into_iter().map(|x| x.map(ValueEnum::Int)).collect(),
+            ColumnBuilder::Float(v) => v.into_iter().map(|x| x.map(ValueEnum::Float)).collect(),
+            ColumnBuilder::Bool(v) => v.into_iter().map(|x| x.map(ValueEnum::Bool)).collect(),
+            ColumnBuilder::Str(v) => v.into_iter().map(|x| x.map(ValueEnum::Str)).collect(),
+            ColumnBuilder::PyObject(v) => v.into_iter().map(|x| x.map(ValueEnum::PyObjectId)).collect(),
+            ColumnBuilder::Mixed(v) => v,
+        }
     }
 
-    Ok(TinyFrame { columns, length: num_rows, py_objects })
+    // Columns without nulls drop the Option wrapper; an all-null column is OptMixed
+    fn finish(self, has_none: bool, num_rows: usize) -> TinyColumn {
+        match (self, has_none) {
+            (ColumnBuilder::Empty { .. }, _) => TinyColumn::OptMixed(vec![None; num_rows]),
+            (ColumnBuilder::Int(v), false) => TinyColumn::Int(v.into_iter().flatten().collect()),
+            (ColumnBuilder::Int(v), true) => TinyColumn::OptInt(v),
+            (ColumnBuilder::Float(v), false) => TinyColumn::Float(v.into_iter().flatten().collect()),
+            (ColumnBuilder::Float(v), true) => TinyColumn::OptFloat(v),
+            (ColumnBuilder::Bool(v), false) => TinyColumn::Bool(v.into_iter().flatten().collect()),
+            (ColumnBuilder::Bool(v), true) => TinyColumn::OptBool(v),
+            (ColumnBuilder::Str(v), false) => TinyColumn::Str(v.into_iter().flatten().collect()),
+            (ColumnBuilder::Str(v), true) => TinyColumn::OptStr(v),
+            (ColumnBuilder::PyObject(v), false) => TinyColumn::PyObject(v.into_iter().flatten().collect()),
+            (ColumnBuilder::PyObject(v), true) => TinyColumn::OptPyObject(v),
+            (ColumnBuilder::Mixed(v), false) => TinyColumn::Mixed(v.into_iter().flatten().collect()),
+            (ColumnBuilder::Mixed(v), true) => TinyColumn::OptMixed(v),
+        }
+    }
+}
+
+fn null_buffer<T: Clone>(nulls: usize, capacity: usize) -> Vec<Option<T>> {
+    let mut buffer = Vec::with_capacity(capacity.max(nulls));
+    buffer.resize(nulls, None);
+    buffer
+}
+
+/// Convert one column to a Python list in a single pass.
+pub fn column_to_list(frame: &TinyFrame, col: &TinyColumn, py: Python) -> Py<PyList> {
+    // Typed buffers convert straight into the new list, one object per
+    // value and None for each null, without an intermediate Vec<PyObject>
+    let py_object = |id: &u64| frame.py_objects.get(id).cloned().unwrap_or_else(|| py.None());
+    let list = match col {
+        TinyColumn::Int(v) => PyList::new(py, v),
+        TinyColumn::Float(v) => PyList::new(py, v),
+        TinyColumn::Str(v) => PyList::new(py, v),
+        TinyColumn::Bool(v) => PyList::new(py, v),
+        TinyColumn::OptInt(v) => PyList::new(py, v),
+        TinyColumn::OptFloat(v) => PyList::new(py, v),
+        TinyColumn::OptStr(v) => PyList::new(py, v),
+        TinyColumn::OptBool(v) => PyList::new(py, v),
+        TinyColumn::Mixed(v) => PyList::new(py, v.iter().map(|x| x.to_py(py, &frame.py_objects))),
+        TinyColumn::OptMixed(v) => PyList::new(py, v.iter().map(|x| x.as_ref().map_or(py.None(), |x| x.to_py(py, &frame.py_objects)))),
+        TinyColumn::PyObject(v) => PyList::new(py, v.iter().map(py_object)),
+        TinyColumn::OptPyObject(v) => PyList::new(py, v.iter().map(|x| x.as_ref().map_or(py.None(), py_object))),
+    };
+    list.into()
+}
+
+/// Convert the value in row `i` of `column` to a Python object.
+pub fn cell_to_py(frame: &TinyFrame, column: &TinyColumn, i: usize, py: Python) -> PyObject {
+    match column {
+        TinyColumn::Int(v) => v[i].into_py(py),
+        TinyColumn::Float(v) => v[i].into_py(py),
+        TinyColumn::Bool(v) => v[i].into_py(py),
+        TinyColumn::Str(v) => v[i].as_str().into_py(py),
+        TinyColumn::OptInt(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
+        TinyColumn::OptFloat(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
+        TinyColumn::OptBool(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
+        TinyColumn::OptStr(v) => v[i].as_deref().map_or(py.None(), |x| x.into_py(py)),
+        TinyColumn::PyObject(v) => {
+            let id = v[i];
+            frame.py_objects.get(&id).cloned().unwrap_or_else(|| py.None())
+        }
+        TinyColumn::OptPyObject(v) => match v[i] {
+            Some(id) => frame.py_objects.get(&id).cloned().unwrap_or_else(|| py.None()),
+            None => py.None(),
+        },
+        TinyColumn::Mixed(v) => match &v[i] {
+            ValueEnum::Int(x) => x.into_py(py),
+            ValueEnum::Float(x) => x.into_py(py),
+            ValueEnum::Bool(x) => x.into_py(py),
+            ValueEnum::Str(x) => x.as_str().into_py(py),
+            ValueEnum::PyObjectId(id) => frame.py_objects.get(id).cloned().unwrap_or_else(|| py.None()),
+        },
+        TinyColumn::OptMixed(v) => match &v[i] {
+            Some(ValueEnum::Int(x)) => x.into_py(py),
+            Some(ValueEnum::Float(x)) => x.into_py(py),
+            Some(ValueEnum::Bool(x)) => x.into_py(py),
+            Some(ValueEnum::Str(x)) => x.as_str().into_py(py),
+            Some(ValueEnum::PyObjectId(id)) => frame.py_objects.get(id).cloned().unwrap_or_else(|| py.None()),
+            None => py.None(),
+        },
+    }
 }
 
 pub fn to_dicts_impl(frame: &TinyFrame, py: Python) -> PyResult<Vec<PyObject>> {
-    let mut result = Vec::new();
+    // Intern the column names once; every row dict reuses the same key objects
+    let columns: Vec<(&PyString, &TinyColumn)> = frame
+        .columns
+        .iter()
+        .map(|(col_name, col_data)| (PyString::intern(py, col_name), col_data))
+        .collect();
+
+    let mut result = Vec::with_capacity(frame.length);
     for i in 0..frame.length {
         let dict = PyDict::new(py);
-        for (col_name, col_data) in &frame.columns {
-            let val = match col_data {
-                TinyColumn::Int(v) => v[i].into_py(py),
-                TinyColumn::Float(v) => v[i].into_py(py),
-                TinyColumn::Bool(v) => v[i].into_py(py),
-                TinyColumn::Str(v) => v[i].clone().into_py(py),
-                TinyColumn::OptInt(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
-                TinyColumn::OptFloat(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
-                TinyColumn::OptBool(v) => v[i].map_or(py.None(), |x| x.into_py(py)),
-                TinyColumn::OptStr(v) => v[i].clone().map_or(py.None(), |x| x.into_py(py)),
-                TinyColumn::PyObject(v) => {
-                    let id = v[i];
-                    frame.py_objects.get(&id).cloned().unwrap_or_else(|| py.None())
-                }
-                TinyColumn::OptPyObject(v) => match v[i] {
-                    Some(id) => frame.py_objects.get(&id).cloned().unwrap_or_else(|| py.None()),
-                    None => py.None(),
-                },
-                TinyColumn::Mixed(v) => match &v[i] {
-                    ValueEnum::Int(x) => x.into_py(py),
-                    ValueEnum::Float(x) => x.into_py(py),
-                    ValueEnum::Bool(x) => x.into_py(py),
-                    ValueEnum::Str(x) => x.clone().into_py(py),
-                    ValueEnum::PyObjectId(id) => frame.py_objects.get(id).cloned().unwrap_or_else(|| py.None()),
-                },
-                TinyColumn::OptMixed(v) => match &v[i] {
-                    Some(ValueEnum::Int(x)) => x.into_py(py),
-                    Some(ValueEnum::Float(x)) => x.into_py(py),
-                    Some(ValueEnum::Bool(x)) => x.into_py(py),
-                    Some(ValueEnum::Str(x)) => x.clone().into_py(py),
-                    Some(ValueEnum::PyObjectId(id)) => frame.py_objects.get(id).cloned().unwrap_or_else(|| py.None()),
-                    None => py.None(),
-                },
-            };
-            dict.set_item(col_name, val)?;
+        for &(col_name, col_data) in &columns {
+            dict.set_item(col_name, cell_to_py(frame, col_data, i, py))?;
         }
         result.push(dict.into());
     }
     Ok(result)
 }
+
+pub fn to_pandas_impl(frame: &TinyFrame, py: Python) -> PyResult<PyObject> {
+    // pandas is imported only here, so it stays an optional dependency
+    let pandas = py.import("pandas")?;
+
+    // One list per column; pandas builds each column from its list directly
+    let data = PyDict::new(py);
+    for (col_name, col_data) in &frame.columns {
+        data.set_item(col_name, column_to_list(frame, col_data, py))?;
+    }
+    Ok(pandas.getattr("DataFrame")?.call1((data,))?.into())
+}
@@ -0,0 +1,335 @@
+use pyo3::prelude::*;
+use std::ops::Range;
+use crate::frame::{TinyColumn, ValueEnum};
+
+/// Condition operators accepted by `TinyFrame.filter`.
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub enum FilterOp {
+    Eq,
+    Ne,
+    Gt,
+    Lt,
+    Ge,
+    Le,
+    In,
+    NotIn,
+}
+
+impl FilterOp {
+    pub fn parse(condition: &str) -> PyResult<Self> {
+        match condition {
+            "==" => Ok(FilterOp::Eq),
+            "!=" => Ok(FilterOp::Ne),
+            ">" => Ok(FilterOp::Gt),
+            "<" => Ok(FilterOp::Lt),
+            ">=" => Ok(FilterOp::Ge),
+            "<=" => Ok(FilterOp::Le),
+            "in" => Ok(FilterOp::In),
+            "not_in" => Ok(FilterOp::NotIn),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                format!("Unknown condition: {}", condition)
+            )),
+        }
+    }
+}
+
+/// Return the indices of the rows in `column` matching `op value`.
+///
+/// The operator and column type are resolved once, and each combination runs
+/// its own monomorphized loop over the typed buffer. Null rows never match.
+pub fn matching_indices(column: &TinyColumn, op: FilterOp, value: &PyAny) -> PyResult<Vec<usize>> {
+    // Against None only the negated operators match, and then exactly the
+    // valid rows, so the column's validity mask is the whole answer
+    if value.is_none() {
+        return Ok(match op {
+            FilterOp::Ne | FilterOp::NotIn => non_null_indices(column),
+            _ => Vec::new(),
+        });
+    }
+
+    // Nothing can match an all-null column, so the value is not extracted
+    if !has_non_null(column) {
+        return Ok(Vec::new());
+    }
+
+    match column {
+        TinyColumn::Int(_) | TinyColumn::Float(_) | TinyColumn::OptInt(_) | TinyColumn::OptFloat(_) => {
+            match op {
+                FilterOp::In => Ok(Vec::new()),
+                FilterOp::NotIn => Ok(numeric_scan(column, 0, |_| true)),
+                _ => {
+                    let rhs = value.extract::<f64>()?;
+                    // On non-null columns, rows up to the first inversion come
+                    // from a binary search and the scan covers the rows after
+                    // them. Both use the same comparison: integer columns
+                    // against the integer bound, float columns in f64.
+                    match (column, integer_comparison(op, rhs)) {
+                        (TinyColumn::Int(v), Some((op, rhs))) => {
+                            let (sorted, start) = ascending_prefix_range(v, op, rhs);
+                            Ok(prepend_range(sorted, int_indices(column, op, rhs, start)))
+                        }
+                        (TinyColumn::OptInt(_), Some((op, rhs))) => Ok(int_indices(column, op, rhs, 0)),
+                        (TinyColumn::Float(v), _) if !rhs.is_nan() => {
+                            let (sorted, start) = ascending_prefix_range(v, op, rhs);
+                            Ok(prepend_range(sorted, numeric_indices(column, op, rhs, start)))
+                        }
+                        _ => Ok(numeric_indices(column, op, rhs, 0)),
+                    }
+                }
+            }
+        }
+        TinyColumn::Str(_) | TinyColumn::OptStr(_) => {
+            match op {
+                FilterOp::Gt | FilterOp::Lt | FilterOp::Ge | FilterOp::Le => Ok(Vec::new()),
+                _ => {
+                    let rhs: String = value.extract()?;
+                    Ok(string_indices(column, op, &rhs))
+                }
+            }
+        }
+        TinyColumn::Mixed(v) => {
+            let mut indices = Vec::new();
+            for (idx, val) in v.iter().enumerate() {
+                if mixed_matches(val, op, value)? {
+                    indices.push(idx);
+                }
+            }
+            Ok(indices)
+        }
+        TinyColumn::OptMixed(v) => {
+            let mut indices = Vec::new();
+            for (idx, val) in v.iter().enumerate() {
+                if let Some(val) = val {
+                    if mixed_matches(val, op, value)? {
+                        indices.push(idx);
+                    }
+                }
+            }
+            Ok(indices)
+        }
+        // Bool and PyObject values only pass the 'not_in' check
+        TinyColumn::Bool(v) => Ok(if op == FilterOp::NotIn { scan(v, |_| true) } else { Vec::new() }),
+        TinyColumn::OptBool(v) => Ok(if op == FilterOp::NotIn { scan_opt(v, |_| true) } else { Vec::new() }),
+        TinyColumn::PyObject(v) => Ok(if op == FilterOp::NotIn { scan(v, |_| true) } else { Vec::new() }),
+        TinyColumn::OptPyObject(v) => Ok(if op == FilterOp::NotIn { scan_opt(v, |_| true) } else { Vec::new() }),
+    }
+}
+
+/// Resolve a comparison over the leading ascending run of `values` with two
+/// binary searches; the matching rows of the run form one contiguous range.
+/// Returns that range and the run's length, the first row still to be
+/// scanned. Only `==`, `<`, `<=`, `>` and `>=` use a run; other operators get
+/// an empty one and are scanned in full.
+fn ascending_prefix_range<T: Copy + PartialOrd>(values: &[T], op: FilterOp, rhs: T) -> (Range<usize>, usize) {
+    if !matches!(op, FilterOp::Eq | FilterOp::Lt | FilterOp::Le | FilterOp::Gt | FilterOp::Ge) {
+        return (0..0, 0);
+    }
+    // Finding the run is a linear pass, but it stops at the first inversion,
+    // so on unsorted columns it is short and nearly every row goes to the scan
+    let len = values.windows(2).position(|w| !(w[0] <= w[1])).map_or(values.len(), |i| i + 1);
+    let run = &values[..len];
+    let below = run.partition_point(|&x| x < rhs);
+    let at_or_below = run.partition_point(|&x| x <= rhs);
+    let matched = match op {
+        FilterOp::Eq => below..at_or_below,
+        FilterOp::Gt => at_or_below..len,
+        FilterOp::Ge => below..len,
+        FilterOp::Lt => 0..below,
+        FilterOp::Le => 0..at_or_below,
+        _ => 0..0,
+    };
+    (matched, len)
+}
+
+/// Put the rows of `sorted`, all before those of `rest`, in front of them
+fn prepend_range(sorted: Range<usize>, rest: Vec<usize>) -> Vec<usize> {
+    if sorted.is_empty() {
+        return rest;
+    }
+    let mut indices = Vec::with_capacity(sorted.len() + rest.len());
+    indices.extend(sorted);
+    indices.extend(rest);
+    indices
+}
+
+fn numeric_indices(column: &TinyColumn, op: FilterOp, rhs: f64, start: usize) -> Vec<usize> {
+    match op {
+        FilterOp::Eq => numeric_scan(column, start, move |x| x == rhs),
+        FilterOp::Ne => numeric_scan(column, start, move |x| x != rhs),
+        FilterOp::Gt => numeric_scan(column, start, move |x| x > rhs),
+        FilterOp::Lt => numeric_scan(column, start, move |x| x < rhs),
+        FilterOp::Ge => numeric_scan(column, start, move |x| x >= rhs),
+        FilterOp::Le => numeric_scan(column, start, move |x| x <= rhs),
+        FilterOp::In => Vec::new(),
+        FilterOp::NotIn => numeric_scan(column, start, |_| true),
+    }
+}
+
+/// Rewrite a comparison against a float constant as an equivalent one against
+/// an integer constant, so integer columns compare natively instead of
+/// converting every row. A fractional bound is rounded toward the rows it
+/// admits (`> 27.5` becomes `>= 28`). Returns `None` when no exact integer
+/// form exists, such as equality with a fractional value or a bound outside
+/// the i64 range.
+fn integer_comparison(op: FilterOp, rhs: f64) -> Option<(FilterOp, i64)> {
+    let bound = match op {
+        FilterOp::Eq | FilterOp::Ne if rhs.fract() == 0.0 => (op, rhs),
+        FilterOp::Gt | FilterOp::Ge if rhs.fract() != 0.0 => (FilterOp::Ge, rhs.ceil()),
+        FilterOp::Lt | FilterOp::Le if rhs.fract() != 0.0 => (FilterOp::Le, rhs.floor()),
+        FilterOp::Gt | FilterOp::Ge | FilterOp::Lt | FilterOp::Le => (op, rhs),
+        _ => return None,
+    };
+    // Also rejects NaN and the infinities
+    if bound.1 >= -9_223_372_036_854_775_808.0 && bound.1 < 9_223_372_036_854_775_808.0 {
+        Some((bound.0, bound.1 as i64))
+    } else {
+        None
+    }
+}
+
+fn int_indices(column: &TinyColumn, op: FilterOp, rhs: i64, start: usize) -> Vec<usize> {
+    match op {
+        FilterOp::Eq => int_scan(column, start, move |x| x == rhs),
+        FilterOp::Ne => int_scan(column, start, move |x| x != rhs),
+        FilterOp::Gt => int_scan(column, start, move |x| x > rhs),
+        FilterOp::Lt => int_scan(column, start, move |x| x < rhs),
+        FilterOp::Ge => int_scan(column, start, move |x| x >= rhs),
+        FilterOp::Le => int_scan(column, start, move |x| x <= rhs),
+        FilterOp::In => Vec::new(),
+        FilterOp::NotIn => int_scan(column, start, |_| true),
+    }
+}
+
+// Scans skip the rows before `start`
+fn int_scan<F: Fn(i64) -> bool>(column: &TinyColumn, start: usize, pred: F) -> Vec<usize> {
+    match column {
+        TinyColumn::Int(v) => scan_from(v, start, |&x| pred(x)),
+        TinyColumn::OptInt(v) => scan_opt_from(v, start, |&x| pred(x)),
+        _ => Vec::new(),
+    }
+}
+
+fn numeric_scan<F: Fn(f64) -> bool>(column: &TinyColumn, start: usize, pred: F) -> Vec<usize> {
+    match column {
+        TinyColumn::Int(v) => scan_from(v, start, |&x| pred(x as f64)),
+        TinyColumn::Float(v) => scan_from(v, start, |&x| pred(x)),
+        TinyColumn::OptInt(v) => scan_opt_from(v, start, |&x| pred(x as f64)),
+        TinyColumn::OptFloat(v) => scan_opt_from(v, start, |&x| pred(x)),
+        _ => Vec::new(),
+    }
+}
+
+fn string_indices(column: &TinyColumn, op: FilterOp, rhs: &str) -> Vec<usize> {
+    let pred = |s: &String| match op {
+        FilterOp::Eq | FilterOp::In => s == rhs,
+        FilterOp::Ne | FilterOp::NotIn => s != rhs,
+        _ => false,
+    };
+    match column {
+        TinyColumn::Str(v) => scan(v, pred),
+        TinyColumn::OptStr(v) => scan_opt(v, pred),
+        _ => Vec::new(),
+    }
+}
+
+fn mixed_matches(val: &ValueEnum, op: FilterOp, value: &PyAny) -> PyResult<bool> {
+    match val {
+        ValueEnum::Int(i) => numeric_matches(*i as f64, op, value),
+        ValueEnum::Float(f) => numeric_matches(*f, op, value),
+        ValueEnum::Str(s) => Ok(match op {
+            FilterOp::Eq | FilterOp::In => *s == value.extract::<String>()?,
+            FilterOp::Ne | FilterOp::NotIn => *s != value.extract::<String>()?,
+            _ => false,
+        }),
+        ValueEnum::Bool(_) | ValueEnum::PyObjectId(_) => Ok(op == FilterOp::NotIn),
+    }
+}
+
+fn numeric_matches(x: f64, op: FilterOp, value: &PyAny) -> PyResult<bool> {
+    Ok(match op {
+        FilterOp::In => false,
+        FilterOp::NotIn => true,
+        FilterOp::Eq => x == value.extract::<f64>()?,
+        FilterOp::Ne => x != value.extract::<f64>()?,
+        FilterOp::Gt => x > value.extract::<f64>()?,
+        FilterOp::Lt => x < value.extract::<f64>()?,
+        FilterOp::Ge => x >= value.extract::<f64>()?,
+        FilterOp::Le => x <= value.extract::<f64>()?,
+    })
+}
+
+/// Return the indices of the non-null rows in `column`.
+pub fn non_null_indices(column: &TinyColumn) -> Vec<usize> {
+    match column {
+        TinyColumn::OptInt(v) => scan_opt(v, |_| true),
+        TinyColumn::OptFloat(v) => scan_opt(v, |_| true),
+        TinyColumn::OptStr(v) => scan_opt(v, |_| true),
+        TinyColumn::OptBool(v) => scan_opt(v, |_| true),
+        TinyColumn::OptMixed(v) => scan_opt(v, |_| true),
+        TinyColumn::OptPyObject(v) => scan_opt(v, |_| true),
+        other => (0..other.len()).collect(),
+    }
+}
+
+#[inline]
+fn scan<T, F: Fn(&T) -> bool>(values: &[T], pred: F) -> Vec<usize> {
+    scan_from(values, 0, pred)
+}
+
+#[inline]
+fn scan_opt<T, F: Fn(&T) -> bool>(values: &[Option<T>], pred: F) -> Vec<usize> {
+    scan_opt_from(values, 0, pred)
+}
+
+#[inline]
+fn scan_from<T, F: Fn(&T) -> bool>(values: &[T], start: usize, pred: F) -> Vec<usize> {
+    mask_indices(&mask(&values[start..], pred), start)
+}
+
+#[inline]
+fn scan_opt_from<T, F: Fn(&T) -> bool>(values: &[Option<T>], start: usize, pred: F) -> Vec<usize> {
+    mask_indices(&mask(&values[start..], |v| v.as_ref().map_or(false, |v| pred(v))), start)
+}
+
+/// Pack `pred` over `values` into a bitmap, 64 rows per word.
+///
+/// The inner loop has no branches, so for numeric columns the compiler turns
+/// it into vector compares and movemask instead of a per-row jump.
+fn mask<T, F: Fn(&T) -> bool>(values: &[T], pred: F) -> Vec<u64> {
+    let mut words = Vec::with_capacity((values.len() + 63) / 64);
+    for chunk in values.chunks(64) {
+        let mut word = 0u64;
+        for (bit, v) in chunk.iter().enumerate() {
+            word |= (pred(v) as u64) << bit;
+        }
+        words.push(word);
+    }
+    words
+}
+
+/// Expand a bitmap produced by `mask` into row indices, bit 0 of the first
+/// word being row `offset`.
+fn mask_indices(words: &[u64], offset: usize) -> Vec<usize> {
+    let count = words.iter().map(|w| w.count_ones() as usize).sum();
+    let mut indices = Vec::with_capacity(count);
+    for (i, &word) in words.iter().enumerate() {
+        let mut word = word;
+        while word != 0 {
+            indices.push(offset + i * 64 + word.trailing_zeros() as usize);
+            word &= word - 1;
+        }
+    }
+    indices
+}
+
+fn has_non_null(column: &TinyColumn) -> bool {
+    match column {
+        TinyColumn::OptInt(v) => v.iter().any(Option::is_some),
+        TinyColumn::OptFloat(v) => v.iter().any(Option::is_some),
+        TinyColumn::OptStr(v) => v.iter().any(Option::is_some),
+        TinyColumn::OptBool(v) => v.iter().any(Option::is_some),
+        TinyColumn::OptMixed(v) => v.iter().any(Option::is_some),
+        TinyColumn::OptPyObject(v) => v.iter().any(Option::is_some),
+        other => other.len() > 0,
+    }
+}
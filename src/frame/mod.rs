@@ -1,4 +1,5 @@
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
 use std::collections::HashMap;
 use crate::frame::iter::TinyFrameRowIter;
 use crate::column::TinyCol;
@@ -9,9 +10,11 @@ pub mod cast;
 pub mod convert;
 pub mod edit;
 pub mod fillna;
+pub mod filter;
 pub mod iter;
 pub mod lazy;
 pub mod optimize;
+pub mod sort;
 pub mod string_optimize;
 
 #[derive(Clone, Debug, PartialEq)]
@@ -124,6 +127,23 @@ impl TinyFrame {
         convert::from_dicts_impl(py, records)
     }
 
+    /// Create a TinyFrame from a dict of column name to values.
+    ///
+    /// One-dimensional int64 and float64 buffers, such as NumPy arrays, are
+    /// copied in one block without a Python object per value. Other arrays
+    /// and sequences are read value by value like `from_dicts`.
+    ///
+    /// Args:
+    ///     columns (dict): Column name to array or sequence, all the same length.
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with one column per entry.
+    #[staticmethod]
+    #[pyo3(text_signature = "(columns)")]
+    pub fn from_arrays(py: Python, columns: &PyDict) -> PyResult<Self> {
+        convert::from_arrays_impl(py, columns)
+    }
+
     /// Convert the TinyFrame to a list of dictionaries.
     ///
     /// Returns:
@@ -132,6 +152,17 @@ impl TinyFrame {
         convert::to_dicts_impl(self, py)
     }
 
+    /// Convert the TinyFrame to a pandas DataFrame.
+    ///
+    /// Each column is handed to pandas as one list, without a dict per row.
+    /// Requires pandas to be installed.
+    ///
+    /// Returns:
+    ///     pandas.DataFrame: Frame data as a DataFrame.
+    fn to_pandas(&self, py: Python) -> PyResult<PyObject> {
+        convert::to_pandas_impl(self, py)
+    }
+
     /// Fill missing (None) values in the frame.
     ///
     /// Args:
@@ -200,42 +231,13 @@ impl TinyFrame {
     ///
     /// Returns:
     ///     TinyFrame: New frame with filtered rows.
-    fn filter(&self, py: Python, column: String, condition: String, value: &PyAny) -> PyResult<Self> {
+    fn filter(&self, column: String, condition: String, value: &PyAny) -> PyResult<Self> {
         let col = self.columns.get(&column).ok_or_else(|| {
             PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column))
         })?;
 
-        let mut filtered_indices = Vec::new();
-        
-        for (idx, val) in col.iter().enumerate() {
-            let matches = match condition.as_str() {
-                "==" => {
-                    match val {
-                        ValueEnum::Str(_) => self.compare_string_values(&val, value, py, "==")?,
-                        _ => self.compare_values(&val, value, py, |a, b| a == b)?,
-                    }
-                }
-                "!=" => {
-                    match val {
-                        ValueEnum::Str(_) => self.compare_string_values(&val, value, py, "!=")?,
-                        _ => self.compare_values(&val, value, py, |a, b| a != b)?,
-                    }
-                }
-                ">" => self.compare_values(&val, value, py, |a, b| a > b)?,
-                "<" => self.compare_values(&val, value, py, |a, b| a < b)?,
-                ">=" => self.compare_values(&val, value, py, |a, b| a >= b)?,
-                "<=" => self.compare_values(&val, value, py, |a, b| a <= b)?,
-                "in" => self.check_in_values(&val, value, py)?,
-                "not_in" => !self.check_in_values(&val, value, py)?,
-                _ => return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    format!("Unknown condition: {}", condition)
-                )),
-            };
-            
-            if matches {
-                filtered_indices.push(idx);
-            }
-        }
+        let op = filter::FilterOp::parse(&condition)?;
+        let filtered_indices = filter::matching_indices(col, op, value)?;
 
         self.filter_by_indices(filtered_indices)
     }
@@ -252,23 +254,7 @@ impl TinyFrame {
             PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column))
         })?;
 
-        let mut filtered_indices = Vec::new();
-        
-        for idx in 0..self.length {
-            let is_not_null = match col {
-                TinyColumn::OptInt(v) => v[idx].is_some(),
-                TinyColumn::OptFloat(v) => v[idx].is_some(),
-                TinyColumn::OptStr(v) => v[idx].is_some(),
-                TinyColumn::OptBool(v) => v[idx].is_some(),
-                TinyColumn::OptMixed(v) => v[idx].is_some(),
-                TinyColumn::OptPyObject(v) => v[idx].is_some(),
-                _ => true, // Non-optional columns are never null
-            };
-            
-            if is_not_null {
-                filtered_indices.push(idx);
-            }
-        }
+        let filtered_indices = filter::non_null_indices(col);
 
         self.filter_by_indices(filtered_indices)
     }
@@ -299,6 +285,19 @@ impl TinyFrame {
         }
         
         let mut indices: Vec<usize> = (0..self.length).collect();
+
+        // Numeric keys are radix sorted, last key first; stable passes give the
+        // same order as the lexicographic comparison below
+        let numeric_keys: Option<Vec<Vec<Option<u64>>>> = by
+            .iter()
+            .map(|col_name| sort::numeric_sort_keys(&self.columns[col_name], ascending))
+            .collect();
+        if let Some(numeric_keys) = numeric_keys {
+            for keys in numeric_keys.iter().rev() {
+                sort::radix_sort_indices(&mut indices, keys, !ascending);
+            }
+            return self.filter_by_indices(indices);
+        }
         
         // Sort by multiple columns (stable sort)
         indices.sort_by(|&a, &b| {
@@ -363,25 +362,21 @@ impl TinyFrame {
         self.columns.keys().cloned().collect()
     }
 
+    /// Get column names with their types.
+    ///
+    /// Returns:
+    ///     List[Tuple[str, str]]: (name, type) pairs in the order of `columns`,
+    ///     with types named as by `TinyCol.type_str`.
+    #[getter]
+    pub fn schema(&self) -> Vec<(String, &'static str)> {
+        self.columns.iter().map(|(name, col)| (name.clone(), col.type_str())).collect()
+    }
+
     /// Return string representation of the frame.
     fn __repr__(&self) -> String {
         let mut col_strs = Vec::new();
         for (name, col) in &self.columns {
-            let type_str = match col {
-                TinyColumn::Int(_) => "Int",
-                TinyColumn::Float(_) => "Float",
-                TinyColumn::Str(_) => "Str",
-                TinyColumn::Bool(_) => "Bool",
-                TinyColumn::OptInt(_) => "OptInt",
-                TinyColumn::OptFloat(_) => "OptFloat",
-                TinyColumn::OptStr(_) => "OptStr",
-                TinyColumn::OptBool(_) => "OptBool",
-                TinyColumn::Mixed(_) => "Mixed",
-                TinyColumn::OptMixed(_) => "OptMixed",
-                TinyColumn::PyObject(_) => "PyObject",
-                TinyColumn::OptPyObject(_) => "OptPyObject",
-            };
-            col_strs.push(format!("'{}': '{}'", name, type_str));
+            col_strs.push(format!("'{}': '{}'", name, col.type_str()));
         }
         format!(
             "TinyFrame(rows={}, columns={}, cols={{ {} }})",
@@ -393,20 +388,47 @@ impl TinyFrame {
 
     /// Iterate over rows as dictionaries.
     fn __iter__(slf: PyRef<Self>) -> PyResult<crate::frame::iter::TinyFrameRowIter> {
-        Ok(crate::frame::iter::TinyFrameRowIter::new(slf.into()))
+        Ok(crate::frame::iter::TinyFrameRowIter::new(slf.py(), slf.into()))
     }
 
-    fn col(&self, py: Python, name: String) -> PyResult<Py<TinyCol>> {
-        if !self.columns.contains_key(&name) {
-            return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", name)));
-        }
+    /// Get the values of a single column as a list.
+    ///
+    /// Converts the column directly, without building a dict per row.
+    ///
+    /// Args:
+    ///     name (str): Column name.
+    ///
+    /// Returns:
+    ///     List: Column values, with None for nulls.
+    fn column(&self, py: Python, name: &str) -> PyResult<Py<PyList>> {
+        let col = self.columns.get(name)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", name)))?;
+        Ok(convert::column_to_list(self, col, py))
+    }
 
-        let frame_clone = self.clone();
-        let py_frame = Py::new(py, frame_clone)?;
+    /// Get a handle to a single column.
+    ///
+    /// The handle holds a copy of the column as it is now, so later in-place
+    /// changes to this frame (fillna, cast_column, drop_columns, ...) do not
+    /// show through it. Only this column is copied, not the whole frame.
+    ///
+    /// Args:
+    ///     name (str): Column name.
+    ///
+    /// Returns:
+    ///     TinyCol: Column handle supporting iteration and `to_list()`.
+    fn col(&self, py: Python, name: String) -> PyResult<Py<TinyCol>> {
+        let column = self.columns.get(&name)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", name)))?;
 
+        let snapshot = TinyFrame {
+            columns: HashMap::from([(name.clone(), column.clone())]),
+            length: self.length,
+            py_objects: self.py_objects.clone(),
+        };
         let col = TinyCol {
             name,
-            frame: py_frame,
+            frame: Py::new(py, snapshot)?,
         };
         Py::new(py, col)
     }
@@ -417,11 +439,18 @@ impl TinyFrame {
     ///     other: The other TinyFrame to join with
     ///     left_on: List of column names from this frame to join on
     ///     right_on: List of column names from the other frame to join on
+    ///     strategy (str): "hash", "sort_merge" or "auto" (default). Sort-merge
+    ///         applies to a single integer or string key and returns rows in key
+    ///         order; "auto" uses it only when both frames are already sorted on
+    ///         the key. Other keys always use the hash join, which builds its
+    ///         table on the smaller frame; rows come out in this frame's order
+    ///         either way.
     ///
     /// Returns:
     ///     TinyFrame: The result of the inner join
-    pub fn inner_join(&self, other: &TinyFrame, left_on: Vec<String>, right_on: Vec<String>) -> PyResult<Self> {
-        crate::joins::JoinOps::inner_join(self, other, left_on, right_on)
+    pub fn inner_join(&self, other: &TinyFrame, left_on: Vec<String>, right_on: Vec<String>, strategy: Option<&str>) -> PyResult<Self> {
+        let strategy = crate::joins::JoinStrategy::parse(strategy.unwrap_or("auto"))?;
+        crate::joins::JoinOps::inner_join(self, other, left_on, right_on, strategy)
     }
 
     /// Left join with another TinyFrame.
@@ -713,6 +742,21 @@ impl TinyFrame {
         crate::window::WindowOps::rolling_mean_impl(self, &column, window)
     }
 
+    /// Calculate rolling means for several numeric columns
+    ///
+    /// Each column is computed independently, in parallel on large frames.
+    ///
+    /// Args:
+    ///     columns: Column names containing numeric data
+    ///     window_size: Size of the rolling window
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with a rolling mean column added per column
+    pub fn rolling_mean_many(&self, columns: Vec<String>, window_size: usize) -> PyResult<Self> {
+        let window = crate::window::RollingWindow::new(window_size);
+        crate::window::WindowOps::rolling_mean_many_impl(self, &columns, window)
+    }
+
     /// Calculate rolling sum for a numeric column
     ///
     /// Args:
@@ -763,6 +807,32 @@ impl TinyFrame {
         crate::window::WindowOps::expanding_sum_impl(self, &column, window)
     }
 
+    /// Start a plan of several window ops over one column, run together
+    ///
+    /// Ops added with `rolling_mean(window_size)`, `rolling_sum(window_size)`,
+    /// `rolling_std(window_size)`, `expanding_mean()` and `expanding_sum()`
+    /// are all computed in one pass over the column when `run()` is called,
+    /// adding the same columns as the matching frame methods. The plan works
+    /// on a copy of this frame taken now, so later in-place changes to the
+    /// frame do not affect it.
+    ///
+    /// Args:
+    ///     column: Column name containing numeric data
+    ///
+    /// Returns:
+    ///     TinyWindowPlan: Plan builder over a copy of this frame
+    pub fn window(&self, column: String) -> PyResult<crate::window::TinyWindowPlan> {
+        if !self.columns.contains_key(&column) {
+            return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column)));
+        }
+
+        Ok(crate::window::TinyWindowPlan {
+            frame: self.clone(),
+            column,
+            ops: Vec::new(),
+        })
+    }
+
     /// Calculate ranks for a numeric column
     ///
     /// Args:
@@ -772,19 +842,30 @@ impl TinyFrame {
     /// Returns:
     ///     TinyFrame: New frame with rank column added
     pub fn rank(&self, column: String, method: String) -> PyResult<Self> {
-        let rank_method = match method.as_str() {
-            "average" => crate::ranking::RankMethod::Average,
-            "min" => crate::ranking::RankMethod::Min,
-            "max" => crate::ranking::RankMethod::Max,
-            "first" => crate::ranking::RankMethod::First,
-            "dense" => crate::ranking::RankMethod::Dense,
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                "Invalid ranking method. Must be one of: average, min, max, first, dense"
-            )),
-        };
+        let rank_method = crate::ranking::RankMethod::parse(&method)?;
         crate::ranking::RankingOps::rank_impl(self, &column, rank_method)
     }
 
+    /// Calculate ranks for one column and percentage change for another
+    ///
+    /// Gives the same frame as `rank(column, method).pct_change(pct_column)`,
+    /// but copies the frame once instead of once per step. `pct_column` may
+    /// name the rank column being added, e.g. "value_rank".
+    ///
+    /// Args:
+    ///     column: Column name containing numeric data to rank
+    ///     method: Ranking method ("average", "min", "max", "first", "dense")
+    ///     pct_column: Column for the percentage change, defaults to `column`
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with rank and percentage change columns added
+    #[pyo3(signature = (column, method, pct_column=None))]
+    pub fn rank_pct_change(&self, column: String, method: String, pct_column: Option<String>) -> PyResult<Self> {
+        let rank_method = crate::ranking::RankMethod::parse(&method)?;
+        let pct_column = pct_column.unwrap_or_else(|| column.clone());
+        crate::ranking::RankingOps::rank_pct_change_impl(self, &column, rank_method, &pct_column)
+    }
+
     /// Calculate percentage change for a numeric column
     ///
     /// Args:
@@ -889,6 +970,30 @@ impl TinyFrame {
         crate::string::StringOps::str_cat_impl(self, &column, &separator)
     }
 
+    /// Start a fused chain of string operations on a column
+    ///
+    /// Steps added with `strip()`, `lower()`, `upper()` and `replace(from, to)`
+    /// run together in one pass per row when `finish(output)` is called.
+    /// The pipeline holds its own copy of the frame, so edits made to this
+    /// frame afterwards are not seen by `finish`.
+    ///
+    /// Args:
+    ///     column: Column name containing string data
+    ///
+    /// Returns:
+    ///     TinyStringPipeline: Pipeline builder over the column
+    pub fn str_pipe(&self, column: String) -> PyResult<crate::string::TinyStringPipeline> {
+        if !self.columns.contains_key(&column) {
+            return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column)));
+        }
+
+        Ok(crate::string::TinyStringPipeline {
+            frame: self.clone(),
+            column,
+            steps: Vec::new(),
+        })
+    }
+
     /// Validate that all values in a column are not null
     ///
     /// Args:
@@ -936,6 +1041,25 @@ impl TinyFrame {
         crate::validation::ValidationOps::validate_unique_impl(self, &column)
     }
 
+    /// Start a plan of several validations run together
+    ///
+    /// Checks added with `not_null(column)`, `range(column, min, max)`,
+    /// `pattern(column, pattern)` and `unique(column)` are evaluated in order
+    /// when `run()` is called, adding the same columns as the matching
+    /// `validate_*` methods to one new frame. Each check's column must exist
+    /// in this frame or be added by an earlier check, and is checked as the
+    /// check is added. The checks run against a copy of this frame as it is
+    /// when `validate()` is called.
+    ///
+    /// Returns:
+    ///     TinyValidationPlan: Plan builder over a copy of this frame
+    pub fn validate(&self) -> crate::validation::TinyValidationPlan {
+        crate::validation::TinyValidationPlan {
+            frame: self.clone(),
+            checks: Vec::new(),
+        }
+    }
+
     /// Get validation summary for a column
     ///
     /// Args:
@@ -953,57 +1077,25 @@ impl TinyFrame {
     // Helper methods for filtering and sorting
     fn filter_by_indices(&self, indices: Vec<usize>) -> PyResult<Self> {
         let mut new_columns: HashMap<String, TinyColumn> = HashMap::new();
+
+        // Ascending selections (filter, dropna) are copied as contiguous runs
+        let runs = if indices.windows(2).all(|w| w[0] < w[1]) { Some(index_runs(&indices)) } else { None };
+        let runs = runs.as_deref();
         
         for (name, column) in &self.columns {
             let new_column = match column {
-                TinyColumn::Int(v) => {
-                    let new_v: Vec<i64> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::Int(new_v)
-                }
-                TinyColumn::Float(v) => {
-                    let new_v: Vec<f64> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::Float(new_v)
-                }
-                TinyColumn::Str(v) => {
-                    let new_v: Vec<String> = indices.iter().map(|&i| v[i].clone()).collect();
-                    TinyColumn::Str(new_v)
-                }
-                TinyColumn::Bool(v) => {
-                    let new_v: Vec<bool> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::Bool(new_v)
-                }
-                TinyColumn::OptInt(v) => {
-                    let new_v: Vec<Option<i64>> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::OptInt(new_v)
-                }
-                TinyColumn::OptFloat(v) => {
-                    let new_v: Vec<Option<f64>> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::OptFloat(new_v)
-                }
-                TinyColumn::OptStr(v) => {
-                    let new_v: Vec<Option<String>> = indices.iter().map(|&i| v[i].clone()).collect();
-                    TinyColumn::OptStr(new_v)
-                }
-                TinyColumn::OptBool(v) => {
-                    let new_v: Vec<Option<bool>> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::OptBool(new_v)
-                }
-                TinyColumn::Mixed(v) => {
-                    let new_v: Vec<ValueEnum> = indices.iter().map(|&i| v[i].clone()).collect();
-                    TinyColumn::Mixed(new_v)
-                }
-                TinyColumn::OptMixed(v) => {
-                    let new_v: Vec<Option<ValueEnum>> = indices.iter().map(|&i| v[i].clone()).collect();
-                    TinyColumn::OptMixed(new_v)
-                }
-                TinyColumn::PyObject(v) => {
-                    let new_v: Vec<u64> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::PyObject(new_v)
-                }
-                TinyColumn::OptPyObject(v) => {
-                    let new_v: Vec<Option<u64>> = indices.iter().map(|&i| v[i]).collect();
-                    TinyColumn::OptPyObject(new_v)
-                }
+                TinyColumn::Int(v) => TinyColumn::Int(gather(v, &indices, runs)),
+                TinyColumn::Float(v) => TinyColumn::Float(gather(v, &indices, runs)),
+                TinyColumn::Str(v) => TinyColumn::Str(gather(v, &indices, runs)),
+                TinyColumn::Bool(v) => TinyColumn::Bool(gather(v, &indices, runs)),
+                TinyColumn::OptInt(v) => TinyColumn::OptInt(gather(v, &indices, runs)),
+                TinyColumn::OptFloat(v) => TinyColumn::OptFloat(gather(v, &indices, runs)),
+                TinyColumn::OptStr(v) => TinyColumn::OptStr(gather(v, &indices, runs)),
+                TinyColumn::OptBool(v) => TinyColumn::OptBool(gather(v, &indices, runs)),
+                TinyColumn::Mixed(v) => TinyColumn::Mixed(gather(v, &indices, runs)),
+                TinyColumn::OptMixed(v) => TinyColumn::OptMixed(gather(v, &indices, runs)),
+                TinyColumn::PyObject(v) => TinyColumn::PyObject(gather(v, &indices, runs)),
+                TinyColumn::OptPyObject(v) => TinyColumn::OptPyObject(gather(v, &indices, runs)),
             };
             new_columns.insert(name.clone(), new_column);
         }
@@ -1015,47 +1107,6 @@ impl TinyFrame {
         })
     }
 
-    fn compare_values(&self, val: &ValueEnum, py_value: &PyAny, _py: Python, compare_fn: fn(f64, f64) -> bool) -> PyResult<bool> {
-        match val {
-            ValueEnum::Int(v) => {
-                let py_f64 = py_value.extract::<f64>()?;
-                Ok(compare_fn(*v as f64, py_f64))
-            }
-            ValueEnum::Float(v) => {
-                let py_f64 = py_value.extract::<f64>()?;
-                Ok(compare_fn(*v, py_f64))
-            }
-            ValueEnum::Str(_) => return Ok(false), // String comparison handled separately
-            ValueEnum::Bool(_) => return Ok(false), // Bool comparison not implemented yet
-            ValueEnum::PyObjectId(_) => return Ok(false), // PyObject comparison not implemented yet
-        }
-    }
-
-    fn compare_string_values(&self, val: &ValueEnum, py_value: &PyAny, _py: Python, condition: &str) -> PyResult<bool> {
-        match val {
-            ValueEnum::Str(s) => {
-                let py_str: String = py_value.extract()?;
-                Ok(match condition {
-                    "==" => s == &py_str,
-                    "!=" => s != &py_str,
-                    _ => false, // Other comparisons not supported for strings
-                })
-            }
-            _ => Ok(false),
-        }
-    }
-
-    fn check_in_values(&self, val: &ValueEnum, py_value: &PyAny, _py: Python) -> PyResult<bool> {
-        // This is a simplified implementation - in practice, you'd want to handle different types
-        match val {
-            ValueEnum::Str(s) => {
-                let py_str: String = py_value.extract()?;
-                Ok(s == &py_str)
-            }
-            _ => Ok(false), // Other types not implemented yet
-        }
-    }
-
     fn get_value_at_index(&self, column: &TinyColumn, index: usize) -> Option<f64> {
         match column {
             TinyColumn::Int(v) => Some(v[index] as f64),
@@ -1076,6 +1127,32 @@ impl TinyFrame {
     }
 }
 
+// Collapse strictly ascending row indices into half-open (start, end) runs
+fn index_runs(indices: &[usize]) -> Vec<(usize, usize)> {
+    let mut runs: Vec<(usize, usize)> = Vec::new();
+    for &i in indices {
+        match runs.last_mut() {
+            Some((_, end)) if *end == i => *end += 1,
+            _ => runs.push((i, i + 1)),
+        }
+    }
+    runs
+}
+
+// Copy the selected rows of a column, slice by slice when runs are available
+fn gather<T: Clone>(values: &[T], indices: &[usize], runs: Option<&[(usize, usize)]>) -> Vec<T> {
+    match runs {
+        Some(runs) => {
+            let mut out = Vec::with_capacity(indices.len());
+            for &(start, end) in runs {
+                out.extend_from_slice(&values[start..end]);
+            }
+            out
+        }
+        None => indices.iter().map(|&i| values[i].clone()).collect(),
+    }
+}
+
 impl TinyColumn {
     pub fn len(&self) -> usize {
         match self {
@@ -1097,6 +1174,42 @@ impl TinyColumn {
     pub fn iter(&self) -> TinyColumnIter {
         TinyColumnIter::new(self)
     }
+
+    /// Name of the column's storage type, as shown by `TinyCol.type_str`
+    pub fn type_str(&self) -> &'static str {
+        match self {
+            TinyColumn::Int(_) => "Int",
+            TinyColumn::Float(_) => "Float",
+            TinyColumn::Str(_) => "Str",
+            TinyColumn::Bool(_) => "Bool",
+            TinyColumn::OptInt(_) => "OptInt",
+            TinyColumn::OptFloat(_) => "OptFloat",
+            TinyColumn::OptStr(_) => "OptStr",
+            TinyColumn::OptBool(_) => "OptBool",
+            TinyColumn::Mixed(_) => "Mixed",
+            TinyColumn::OptMixed(_) => "OptMixed",
+            TinyColumn::PyObject(_) => "PyObject",
+            TinyColumn::OptPyObject(_) => "OptPyObject",
+        }
+    }
+
+    /// Number of null cells; columns without an Option wrapper have none
+    pub fn null_count(&self) -> usize {
+        fn nones<T>(v: &[Option<T>]) -> usize {
+            v.iter().filter(|x| x.is_none()).count()
+        }
+
+        match self {
+            TinyColumn::Int(_) | TinyColumn::Float(_) | TinyColumn::Str(_) | TinyColumn::Bool(_) => 0,
+            TinyColumn::Mixed(_) | TinyColumn::PyObject(_) => 0,
+            TinyColumn::OptInt(v) => nones(v),
+            TinyColumn::OptFloat(v) => nones(v),
+            TinyColumn::OptStr(v) => nones(v),
+            TinyColumn::OptBool(v) => nones(v),
+            TinyColumn::OptMixed(v) => nones(v),
+            TinyColumn::OptPyObject(v) => nones(v),
+        }
+    }
 }
 
 pub struct TinyColumnIter<'a> {
@@ -0,0 +1,74 @@
+use crate::frame::TinyColumn;
+
+/// Order-preserving unsigned keys for a numeric column, or `None` when the
+/// column is not numeric. Descending order is encoded by inverting the key,
+/// so a single ascending radix sort serves both directions. NaN is keyed like
+/// a null, since it has no place in the ordering.
+pub fn numeric_sort_keys(column: &TinyColumn, ascending: bool) -> Option<Vec<Option<u64>>> {
+    let direct = |key: u64| if ascending { key } else { !key };
+    let int_key = |x: i64| direct((x as u64) ^ (1 << 63));
+    let float_key = |x: f64| if x.is_nan() { None } else { Some(direct(f64_to_sortable_u64(x))) };
+    match column {
+        TinyColumn::Int(v) => Some(v.iter().map(|&x| Some(int_key(x))).collect()),
+        TinyColumn::OptInt(v) => Some(v.iter().map(|x| x.map(int_key)).collect()),
+        TinyColumn::Float(v) => Some(v.iter().map(|&x| float_key(x)).collect()),
+        TinyColumn::OptFloat(v) => Some(v.iter().map(|x| x.and_then(float_key)).collect()),
+        _ => None,
+    }
+}
+
+/// Map a float to a u64 whose unsigned order matches the float order: flip
+/// every bit of negatives and only the sign bit of positives. -0.0 is folded
+/// into 0.0 first so the two stay tied, as they are under comparison.
+#[inline]
+fn f64_to_sortable_u64(x: f64) -> u64 {
+    let bits = (x + 0.0).to_bits();
+    bits ^ ((((bits as i64) >> 63) as u64) | 0x8000_0000_0000_0000)
+}
+
+/// Stable LSD radix sort of row `indices` by `keys[row]`, 8 bits per pass.
+///
+/// Null keys go after every value, or before them when `nulls_first` is set,
+/// keeping their original relative order.
+pub fn radix_sort_indices(indices: &mut Vec<usize>, keys: &[Option<u64>], nulls_first: bool) {
+    let n = indices.len();
+    let mut buffer = vec![0usize; n];
+
+    for shift in (0..64).step_by(8) {
+        let mut counts = [0usize; 256];
+        for &row in indices.iter() {
+            counts[byte_at(keys[row], shift)] += 1;
+        }
+        // Every key shares this byte, so the pass would not move anything
+        if counts.iter().any(|&c| c == n) {
+            continue;
+        }
+
+        let mut offset = 0;
+        for count in counts.iter_mut() {
+            let c = *count;
+            *count = offset;
+            offset += c;
+        }
+        for &row in indices.iter() {
+            let bucket = byte_at(keys[row], shift);
+            buffer[counts[bucket]] = row;
+            counts[bucket] += 1;
+        }
+        std::mem::swap(indices, &mut buffer);
+    }
+
+    if keys.iter().any(Option::is_none) {
+        let (valid, nulls): (Vec<usize>, Vec<usize>) = indices.iter().partition(|&&row| keys[row].is_some());
+        *indices = if nulls_first {
+            nulls.into_iter().chain(valid).collect()
+        } else {
+            valid.into_iter().chain(nulls).collect()
+        };
+    }
+}
+
+#[inline]
+fn byte_at(key: Option<u64>, shift: usize) -> usize {
+    ((key.unwrap_or(0) >> shift) & 0xff) as usize
+}
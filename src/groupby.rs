@@ -1,50 +1,83 @@
 use pyo3::prelude::*;
-use pyo3::types::PyTuple;
+use pyo3::types::{PyList, PyTuple};
+use rayon::prelude::*;
 use std::collections::HashMap;
 use crate::frame::{TinyColumn, TinyFrame};
+use crate::parallel::PARALLEL_MIN_ROWS;
 
 #[pyclass]
 pub struct TinyGroupBy {
     #[pyo3(get)]
     pub keys: Vec<String>,
-    groups: HashMap<Vec<Option<String>>, Vec<usize>>,
+    // Key values of each group, indexed by group code in order of first appearance
+    group_keys: Vec<Vec<Option<String>>>,
+    // Group code of each row
+    codes: Vec<u32>,
+    // Row indices of every group, stored back to back in group code order
+    group_rows: Vec<usize>,
+    // Group g owns group_rows[group_offsets[g]..group_offsets[g + 1]]
+    group_offsets: Vec<usize>,
 }
 
 #[pymethods]
 impl TinyGroupBy {
     #[new]
     fn new(frame: &TinyFrame, keys: Vec<String>) -> PyResult<Self> {
-        let mut groups = HashMap::new();
-        let mut key_columns = Vec::new();
+        let mut codes: Vec<u32> = vec![0; frame.length];
+        let mut group_keys: Vec<Vec<Option<String>>> = if frame.length > 0 { vec![Vec::new()] } else { Vec::new() };
 
         for key in &keys {
             let col = frame.columns.get(key).ok_or_else(|| {
                 PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Key column '{}' not found", key))
             })?;
 
-            // For now, only string columns can be used as keys
-            let col_strings: Vec<Option<String>> = match col {
-                TinyColumn::Str(v) => v.iter().map(|s| Some(s.clone())).collect(),
-                TinyColumn::OptStr(v) => v.clone(),
-                _ => {
-                    return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                        "Only string columns can be used as group keys for now",
-                    ));
+            let (col_codes, dictionary) = encode_key_column(col)?;
+
+            if group_keys.len() <= 1 {
+                // Only one group so far, so the column codes are the group codes
+                let prefix = group_keys.pop().unwrap_or_default();
+                group_keys = dictionary
+                    .into_iter()
+                    .map(|value| {
+                        let mut key = prefix.clone();
+                        key.push(value);
+                        key
+                    })
+                    .collect();
+                codes = col_codes;
+            } else {
+                // Combine the codes so far with this column's codes
+                let mut lookup: HashMap<(u32, u32), u32> = HashMap::new();
+                let mut combined_keys: Vec<Vec<Option<String>>> = Vec::new();
+                for (code, &col_code) in codes.iter_mut().zip(&col_codes) {
+                    let prev = *code;
+                    *code = *lookup.entry((prev, col_code)).or_insert_with(|| {
+                        let mut key = group_keys[prev as usize].clone();
+                        key.push(dictionary[col_code as usize].clone());
+                        combined_keys.push(key);
+                        (combined_keys.len() - 1) as u32
+                    });
                 }
-            };
-
-            key_columns.push(col_strings);
+                group_keys = combined_keys;
+            }
         }
 
-        for row_idx in 0..frame.length {
-            let mut key = Vec::new();
-            for col in &key_columns {
-                key.push(col[row_idx].clone());
-            }
-            groups.entry(key).or_insert_with(Vec::new).push(row_idx);
+        // Counting sort of the row indices by group code: count, prefix-sum, scatter
+        let mut group_offsets = vec![0usize; group_keys.len() + 1];
+        for &code in &codes {
+            group_offsets[code as usize + 1] += 1;
+        }
+        for g in 0..group_keys.len() {
+            group_offsets[g + 1] += group_offsets[g];
+        }
+        let mut group_rows = vec![0usize; codes.len()];
+        let mut cursor = group_offsets.clone();
+        for (row_idx, &code) in codes.iter().enumerate() {
+            group_rows[cursor[code as usize]] = row_idx;
+            cursor[code as usize] += 1;
         }
 
-        Ok(TinyGroupBy { keys, groups })
+        Ok(TinyGroupBy { keys, group_keys, codes, group_rows, group_offsets })
     }
 
     fn count(&self, frame: &TinyFrame) -> PyResult<TinyFrame> {
@@ -75,6 +108,26 @@ impl TinyGroupBy {
         self.aggregate_column(frame, column, "var")
     }
 
+    fn std_var(&self, frame: &TinyFrame, column: String) -> PyResult<TinyFrame> {
+        let col = frame.columns.get(&column).ok_or_else(|| {
+            PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column))
+        })?;
+
+        // Both outputs come from the same Welford pass
+        let var_values = self.variance_by_group(col);
+        let std_values: Vec<Option<f64>> = var_values.iter().map(|var| var.map(f64::sqrt)).collect();
+
+        let mut columns = self.key_columns();
+        columns.insert(format!("{}_std", column), TinyColumn::OptFloat(std_values));
+        columns.insert(format!("{}_var", column), TinyColumn::OptFloat(var_values));
+
+        Ok(TinyFrame {
+            columns,
+            length: self.group_keys.len(),
+            py_objects: frame.py_objects.clone(),
+        })
+    }
+
     fn median(&self, frame: &TinyFrame, column: String) -> PyResult<TinyFrame> {
         self.aggregate_column(frame, column, "median")
     }
@@ -95,12 +148,12 @@ impl TinyGroupBy {
     fn groups(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
 
-        for (key_vec, val) in &self.groups {
+        for (g, key_vec) in self.group_keys.iter().enumerate() {
             let py_key = PyTuple::new(
                 py,
-                key_vec.iter().map(|v| v.clone().map_or(py.None(), |s| s.into_py(py))),
+                key_vec.iter().map(|v| v.as_deref().map_or(py.None(), |s| s.into_py(py))),
             );
-            dict.set_item(py_key, val)?;
+            dict.set_item(py_key, PyList::new(py, self.rows_of(g)))?;
         }
 
         Ok(dict.into())
@@ -108,27 +161,25 @@ impl TinyGroupBy {
 }
 
 impl TinyGroupBy {
+    // Row indices of the group with code g, in row order
+    fn rows_of(&self, g: usize) -> &[usize] {
+        &self.group_rows[self.group_offsets[g]..self.group_offsets[g + 1]]
+    }
+
     // Helper method for basic aggregations (count, size)
     fn aggregate(&self, frame: &TinyFrame, agg_type: &str) -> PyResult<TinyFrame> {
-        let mut columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut key_columns: Vec<Vec<Option<String>>> = vec![Vec::new(); self.keys.len()];
-        let mut agg_column: Vec<Option<i64>> = Vec::new();
+        let agg_column: Vec<Option<i64>> = self
+            .group_offsets
+            .windows(2)
+            .map(|w| Some((w[1] - w[0]) as i64))
+            .collect();
 
-        for (key, row_indices) in &self.groups {
-            for (i, val) in key.iter().enumerate() {
-                key_columns[i].push(val.clone());
-            }
-            agg_column.push(Some(row_indices.len() as i64));
-        }
-
-        for (i, key_name) in self.keys.iter().enumerate() {
-            columns.insert(key_name.clone(), TinyColumn::OptStr(key_columns[i].clone()));
-        }
+        let mut columns = self.key_columns();
         columns.insert(agg_type.to_string(), TinyColumn::OptInt(agg_column));
 
         Ok(TinyFrame {
             columns,
-            length: self.groups.len(),
+            length: self.group_keys.len(),
             py_objects: frame.py_objects.clone(),
         })
     }
@@ -139,195 +190,152 @@ impl TinyGroupBy {
             PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("Column '{}' not found", column_name))
         })?;
 
-        let mut columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut key_columns: Vec<Vec<Option<String>>> = vec![Vec::new(); self.keys.len()];
-        let mut agg_values: Vec<Option<f64>> = Vec::new();
-
-        for (key, row_indices) in &self.groups {
-            for (i, val) in key.iter().enumerate() {
-                key_columns[i].push(val.clone());
-            }
-
-            let agg_value = match agg_type {
-                "sum" => self.calculate_sum(column, row_indices),
-                "mean" => self.calculate_mean(column, row_indices),
-                "min" => self.calculate_min(column, row_indices),
-                "max" => self.calculate_max(column, row_indices),
-                "std" => self.calculate_std(column, row_indices),
-                "var" => self.calculate_var(column, row_indices),
-                "median" => self.calculate_median(column, row_indices),
-                "first" => self.calculate_first(column, row_indices),
-                "last" => self.calculate_last(column, row_indices),
-                _ => return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
-                    format!("Unknown aggregation type: {}", agg_type)
-                )),
-            };
-
-            agg_values.push(agg_value);
-        }
+        let n_groups = self.group_keys.len();
+        let agg_values: Vec<Option<f64>> = match agg_type {
+            "sum" => match self.sum_count_by_group(column) {
+                Some(acc) => acc.into_iter().map(|(sum, _)| Some(sum)).collect(),
+                None => vec![None; n_groups],
+            },
+            "mean" => match self.sum_count_by_group(column) {
+                Some(acc) => acc
+                    .into_iter()
+                    .map(|(sum, count)| if count == 0 { None } else { Some(sum / count as f64) })
+                    .collect(),
+                None => vec![None; n_groups],
+            },
+            "min" => self.extremum_by_group(column, |x, current| x < current),
+            "max" => self.extremum_by_group(column, |x, current| x > current),
+            "std" => self.variance_by_group(column).into_iter().map(|var| var.map(f64::sqrt)).collect(),
+            "var" => self.variance_by_group(column),
+            "median" => self.median_by_group(column),
+            "first" => (0..n_groups).map(|g| self.calculate_first(column, self.rows_of(g))).collect(),
+            "last" => (0..n_groups).map(|g| self.calculate_last(column, self.rows_of(g))).collect(),
+            _ => return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                format!("Unknown aggregation type: {}", agg_type)
+            )),
+        };
 
-        for (i, key_name) in self.keys.iter().enumerate() {
-            columns.insert(key_name.clone(), TinyColumn::OptStr(key_columns[i].clone()));
-        }
+        let mut columns = self.key_columns();
         columns.insert(format!("{}_{}", column_name, agg_type), TinyColumn::OptFloat(agg_values));
 
         Ok(TinyFrame {
             columns,
-            length: self.groups.len(),
+            length: n_groups,
             py_objects: frame.py_objects.clone(),
         })
     }
 
-}
-
-impl TinyGroupBy {
-    // Aggregation calculation methods (private helper methods)
-    fn calculate_sum(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
-        match column {
-            TinyColumn::Int(v) => {
-                let sum: i64 = row_indices.iter().map(|&i| v[i]).sum();
-                Some(sum as f64)
-            }
-            TinyColumn::Float(v) => {
-                let sum: f64 = row_indices.iter().map(|&i| v[i]).sum();
-                Some(sum)
-            }
-            TinyColumn::OptInt(v) => {
-                let sum: i64 = row_indices.iter().filter_map(|&i| v[i]).sum();
-                Some(sum as f64)
-            }
-            TinyColumn::OptFloat(v) => {
-                let sum: f64 = row_indices.iter().filter_map(|&i| v[i]).sum();
-                Some(sum)
-            }
-            _ => None,
+    // One OptStr column per key, one row per group
+    fn key_columns(&self) -> HashMap<String, TinyColumn> {
+        let mut columns: HashMap<String, TinyColumn> = HashMap::new();
+        for (i, key_name) in self.keys.iter().enumerate() {
+            let values: Vec<Option<String>> = self.group_keys.iter().map(|key| key[i].clone()).collect();
+            columns.insert(key_name.clone(), TinyColumn::OptStr(values));
         }
+        columns
     }
 
-    fn calculate_mean(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
+    // Per-group sum and non-null count of a numeric column in one pass over the codes
+    fn sum_count_by_group(&self, column: &TinyColumn) -> Option<Vec<(f64, usize)>> {
+        let n_groups = self.group_keys.len();
+        let codes = &self.codes;
+        let int_sums = |acc: Vec<(i64, usize)>| -> Vec<(f64, usize)> {
+            acc.into_iter().map(|(sum, count)| (sum as f64, count)).collect()
+        };
+        fn add<N: std::ops::Add<Output = N>>((sum, count): (N, usize), x: N) -> (N, usize) {
+            (sum + x, count + 1)
+        }
+        fn merge<N: std::ops::Add<Output = N>>((s1, c1): (N, usize), (s2, c2): (N, usize)) -> (N, usize) {
+            (s1 + s2, c1 + c2)
+        }
         match column {
-            TinyColumn::Int(v) => {
-                let sum: i64 = row_indices.iter().map(|&i| v[i]).sum();
-                Some(sum as f64 / row_indices.len() as f64)
-            }
-            TinyColumn::Float(v) => {
-                let sum: f64 = row_indices.iter().map(|&i| v[i]).sum();
-                Some(sum / row_indices.len() as f64)
-            }
-            TinyColumn::OptInt(v) => {
-                let values: Vec<i64> = row_indices.iter().filter_map(|&i| v[i]).collect();
-                if values.is_empty() {
-                    None
-                } else {
-                    let sum: i64 = values.iter().sum();
-                    Some(sum as f64 / values.len() as f64)
-                }
-            }
-            TinyColumn::OptFloat(v) => {
-                let values: Vec<f64> = row_indices.iter().filter_map(|&i| v[i]).collect();
-                if values.is_empty() {
-                    None
-                } else {
-                    let sum: f64 = values.iter().sum();
-                    Some(sum / values.len() as f64)
-                }
-            }
+            TinyColumn::Int(v) => Some(int_sums(reduce_by_group(codes, v, |&x| Some(x), n_groups, (0i64, 0usize), add, merge))),
+            TinyColumn::OptInt(v) => Some(int_sums(reduce_by_group(codes, v, |&x| x, n_groups, (0i64, 0usize), add, merge))),
+            TinyColumn::Float(v) => Some(reduce_by_group(codes, v, |&x| Some(x), n_groups, (0.0, 0usize), add, merge)),
+            TinyColumn::OptFloat(v) => Some(reduce_by_group(codes, v, |&x| x, n_groups, (0.0, 0usize), add, merge)),
             _ => None,
         }
     }
 
-    fn calculate_min(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
+    // Per-group min or max; `replaces(x, current)` decides whether x wins
+    fn extremum_by_group(&self, column: &TinyColumn, replaces: fn(f64, f64) -> bool) -> Vec<Option<f64>> {
+        let n_groups = self.group_keys.len();
+        let pick = |current: Option<f64>, x: f64| match current {
+            Some(c) if !replaces(x, c) => Some(c),
+            _ => Some(x),
+        };
+        let merge = |current: Option<f64>, other: Option<f64>| other.map_or(current, |x| pick(current, x));
+        let codes = &self.codes;
         match column {
-            TinyColumn::Int(v) => {
-                let min_val = row_indices.iter().map(|&i| v[i]).min()?;
-                Some(min_val as f64)
-            }
-            TinyColumn::Float(v) => {
-                row_indices.iter().map(|&i| v[i]).min_by(|a, b| a.partial_cmp(b).unwrap())
-            }
-            TinyColumn::OptInt(v) => {
-                let min_val = row_indices.iter().filter_map(|&i| v[i]).min()?;
-                Some(min_val as f64)
-            }
-            TinyColumn::OptFloat(v) => {
-                row_indices.iter().filter_map(|&i| v[i]).min_by(|a, b| a.partial_cmp(b).unwrap())
-            }
-            _ => None,
+            TinyColumn::Int(v) => reduce_by_group(codes, v, |&x| Some(x as f64), n_groups, None, pick, merge),
+            TinyColumn::Float(v) => reduce_by_group(codes, v, |&x| Some(x), n_groups, None, pick, merge),
+            TinyColumn::OptInt(v) => reduce_by_group(codes, v, |&x| x.map(|x| x as f64), n_groups, None, pick, merge),
+            TinyColumn::OptFloat(v) => reduce_by_group(codes, v, |&x| x, n_groups, None, pick, merge),
+            _ => vec![None; n_groups],
         }
     }
 
-    fn calculate_max(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
-        match column {
-            TinyColumn::Int(v) => {
-                let max_val = row_indices.iter().map(|&i| v[i]).max()?;
-                Some(max_val as f64)
-            }
-            TinyColumn::Float(v) => {
-                row_indices.iter().map(|&i| v[i]).max_by(|a, b| a.partial_cmp(b).unwrap())
-            }
-            TinyColumn::OptInt(v) => {
-                let max_val = row_indices.iter().filter_map(|&i| v[i]).max()?;
-                Some(max_val as f64)
+    // Per-group population variance from a single Welford pass over the codes
+    fn variance_by_group(&self, column: &TinyColumn) -> Vec<Option<f64>> {
+        let n_groups = self.group_keys.len();
+        let welford = |(count, mean, m2): (usize, f64, f64), x: f64| {
+            let count = count + 1;
+            let delta = x - mean;
+            let mean = mean + delta / count as f64;
+            (count, mean, m2 + delta * (x - mean))
+        };
+        // Chan et al.'s pairwise update combines two partial Welford states
+        let merge = |a: (usize, f64, f64), b: (usize, f64, f64)| {
+            if a.0 == 0 {
+                return b;
             }
-            TinyColumn::OptFloat(v) => {
-                row_indices.iter().filter_map(|&i| v[i]).max_by(|a, b| a.partial_cmp(b).unwrap())
+            if b.0 == 0 {
+                return a;
             }
-            _ => None,
-        }
-    }
-
-    fn calculate_std(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
-        let mean = self.calculate_mean(column, row_indices)?;
-        let variance = self.calculate_variance_with_mean(column, row_indices, mean)?;
-        Some(variance.sqrt())
-    }
-
-    fn calculate_var(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
-        let mean = self.calculate_mean(column, row_indices)?;
-        self.calculate_variance_with_mean(column, row_indices, mean)
-    }
-
-    fn calculate_variance_with_mean(&self, column: &TinyColumn, row_indices: &[usize], mean: f64) -> Option<f64> {
-        let values: Vec<f64> = match column {
-            TinyColumn::Int(v) => row_indices.iter().map(|&i| v[i] as f64).collect(),
-            TinyColumn::Float(v) => row_indices.iter().map(|&i| v[i]).collect(),
-            TinyColumn::OptInt(v) => row_indices.iter().filter_map(|&i| v[i]).map(|x| x as f64).collect(),
-            TinyColumn::OptFloat(v) => row_indices.iter().filter_map(|&i| v[i]).collect(),
-            _ => return None,
+            let count = a.0 + b.0;
+            let delta = b.1 - a.1;
+            let weight = (a.0 as f64) * (b.0 as f64) / count as f64;
+            (count, a.1 + delta * b.0 as f64 / count as f64, a.2 + b.2 + delta * delta * weight)
         };
-
-        if values.is_empty() {
-            return None;
-        }
-
-        let variance = values.iter()
-            .map(|&x| (x - mean).powi(2))
-            .sum::<f64>() / values.len() as f64;
-        Some(variance)
+        let init = (0usize, 0.0, 0.0);
+        let codes = &self.codes;
+        let acc = match column {
+            TinyColumn::Int(v) => reduce_by_group(codes, v, |&x| Some(x as f64), n_groups, init, welford, merge),
+            TinyColumn::Float(v) => reduce_by_group(codes, v, |&x| Some(x), n_groups, init, welford, merge),
+            TinyColumn::OptInt(v) => reduce_by_group(codes, v, |&x| x.map(|x| x as f64), n_groups, init, welford, merge),
+            TinyColumn::OptFloat(v) => reduce_by_group(codes, v, |&x| x, n_groups, init, welford, merge),
+            _ => return vec![None; n_groups],
+        };
+        acc.into_iter()
+            .map(|(count, _, m2)| if count == 0 { None } else { Some(m2 / count as f64) })
+            .collect()
     }
 
-    fn calculate_median(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
-        let mut values: Vec<f64> = match column {
-            TinyColumn::Int(v) => row_indices.iter().map(|&i| v[i] as f64).collect(),
-            TinyColumn::Float(v) => row_indices.iter().map(|&i| v[i]).collect(),
-            TinyColumn::OptInt(v) => row_indices.iter().filter_map(|&i| v[i]).map(|x| x as f64).collect(),
-            TinyColumn::OptFloat(v) => row_indices.iter().filter_map(|&i| v[i]).collect(),
-            _ => return None,
+    // Per-group median: gather each group's values into a scratch buffer,
+    // then quickselect it in place instead of sorting it
+    fn median_by_group(&self, column: &TinyColumn) -> Vec<Option<f64>> {
+        let n_groups = self.group_keys.len();
+        let values: Vec<Option<f64>> = match column {
+            TinyColumn::Int(v) => v.iter().map(|&x| Some(x as f64)).collect(),
+            TinyColumn::Float(v) => v.iter().map(|&x| Some(x)).collect(),
+            TinyColumn::OptInt(v) => v.iter().map(|x| x.map(|x| x as f64)).collect(),
+            TinyColumn::OptFloat(v) => v.clone(),
+            _ => return vec![None; n_groups],
         };
 
-        if values.is_empty() {
-            return None;
-        }
-
-        values.sort_by(|a, b| a.partial_cmp(b).unwrap());
-        let mid = values.len() / 2;
-        if values.len() % 2 == 0 {
-            Some((values[mid - 1] + values[mid]) / 2.0)
-        } else {
-            Some(values[mid])
-        }
+        let mut scratch: Vec<f64> = Vec::new();
+        (0..n_groups)
+            .map(|g| {
+                scratch.clear();
+                scratch.extend(self.rows_of(g).iter().filter_map(|&row| values[row]));
+                median_in_place(&mut scratch)
+            })
+            .collect()
     }
+}
 
+impl TinyGroupBy {
+    // Aggregation calculation methods (private helper methods)
     fn calculate_first(&self, column: &TinyColumn, row_indices: &[usize]) -> Option<f64> {
         if row_indices.is_empty() {
             return None;
@@ -356,3 +364,98 @@ impl TinyGroupBy {
         }
     }
 }
+
+// Dictionary-encode a string key column into per-row codes and its distinct values
+fn encode_key_column(col: &TinyColumn) -> PyResult<(Vec<u32>, Vec<Option<String>>)> {
+    // For now, only string columns can be used as keys
+    match col {
+        TinyColumn::Str(v) => Ok(encode_strings(v.iter().map(|s| Some(s.as_str())), v.len())),
+        TinyColumn::OptStr(v) => Ok(encode_strings(v.iter().map(|s| s.as_deref()), v.len())),
+        _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "Only string columns can be used as group keys for now",
+        )),
+    }
+}
+
+fn encode_strings<'a, I: Iterator<Item = Option<&'a str>>>(values: I, len: usize) -> (Vec<u32>, Vec<Option<String>>) {
+    let mut lookup: HashMap<Option<&'a str>, u32> = HashMap::new();
+    let mut dictionary: Vec<Option<String>> = Vec::new();
+    let mut codes: Vec<u32> = Vec::with_capacity(len);
+    for value in values {
+        let code = *lookup.entry(value).or_insert_with(|| {
+            dictionary.push(value.map(str::to_string));
+            (dictionary.len() - 1) as u32
+        });
+        codes.push(code);
+    }
+    (codes, dictionary)
+}
+
+// Median of a slice, reordering it; small slices skip selection entirely
+fn median_in_place(values: &mut [f64]) -> Option<f64> {
+    match values.len() {
+        0 => None,
+        1 => Some(values[0]),
+        2 => Some((values[0] + values[1]) / 2.0),
+        len => {
+            let mid = len / 2;
+            let (lower, upper, _) = values.select_nth_unstable_by(mid, f64::total_cmp);
+            let upper = *upper;
+            if len % 2 == 1 {
+                Some(upper)
+            } else {
+                // Everything left of the selected element is <= it, so the
+                // lower middle value is the largest of that part
+                let lower = lower.iter().copied().fold(f64::NEG_INFINITY, f64::max);
+                Some((lower + upper) / 2.0)
+            }
+        }
+    }
+}
+
+// Rows folded by each parallel task
+const PARALLEL_CHUNK_ROWS: usize = 8_192;
+// Above this many groups the per-chunk accumulators cost more than they save
+const PARALLEL_MAX_GROUPS: usize = 1_024;
+
+// Fold the non-null values of a column into one accumulator per group code.
+// Large inputs with few groups are split into row chunks folded in parallel;
+// the per-chunk partials are then combined in chunk order with `merge`.
+fn reduce_by_group<S: Sync, T, A: Copy + Send + Sync>(
+    codes: &[u32],
+    values: &[S],
+    get: impl Fn(&S) -> Option<T> + Sync,
+    n_groups: usize,
+    init: A,
+    f: impl Fn(A, T) -> A + Sync,
+    merge: impl Fn(A, A) -> A,
+) -> Vec<A> {
+    let fold_rows = |codes: &[u32], values: &[S]| {
+        let mut acc = vec![init; n_groups];
+        for (&code, value) in codes.iter().zip(values) {
+            if let Some(x) = get(value) {
+                let slot = &mut acc[code as usize];
+                *slot = f(*slot, x);
+            }
+        }
+        acc
+    };
+
+    if values.len() < PARALLEL_MIN_ROWS || n_groups > PARALLEL_MAX_GROUPS {
+        return fold_rows(codes, values);
+    }
+
+    let partials: Vec<Vec<A>> = codes
+        .par_chunks(PARALLEL_CHUNK_ROWS)
+        .zip(values.par_chunks(PARALLEL_CHUNK_ROWS))
+        .map(|(codes, values)| fold_rows(codes, values))
+        .collect();
+    let mut partials = partials.into_iter();
+    let mut acc = partials.next().unwrap_or_else(|| vec![init; n_groups]);
+    for partial in partials {
+        for (slot, other) in acc.iter_mut().zip(partial) {
+            *slot = merge(*slot, other);
+        }
+    }
+    acc
+}
@@ -1,7 +1,101 @@
+use std::borrow::Borrow;
 use std::collections::HashMap;
+use std::hash::{BuildHasherDefault, Hash, Hasher};
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use crate::frame::{TinyFrame, TinyColumn, ValueEnum};
 
+// Probe sides below this many rows are matched on the calling thread
+const PARALLEL_MIN_PROBE_ROWS: usize = 5_000;
+// Probe rows handled by each parallel task
+const PROBE_STRIPE_ROWS: usize = 4_096;
+
+// Dictionary from build keys to dense codes: typed values for a single Int,
+// Float or Str key column, a row of ValueEnums otherwise. Float keys are
+// stored as their bits, see `float_keys`.
+enum KeyDictionary {
+    Int(KeyMap<i64>),
+    Float(KeyMap<u64>),
+    Str(KeyMap<String>),
+    Row(KeyMap<Vec<ValueEnum>>),
+}
+
+// Key dictionaries hash with KeyHasher instead of std's SipHash: join keys
+// are plain column values, not untrusted input that needs DoS resistance
+type KeyMap<K> = HashMap<K, u32, BuildHasherDefault<KeyHasher>>;
+
+// Multiply-rotate hasher over 64-bit words, the scheme of rustc's FxHasher.
+// `finish` rotates the well-mixed high bits down, since the table picks
+// buckets from the low bits.
+#[derive(Default)]
+struct KeyHasher {
+    hash: u64,
+}
+
+const KEY_HASH_SEED: u64 = 0xf135_7aea_2e62_a9c5;
+
+impl KeyHasher {
+    #[inline]
+    fn add(&mut self, word: u64) {
+        self.hash = (self.hash.rotate_left(5) ^ word).wrapping_mul(KEY_HASH_SEED);
+    }
+}
+
+impl Hasher for KeyHasher {
+    #[inline]
+    fn write(&mut self, bytes: &[u8]) {
+        let mut chunks = bytes.chunks_exact(8);
+        for chunk in &mut chunks {
+            self.add(u64::from_le_bytes(chunk.try_into().unwrap()));
+        }
+        let rest = chunks.remainder();
+        if !rest.is_empty() {
+            let mut word = [0u8; 8];
+            word[..rest.len()].copy_from_slice(rest);
+            self.add(u64::from_le_bytes(word));
+        }
+    }
+
+    #[inline]
+    fn write_u8(&mut self, i: u8) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn write_u32(&mut self, i: u32) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn write_u64(&mut self, i: u64) {
+        self.add(i);
+    }
+
+    #[inline]
+    fn write_i64(&mut self, i: i64) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn write_usize(&mut self, i: usize) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn finish(&self) -> u64 {
+        self.hash.rotate_left(26)
+    }
+}
+
+// Hash side of a join: the build keys' dictionary and the build rows grouped
+// by key code, stored back to back so that code c owns
+// rows[offsets[c]..offsets[c + 1]]
+struct BuildTable {
+    dictionary: KeyDictionary,
+    offsets: Vec<usize>,
+    rows: Vec<usize>,
+}
+
 // Join types
 #[derive(Debug, Clone)]
 pub enum JoinType {
@@ -11,6 +105,30 @@ pub enum JoinType {
     Outer,
 }
 
+// How an inner join matches rows
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub enum JoinStrategy {
+    // Hash the build side's keys and probe them
+    Hash,
+    // Walk both sides in key order with two cursors
+    SortMerge,
+    // Sort-merge when both sides are already sorted on the key, else hash
+    Auto,
+}
+
+impl JoinStrategy {
+    pub fn parse(strategy: &str) -> PyResult<Self> {
+        match strategy {
+            "hash" => Ok(JoinStrategy::Hash),
+            "sort_merge" => Ok(JoinStrategy::SortMerge),
+            "auto" => Ok(JoinStrategy::Auto),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                format!("Unknown join strategy: {}", strategy)
+            )),
+        }
+    }
+}
+
 // Join operations for TinyFrame
 pub struct JoinOps;
 
@@ -21,8 +139,9 @@ impl JoinOps {
         right: &TinyFrame,
         left_on: Vec<String>,
         right_on: Vec<String>,
+        strategy: JoinStrategy,
     ) -> PyResult<TinyFrame> {
-        Self::perform_join(left, right, left_on, right_on, JoinType::Inner)
+        Self::perform_join(left, right, left_on, right_on, JoinType::Inner, strategy)
     }
 
     // Left join
@@ -32,7 +151,7 @@ impl JoinOps {
         left_on: Vec<String>,
         right_on: Vec<String>,
     ) -> PyResult<TinyFrame> {
-        Self::perform_join(left, right, left_on, right_on, JoinType::Left)
+        Self::perform_join(left, right, left_on, right_on, JoinType::Left, JoinStrategy::Hash)
     }
 
     // Right join
@@ -42,7 +161,7 @@ impl JoinOps {
         left_on: Vec<String>,
         right_on: Vec<String>,
     ) -> PyResult<TinyFrame> {
-        Self::perform_join(left, right, left_on, right_on, JoinType::Right)
+        Self::perform_join(left, right, left_on, right_on, JoinType::Right, JoinStrategy::Hash)
     }
 
     // Outer join
@@ -52,7 +171,7 @@ impl JoinOps {
         left_on: Vec<String>,
         right_on: Vec<String>,
     ) -> PyResult<TinyFrame> {
-        Self::perform_join(left, right, left_on, right_on, JoinType::Outer)
+        Self::perform_join(left, right, left_on, right_on, JoinType::Outer, JoinStrategy::Hash)
     }
 
     // Main join implementation
@@ -62,6 +181,7 @@ impl JoinOps {
         left_on: Vec<String>,
         right_on: Vec<String>,
         join_type: JoinType,
+        strategy: JoinStrategy,
     ) -> PyResult<TinyFrame> {
         // Validate join columns
         for col in &left_on {
@@ -85,38 +205,317 @@ impl JoinOps {
             ));
         }
 
-        // Build hash maps for efficient lookups
-        let left_keys = Self::build_key_map(left, &left_on)?;
-        let right_keys = Self::build_key_map(right, &right_on)?;
-
-        // Perform the join based on type
+        // Match rows through key codes, then build each output column from the matched row indices
         match join_type {
-            JoinType::Inner => Self::inner_join_impl(left, right, &left_keys, &right_keys, &left_on, &right_on),
-            JoinType::Left => Self::left_join_impl(left, right, &left_keys, &right_keys, &left_on, &right_on),
-            JoinType::Right => Self::right_join_impl(left, right, &left_keys, &right_keys, &left_on, &right_on),
-            JoinType::Outer => Self::outer_join_impl(left, right, &left_keys, &right_keys, &left_on, &right_on),
-        }
-    }
-
-    // Build a hash map of keys to row indices
-    fn build_key_map(frame: &TinyFrame, columns: &[String]) -> PyResult<HashMap<Vec<ValueEnum>, Vec<usize>>> {
-        let mut key_map: HashMap<Vec<ValueEnum>, Vec<usize>> = HashMap::new();
-
-        for row_idx in 0..frame.length {
-            let mut key = Vec::new();
-            for col_name in columns {
-                let col = frame.columns.get(col_name).unwrap();
-                if let Some(value) = Self::get_value_at_index(col, row_idx) {
-                    key.push(value);
-                } else {
-                    // Skip rows with null values in join columns
-                    continue;
+            JoinType::Inner => {
+                let merged = match strategy {
+                    JoinStrategy::Hash => None,
+                    JoinStrategy::SortMerge => Self::merge_rows(left, &left_on, right, &right_on, false),
+                    JoinStrategy::Auto => Self::merge_rows(left, &left_on, right, &right_on, true),
+                };
+                let (left_idx, right_idx) =
+                    merged.unwrap_or_else(|| Self::hash_inner_rows(left, &left_on, right, &right_on));
+                Self::inner_join_impl(left, right, &left_idx, &right_idx, &left_on, &right_on)
+            }
+            JoinType::Left => {
+                let (left_idx, right_idx) = Self::match_rows(left, &left_on, right, &right_on, true);
+                Self::left_join_impl(left, right, &left_idx, &right_idx, &right_on)
+            }
+            JoinType::Right => {
+                let (right_idx, left_idx) = Self::match_rows(right, &right_on, left, &left_on, true);
+                Self::right_join_impl(left, right, &left_idx, &right_idx, &left_on)
+            }
+            JoinType::Outer => {
+                let (mut left_idx, mut right_idx) = Self::match_rows(left, &left_on, right, &right_on, true);
+                // Right rows that matched nothing are appended after the left join
+                let mut matched = vec![false; right.length];
+                for &row in right_idx.iter().flatten() {
+                    matched[row] = true;
+                }
+                for (row, _) in matched.iter().enumerate().filter(|(_, &m)| !m) {
+                    left_idx.push(None);
+                    right_idx.push(Some(row));
+                }
+                Self::outer_join_impl(left, right, &left_idx, &right_idx)
+            }
+        }
+    }
+
+    // Pair each probe row with the build rows sharing its key: probe rows come
+    // out in order, each followed by its matches in build row order. Rows with
+    // a null key never match; unmatched probe rows are kept paired with None
+    // when `keep_unmatched` is set.
+    fn match_rows(
+        probe: &TinyFrame,
+        probe_on: &[String],
+        build: &TinyFrame,
+        build_on: &[String],
+        keep_unmatched: bool,
+    ) -> (Vec<Option<usize>>, Vec<Option<usize>>) {
+        let table = Self::build_table(build, build_on);
+        let probe_codes = Self::probe_codes(&table, probe, probe_on);
+        let (build_rows, offsets) = (&table.rows, &table.offsets);
+
+        // Probe the rows of one contiguous stripe, `start` being its first row
+        let probe_stripe = |start: usize, codes: &[Option<u32>]| {
+            let mut probe_idx = Vec::with_capacity(codes.len());
+            let mut build_idx = Vec::with_capacity(codes.len());
+            for (offset, code) in codes.iter().enumerate() {
+                let row = start + offset;
+                match code {
+                    Some(code) => {
+                        for &build_row in &build_rows[offsets[*code as usize]..offsets[*code as usize + 1]] {
+                            probe_idx.push(Some(row));
+                            build_idx.push(Some(build_row));
+                        }
+                    }
+                    None if keep_unmatched => {
+                        probe_idx.push(Some(row));
+                        build_idx.push(None);
+                    }
+                    None => {}
                 }
             }
-            key_map.entry(key).or_insert_with(Vec::new).push(row_idx);
+            (probe_idx, build_idx)
+        };
+
+        if probe_codes.len() < PARALLEL_MIN_PROBE_ROWS {
+            return probe_stripe(0, &probe_codes);
+        }
+
+        // The build layout is read-only, so stripes are probed independently
+        // and their pairs concatenated in stripe order
+        let stripes: Vec<(Vec<Option<usize>>, Vec<Option<usize>>)> = probe_codes
+            .par_chunks(PROBE_STRIPE_ROWS)
+            .enumerate()
+            .map(|(i, codes)| probe_stripe(i * PROBE_STRIPE_ROWS, codes))
+            .collect();
+        let total: usize = stripes.iter().map(|(p, _)| p.len()).sum();
+        let mut probe_idx = Vec::with_capacity(total);
+        let mut build_idx = Vec::with_capacity(total);
+        for (p, b) in stripes {
+            probe_idx.extend(p);
+            build_idx.extend(b);
+        }
+        (probe_idx, build_idx)
+    }
+
+    // Inner join pairs from a hash table built on the smaller side. Building
+    // on the left yields pairs in right row order; a counting sort on the
+    // left index restores left row order, with each left row's matches still
+    // in right row order, exactly as probing with the left side gives.
+    fn hash_inner_rows(
+        left: &TinyFrame,
+        left_on: &[String],
+        right: &TinyFrame,
+        right_on: &[String],
+    ) -> (Vec<Option<usize>>, Vec<Option<usize>>) {
+        if right.length <= left.length {
+            return Self::match_rows(left, left_on, right, right_on, false);
+        }
+
+        let (right_idx, left_idx) = Self::match_rows(right, right_on, left, left_on, false);
+        let mut starts = vec![0usize; left.length + 1];
+        for &row in left_idx.iter().flatten() {
+            starts[row + 1] += 1;
+        }
+        for row in 0..left.length {
+            starts[row + 1] += starts[row];
+        }
+        let mut order = vec![0usize; left_idx.len()];
+        for (pair, &row) in left_idx.iter().enumerate() {
+            if let Some(row) = row {
+                order[starts[row]] = pair;
+                starts[row] += 1;
+            }
+        }
+        (
+            order.iter().map(|&pair| left_idx[pair]).collect(),
+            order.iter().map(|&pair| right_idx[pair]).collect(),
+        )
+    }
+
+    // Sort-merge inner join on a single integer or string key. Rows come out
+    // in key order, ties in left then right row order, which is left row
+    // order when the left side is already sorted. Returns None when the keys
+    // do not support it, or, with `require_sorted`, when either side is not
+    // already in ascending key order.
+    fn merge_rows(
+        left: &TinyFrame,
+        left_on: &[String],
+        right: &TinyFrame,
+        right_on: &[String],
+        require_sorted: bool,
+    ) -> Option<(Vec<Option<usize>>, Vec<Option<usize>>)> {
+        let (left_col, right_col) = match (left_on, right_on) {
+            ([l], [r]) => (left.columns.get(l)?, right.columns.get(r)?),
+            _ => return None,
+        };
+        // Checked on the column buffers first, so an unsorted side bails
+        // out before any keys are gathered
+        let (left_sorted, right_sorted) = (keys_ascending(left_col), keys_ascending(right_col));
+        if require_sorted && !(left_sorted && right_sorted) {
+            return None;
+        }
+        let int_key = |col: &TinyColumn| matches!(col, TinyColumn::Int(_) | TinyColumn::OptInt(_));
+        let str_key = |col: &TinyColumn| matches!(col, TinyColumn::Str(_) | TinyColumn::OptStr(_));
+        match (left_col, right_col) {
+            (l, r) if int_key(l) && int_key(r) => Some(merge_sorted_keys(
+                &Self::int_keys(l)?,
+                &Self::int_keys(r)?,
+                left_sorted,
+                right_sorted,
+            )),
+            (l, r) if str_key(l) && str_key(r) => Some(merge_sorted_keys(
+                &Self::str_keys(l)?,
+                &Self::str_keys(r)?,
+                left_sorted,
+                right_sorted,
+            )),
+            _ => None,
+        }
+    }
+
+    // Dictionary-encode the build side's keys and group its rows by code.
+    // Single integer or string keys are hashed directly; other keys go
+    // through a row of ValueEnums. Null keys get no code.
+    fn build_table(build: &TinyFrame, build_on: &[String]) -> BuildTable {
+        let key_columns: Vec<&TinyColumn> = build_on.iter().map(|c| build.columns.get(c).unwrap()).collect();
+
+        let single = match key_columns.as_slice() {
+            [col] => Some(*col),
+            _ => None,
+        };
+        let (dictionary, codes) = if let Some(keys) = single.and_then(Self::int_keys) {
+            let mut dictionary = KeyMap::with_capacity_and_hasher(keys.len(), Default::default());
+            let codes = assign_codes(keys.iter().map(Option::as_ref), &mut dictionary);
+            (KeyDictionary::Int(dictionary), codes)
+        } else if let Some(keys) = single.and_then(Self::float_keys) {
+            let mut dictionary = KeyMap::with_capacity_and_hasher(keys.len(), Default::default());
+            let codes = assign_codes(keys.iter().map(Option::as_ref), &mut dictionary);
+            (KeyDictionary::Float(dictionary), codes)
+        } else if let Some(keys) = single.and_then(Self::str_keys) {
+            let mut dictionary = KeyMap::with_capacity_and_hasher(keys.len(), Default::default());
+            let codes = assign_codes(keys.into_iter(), &mut dictionary);
+            (KeyDictionary::Str(dictionary), codes)
+        } else {
+            let keys = Self::row_keys(build.length, &key_columns);
+            let mut dictionary = KeyMap::with_capacity_and_hasher(keys.len(), Default::default());
+            let codes = assign_codes(keys.iter().map(|key| key.as_deref()), &mut dictionary);
+            (KeyDictionary::Row(dictionary), codes)
+        };
+
+        let n_codes = match &dictionary {
+            KeyDictionary::Int(d) => d.len(),
+            KeyDictionary::Float(d) => d.len(),
+            KeyDictionary::Str(d) => d.len(),
+            KeyDictionary::Row(d) => d.len(),
+        };
+        let mut offsets = vec![0usize; n_codes + 1];
+        for &code in codes.iter().flatten() {
+            offsets[code as usize + 1] += 1;
+        }
+        for c in 0..n_codes {
+            offsets[c + 1] += offsets[c];
+        }
+        let mut rows = vec![0usize; offsets[n_codes]];
+        let mut cursor = offsets.clone();
+        for (row, code) in codes.iter().enumerate() {
+            if let Some(code) = code {
+                rows[cursor[*code as usize]] = row;
+                cursor[*code as usize] += 1;
+            }
         }
 
-        Ok(key_map)
+        BuildTable {
+            dictionary,
+            offsets,
+            rows,
+        }
+    }
+
+    // Look each probe row's key up in the build dictionary. Null keys, and
+    // keys absent from the build side, get None.
+    fn probe_codes(table: &BuildTable, probe: &TinyFrame, probe_on: &[String]) -> Vec<Option<u32>> {
+        let key_columns: Vec<&TinyColumn> = probe_on.iter().map(|c| probe.columns.get(c).unwrap()).collect();
+        let single = match key_columns.as_slice() {
+            [col] => Some(*col),
+            _ => None,
+        };
+
+        match &table.dictionary {
+            KeyDictionary::Int(d) => match single.and_then(Self::int_keys) {
+                Some(keys) => lookup_codes(keys.iter().map(Option::as_ref), d),
+                None => Self::row_keys(probe.length, &key_columns).iter()
+                    .map(|key| match key.as_deref() {
+                        Some([ValueEnum::Int(x)]) => d.get(x).copied(),
+                        _ => None,
+                    })
+                    .collect(),
+            },
+            KeyDictionary::Float(d) => match single.and_then(Self::float_keys) {
+                Some(keys) => lookup_codes(keys.iter().map(Option::as_ref), d),
+                None => Self::row_keys(probe.length, &key_columns).iter()
+                    .map(|key| match key.as_deref() {
+                        Some([ValueEnum::Float(x)]) => float_key(*x).and_then(|bits| d.get(&bits).copied()),
+                        _ => None,
+                    })
+                    .collect(),
+            },
+            KeyDictionary::Str(d) => match single.and_then(Self::str_keys) {
+                Some(keys) => lookup_codes(keys.into_iter(), d),
+                None => Self::row_keys(probe.length, &key_columns).iter()
+                    .map(|key| match key.as_deref() {
+                        Some([ValueEnum::Str(s)]) => d.get(s.as_str()).copied(),
+                        _ => None,
+                    })
+                    .collect(),
+            },
+            KeyDictionary::Row(d) => {
+                let keys = Self::row_keys(probe.length, &key_columns);
+                lookup_codes(keys.iter().map(|key| key.as_deref()), d)
+            }
+        }
+    }
+
+    // Key of each row as a row of ValueEnums, None when any part is null.
+    // Rows with a null part are found up front from the key columns'
+    // validity, so only complete keys are assembled.
+    fn row_keys(length: usize, cols: &[&TinyColumn]) -> Vec<Option<Vec<ValueEnum>>> {
+        let mut keys = vec![None; length];
+        for (w, &word) in valid_key_rows(cols, length).iter().enumerate() {
+            let mut word = word;
+            while word != 0 {
+                let row = w * 64 + word.trailing_zeros() as usize;
+                keys[row] = cols.iter().map(|col| Self::get_value_at_index(col, row)).collect();
+                word &= word - 1;
+            }
+        }
+        keys
+    }
+
+    fn int_keys(col: &TinyColumn) -> Option<Vec<Option<i64>>> {
+        match col {
+            TinyColumn::Int(v) => Some(v.iter().map(|&x| Some(x)).collect()),
+            TinyColumn::OptInt(v) => Some(v.clone()),
+            _ => None,
+        }
+    }
+
+    fn float_keys(col: &TinyColumn) -> Option<Vec<Option<u64>>> {
+        match col {
+            TinyColumn::Float(v) => Some(v.iter().map(|&x| float_key(x)).collect()),
+            TinyColumn::OptFloat(v) => Some(v.iter().map(|x| x.and_then(float_key)).collect()),
+            _ => None,
+        }
+    }
+
+    fn str_keys(col: &TinyColumn) -> Option<Vec<Option<&str>>> {
+        match col {
+            TinyColumn::Str(v) => Some(v.iter().map(|s| Some(s.as_str())).collect()),
+            TinyColumn::OptStr(v) => Some(v.iter().map(|s| s.as_deref()).collect()),
+            _ => None,
+        }
     }
 
     // Get value at specific index from a column
@@ -137,87 +536,41 @@ impl JoinOps {
         }
     }
 
+
     // Inner join implementation
     fn inner_join_impl(
         left: &TinyFrame,
         right: &TinyFrame,
-        left_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        right_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
+        left_idx: &[Option<usize>],
+        right_idx: &[Option<usize>],
         left_on: &[String],
         right_on: &[String],
     ) -> PyResult<TinyFrame> {
         let mut result_columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut result_length = 0;
 
         // Add left columns (excluding join columns)
         for (col_name, col_data) in &left.columns {
             if !left_on.contains(col_name) {
-                let mut new_col = Self::create_empty_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
+                result_columns.insert(col_name.clone(), Self::take_column(col_data, left_idx, false));
             }
         }
 
         // Add right columns (excluding join columns)
         for (col_name, col_data) in &right.columns {
             if !right_on.contains(col_name) {
-                let mut new_col = Self::create_empty_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
+                result_columns.insert(col_name.clone(), Self::take_column(col_data, right_idx, false));
             }
         }
 
         // Add join columns (from left)
         for col_name in left_on {
             let col_data = left.columns.get(col_name).unwrap();
-            let mut new_col = Self::create_empty_column(col_data)?;
-            result_columns.insert(col_name.clone(), new_col);
-        }
-
-        // Perform the join
-        for (key, left_indices) in left_keys {
-            if let Some(right_indices) = right_keys.get(key) {
-                for &left_idx in left_indices {
-                    for &right_idx in right_indices {
-                        // Add left row data
-                        for (col_name, col_data) in &left.columns {
-                            if !left_on.contains(col_name) {
-                                Self::append_value_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                    left_idx,
-                                )?;
-                            }
-                        }
-
-                        // Add right row data
-                        for (col_name, col_data) in &right.columns {
-                            if !right_on.contains(col_name) {
-                                Self::append_value_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                    right_idx,
-                                )?;
-                            }
-                        }
-
-                        // Add join key values
-                        for (i, col_name) in left_on.iter().enumerate() {
-                            let left_col = left.columns.get(col_name).unwrap();
-                            Self::append_value_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                left_col,
-                                left_idx,
-                            )?;
-                        }
-
-                        result_length += 1;
-                    }
-                }
-            }
+            result_columns.insert(col_name.clone(), Self::take_column(col_data, left_idx, false));
         }
 
         Ok(TinyFrame {
             columns: result_columns,
-            length: result_length,
+            length: left_idx.len(),
             py_objects: left.py_objects.clone(),
         })
     }
@@ -226,87 +579,27 @@ impl JoinOps {
     fn left_join_impl(
         left: &TinyFrame,
         right: &TinyFrame,
-        left_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        right_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        left_on: &[String],
+        left_idx: &[Option<usize>],
+        right_idx: &[Option<usize>],
         right_on: &[String],
     ) -> PyResult<TinyFrame> {
         let mut result_columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut result_length = 0;
 
         // Add left columns
         for (col_name, col_data) in &left.columns {
-            let mut new_col = Self::create_empty_column(col_data)?;
-            result_columns.insert(col_name.clone(), new_col);
+            result_columns.insert(col_name.clone(), Self::take_column(col_data, left_idx, false));
         }
 
         // Add right columns (excluding join columns) as optional
         for (col_name, col_data) in &right.columns {
             if !right_on.contains(col_name) {
-                let new_col = Self::create_optional_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
-            }
-        }
-
-        // Perform the join
-        for (key, left_indices) in left_keys {
-            if let Some(right_indices) = right_keys.get(key) {
-                // Matching rows
-                for &left_idx in left_indices {
-                    for &right_idx in right_indices {
-                        // Add left row data
-                        for (col_name, col_data) in &left.columns {
-                            Self::append_value_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                                left_idx,
-                            )?;
-                        }
-
-                        // Add right row data
-                        for (col_name, col_data) in &right.columns {
-                            if !right_on.contains(col_name) {
-                                Self::append_value_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                    right_idx,
-                                )?;
-                            }
-                        }
-
-                        result_length += 1;
-                    }
-                }
-            } else {
-                // Non-matching left rows (with nulls for right columns)
-                for &left_idx in left_indices {
-                    // Add left row data
-                    for (col_name, col_data) in &left.columns {
-                        Self::append_value_to_column(
-                            result_columns.get_mut(col_name).unwrap(),
-                            col_data,
-                            left_idx,
-                        )?;
-                    }
-
-                    // Add null values for right columns
-                    for (col_name, col_data) in &right.columns {
-                        if !right_on.contains(col_name) {
-                            Self::append_null_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                            )?;
-                        }
-                    }
-
-                    result_length += 1;
-                }
+                result_columns.insert(col_name.clone(), Self::take_column(col_data, right_idx, true));
             }
         }
 
         Ok(TinyFrame {
             columns: result_columns,
-            length: result_length,
+            length: left_idx.len(),
             py_objects: left.py_objects.clone(),
         })
     }
@@ -315,87 +608,27 @@ impl JoinOps {
     fn right_join_impl(
         left: &TinyFrame,
         right: &TinyFrame,
-        left_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        right_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
+        left_idx: &[Option<usize>],
+        right_idx: &[Option<usize>],
         left_on: &[String],
-        right_on: &[String],
     ) -> PyResult<TinyFrame> {
         let mut result_columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut result_length = 0;
 
         // Add left columns (excluding join columns) as optional
         for (col_name, col_data) in &left.columns {
             if !left_on.contains(col_name) {
-                let new_col = Self::create_optional_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
+                result_columns.insert(col_name.clone(), Self::take_column(col_data, left_idx, true));
             }
         }
 
         // Add right columns
         for (col_name, col_data) in &right.columns {
-            let mut new_col = Self::create_empty_column(col_data)?;
-            result_columns.insert(col_name.clone(), new_col);
-        }
-
-        // Perform the join
-        for (key, right_indices) in right_keys {
-            if let Some(left_indices) = left_keys.get(key) {
-                // Matching rows
-                for &left_idx in left_indices {
-                    for &right_idx in right_indices {
-                        // Add left row data
-                        for (col_name, col_data) in &left.columns {
-                            if !left_on.contains(col_name) {
-                                Self::append_value_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                    left_idx,
-                                )?;
-                            }
-                        }
-
-                        // Add right row data
-                        for (col_name, col_data) in &right.columns {
-                            Self::append_value_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                                right_idx,
-                            )?;
-                        }
-
-                        result_length += 1;
-                    }
-                }
-            } else {
-                // Non-matching right rows (with nulls for left columns)
-                for &right_idx in right_indices {
-                    // Add null values for left columns
-                    for (col_name, col_data) in &left.columns {
-                        if !left_on.contains(col_name) {
-                            Self::append_null_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                            )?;
-                        }
-                    }
-
-                    // Add right row data
-                    for (col_name, col_data) in &right.columns {
-                        Self::append_value_to_column(
-                            result_columns.get_mut(col_name).unwrap(),
-                            col_data,
-                            right_idx,
-                        )?;
-                    }
-
-                    result_length += 1;
-                }
-            }
+            result_columns.insert(col_name.clone(), Self::take_column(col_data, right_idx, false));
         }
 
         Ok(TinyFrame {
             columns: result_columns,
-            length: result_length,
+            length: right_idx.len(),
             py_objects: right.py_objects.clone(),
         })
     }
@@ -404,309 +637,105 @@ impl JoinOps {
     fn outer_join_impl(
         left: &TinyFrame,
         right: &TinyFrame,
-        left_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        right_keys: &HashMap<Vec<ValueEnum>, Vec<usize>>,
-        left_on: &[String],
-        right_on: &[String],
+        left_idx: &[Option<usize>],
+        right_idx: &[Option<usize>],
     ) -> PyResult<TinyFrame> {
         let mut result_columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut result_length = 0;
 
-        // Add all columns from both frames as optional
+        // Add all columns from both frames as optional. A column present in
+        // both, such as a shared join key, takes the left value when the row
+        // has a left side and the right value otherwise.
         for (col_name, col_data) in &left.columns {
-            let new_col = Self::create_optional_column(col_data)?;
+            let new_col = match right.columns.get(col_name) {
+                Some(right_data) => Self::coalesce_column(col_data, left_idx, right_data, right_idx)?,
+                None => Self::take_column(col_data, left_idx, true),
+            };
             result_columns.insert(col_name.clone(), new_col);
         }
 
         for (col_name, col_data) in &right.columns {
             if !result_columns.contains_key(col_name) {
-                let new_col = Self::create_optional_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
-            }
-        }
-
-        // Collect all unique keys
-        let mut all_keys = left_keys.keys().cloned().collect::<std::collections::HashSet<_>>();
-        all_keys.extend(right_keys.keys().cloned());
-
-        // Perform the join
-        for key in all_keys {
-            let left_indices = left_keys.get(&key);
-            let right_indices = right_keys.get(&key);
-
-            match (left_indices, right_indices) {
-                (Some(left_idxs), Some(right_idxs)) => {
-                    // Both sides have matching keys
-                    for &left_idx in left_idxs {
-                        for &right_idx in right_idxs {
-                            // Add left row data
-                            for (col_name, col_data) in &left.columns {
-                                Self::append_value_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                    left_idx,
-                                )?;
-                            }
-
-                            // Add right row data
-                            for (col_name, col_data) in &right.columns {
-                                if !left.columns.contains_key(col_name) {
-                                    Self::append_value_to_column(
-                                        result_columns.get_mut(col_name).unwrap(),
-                                        col_data,
-                                        right_idx,
-                                    )?;
-                                }
-                            }
-
-                            result_length += 1;
-                        }
-                    }
-                }
-                (Some(left_idxs), None) => {
-                    // Only left side has this key
-                    for &left_idx in left_idxs {
-                        // Add left row data
-                        for (col_name, col_data) in &left.columns {
-                            Self::append_value_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                                left_idx,
-                            )?;
-                        }
-
-                        // Add null values for right columns
-                        for (col_name, col_data) in &right.columns {
-                            if !left.columns.contains_key(col_name) {
-                                Self::append_null_to_column(
-                                    result_columns.get_mut(col_name).unwrap(),
-                                    col_data,
-                                )?;
-                            }
-                        }
-
-                        result_length += 1;
-                    }
-                }
-                (None, Some(right_idxs)) => {
-                    // Only right side has this key
-                    for &right_idx in right_idxs {
-                        // Add null values for left columns
-                        for (col_name, col_data) in &left.columns {
-                            Self::append_null_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                            )?;
-                        }
-
-                        // Add right row data
-                        for (col_name, col_data) in &right.columns {
-                            Self::append_value_to_column(
-                                result_columns.get_mut(col_name).unwrap(),
-                                col_data,
-                                right_idx,
-                            )?;
-                        }
-
-                        result_length += 1;
-                    }
-                }
-                (None, None) => unreachable!(),
+                result_columns.insert(col_name.clone(), Self::take_column(col_data, right_idx, true));
             }
         }
 
         Ok(TinyFrame {
             columns: result_columns,
-            length: result_length,
+            length: left_idx.len(),
             py_objects: left.py_objects.clone(),
         })
     }
 
-    // Helper methods
-    fn create_empty_column(col: &TinyColumn) -> PyResult<TinyColumn> {
-        match col {
-            TinyColumn::Int(_) => Ok(TinyColumn::Int(Vec::new())),
-            TinyColumn::Float(_) => Ok(TinyColumn::Float(Vec::new())),
-            TinyColumn::Str(_) => Ok(TinyColumn::Str(Vec::new())),
-            TinyColumn::Bool(_) => Ok(TinyColumn::Bool(Vec::new())),
-            TinyColumn::PyObject(_) => Ok(TinyColumn::PyObject(Vec::new())),
-            TinyColumn::Mixed(_) => Ok(TinyColumn::Mixed(Vec::new())),
-            TinyColumn::OptInt(_) => Ok(TinyColumn::OptInt(Vec::new())),
-            TinyColumn::OptFloat(_) => Ok(TinyColumn::OptFloat(Vec::new())),
-            TinyColumn::OptStr(_) => Ok(TinyColumn::OptStr(Vec::new())),
-            TinyColumn::OptBool(_) => Ok(TinyColumn::OptBool(Vec::new())),
-            TinyColumn::OptPyObject(_) => Ok(TinyColumn::OptPyObject(Vec::new())),
-            TinyColumn::OptMixed(_) => Ok(TinyColumn::OptMixed(Vec::new())),
-        }
-    }
-
-    fn create_optional_column(col: &TinyColumn) -> PyResult<TinyColumn> {
-        match col {
-            TinyColumn::Int(_) => Ok(TinyColumn::OptInt(Vec::new())),
-            TinyColumn::Float(_) => Ok(TinyColumn::OptFloat(Vec::new())),
-            TinyColumn::Str(_) => Ok(TinyColumn::OptStr(Vec::new())),
-            TinyColumn::Bool(_) => Ok(TinyColumn::OptBool(Vec::new())),
-            TinyColumn::PyObject(_) => Ok(TinyColumn::OptPyObject(Vec::new())),
-            TinyColumn::Mixed(_) => Ok(TinyColumn::OptMixed(Vec::new())),
-            TinyColumn::OptInt(_) => Ok(TinyColumn::OptInt(Vec::new())),
-            TinyColumn::OptFloat(_) => Ok(TinyColumn::OptFloat(Vec::new())),
-            TinyColumn::OptStr(_) => Ok(TinyColumn::OptStr(Vec::new())),
-            TinyColumn::OptBool(_) => Ok(TinyColumn::OptBool(Vec::new())),
-            TinyColumn::OptPyObject(_) => Ok(TinyColumn::OptPyObject(Vec::new())),
-            TinyColumn::OptMixed(_) => Ok(TinyColumn::OptMixed(Vec::new())),
-        }
-    }
-
-    fn append_value_to_column(col: &mut TinyColumn, source_col: &TinyColumn, source_idx: usize) -> PyResult<()> {
-        match (col, source_col) {
-            (TinyColumn::Int(target), TinyColumn::Int(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::Float(target), TinyColumn::Float(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::Str(target), TinyColumn::Str(source)) => {
-                target.push(source[source_idx].clone());
-            }
-            (TinyColumn::Bool(target), TinyColumn::Bool(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::PyObject(target), TinyColumn::PyObject(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::Mixed(target), TinyColumn::Mixed(source)) => {
-                target.push(source[source_idx].clone());
-            }
-            (TinyColumn::OptInt(target), TinyColumn::OptInt(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::OptFloat(target), TinyColumn::OptFloat(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::OptStr(target), TinyColumn::OptStr(source)) => {
-                target.push(source[source_idx].clone());
-            }
-            (TinyColumn::OptBool(target), TinyColumn::OptBool(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::OptPyObject(target), TinyColumn::OptPyObject(source)) => {
-                target.push(source[source_idx]);
-            }
-            (TinyColumn::OptMixed(target), TinyColumn::OptMixed(source)) => {
-                target.push(source[source_idx].clone());
-            }
-            // Handle appending from non-optional to optional columns
-            (TinyColumn::OptInt(target), TinyColumn::Int(source)) => {
-                target.push(Some(source[source_idx]));
-            }
-            (TinyColumn::OptFloat(target), TinyColumn::Float(source)) => {
-                target.push(Some(source[source_idx]));
-            }
-            (TinyColumn::OptStr(target), TinyColumn::Str(source)) => {
-                target.push(Some(source[source_idx].clone()));
-            }
-            (TinyColumn::OptBool(target), TinyColumn::Bool(source)) => {
-                target.push(Some(source[source_idx]));
-            }
-            (TinyColumn::OptPyObject(target), TinyColumn::PyObject(source)) => {
-                target.push(Some(source[source_idx]));
-            }
-            (TinyColumn::OptMixed(target), TinyColumn::Mixed(source)) => {
-                target.push(Some(source[source_idx].clone()));
-            }
-            _ => {
-                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                    "Column type mismatch in join operation"
-                ));
-            }
+    // Gather the `source` rows listed in `indices` into a new column in one
+    // pass; None entries become nulls. The column is nullable when `optional`
+    // is set or any entry is None.
+    fn take_column(source: &TinyColumn, indices: &[Option<usize>], optional: bool) -> TinyColumn {
+        let nullable = optional || indices.iter().any(Option::is_none);
+        match source {
+            TinyColumn::Int(v) if nullable => TinyColumn::OptInt(take_optional(v, indices)),
+            TinyColumn::Int(v) => TinyColumn::Int(take_values(v, indices)),
+            TinyColumn::Float(v) if nullable => TinyColumn::OptFloat(take_optional(v, indices)),
+            TinyColumn::Float(v) => TinyColumn::Float(take_values(v, indices)),
+            TinyColumn::Str(v) if nullable => TinyColumn::OptStr(take_optional(v, indices)),
+            TinyColumn::Str(v) => TinyColumn::Str(take_values(v, indices)),
+            TinyColumn::Bool(v) if nullable => TinyColumn::OptBool(take_optional(v, indices)),
+            TinyColumn::Bool(v) => TinyColumn::Bool(take_values(v, indices)),
+            TinyColumn::PyObject(v) if nullable => TinyColumn::OptPyObject(take_optional(v, indices)),
+            TinyColumn::PyObject(v) => TinyColumn::PyObject(take_values(v, indices)),
+            TinyColumn::Mixed(v) if nullable => TinyColumn::OptMixed(take_optional(v, indices)),
+            TinyColumn::Mixed(v) => TinyColumn::Mixed(take_values(v, indices)),
+            TinyColumn::OptInt(v) => TinyColumn::OptInt(take_nullable(v, indices)),
+            TinyColumn::OptFloat(v) => TinyColumn::OptFloat(take_nullable(v, indices)),
+            TinyColumn::OptStr(v) => TinyColumn::OptStr(take_nullable(v, indices)),
+            TinyColumn::OptBool(v) => TinyColumn::OptBool(take_nullable(v, indices)),
+            TinyColumn::OptPyObject(v) => TinyColumn::OptPyObject(take_nullable(v, indices)),
+            TinyColumn::OptMixed(v) => TinyColumn::OptMixed(take_nullable(v, indices)),
         }
-        Ok(())
     }
 
-    fn append_null_to_column(col: &mut TinyColumn, source_col: &TinyColumn) -> PyResult<()> {
-        match col {
-            TinyColumn::OptInt(target) => {
-                target.push(None);
-            }
-            TinyColumn::OptFloat(target) => {
-                target.push(None);
-            }
-            TinyColumn::OptStr(target) => {
-                target.push(None);
-            }
-            TinyColumn::OptBool(target) => {
-                target.push(None);
-            }
-            TinyColumn::OptPyObject(target) => {
-                target.push(None);
-            }
-            TinyColumn::OptMixed(target) => {
-                target.push(None);
-            }
-            // Convert non-optional columns to optional when needed
-            TinyColumn::Int(target) => {
-                // Convert to OptInt
-                let mut opt_vec = Vec::new();
-                for &val in target.iter() {
-                    opt_vec.push(Some(val));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptInt(opt_vec);
-            }
-            TinyColumn::Float(target) => {
-                // Convert to OptFloat
-                let mut opt_vec = Vec::new();
-                for &val in target.iter() {
-                    opt_vec.push(Some(val));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptFloat(opt_vec);
-            }
-            TinyColumn::Str(target) => {
-                // Convert to OptStr
-                let mut opt_vec = Vec::new();
-                for val in target.iter() {
-                    opt_vec.push(Some(val.clone()));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptStr(opt_vec);
-            }
-            TinyColumn::Bool(target) => {
-                // Convert to OptBool
-                let mut opt_vec = Vec::new();
-                for &val in target.iter() {
-                    opt_vec.push(Some(val));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptBool(opt_vec);
-            }
-            TinyColumn::PyObject(target) => {
-                // Convert to OptPyObject
-                let mut opt_vec = Vec::new();
-                for &val in target.iter() {
-                    opt_vec.push(Some(val));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptPyObject(opt_vec);
-            }
-            TinyColumn::Mixed(target) => {
-                // Convert to OptMixed
-                let mut opt_vec = Vec::new();
-                for val in target.iter() {
-                    opt_vec.push(Some(val.clone()));
-                }
-                opt_vec.push(None);
-                *col = TinyColumn::OptMixed(opt_vec);
-            }
-            _ => {
-                // For any other column types, just push None to the existing column
-                // This handles cases where we can't convert to optional
-                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                    "Cannot append null to this column type"
-                ));
-            }
+    // Column of `source` with every value repeated `each` times in place and
+    // the whole sequence repeated `times` times
+    fn repeat_column(source: &TinyColumn, each: usize, times: usize) -> TinyColumn {
+        match source {
+            TinyColumn::Int(v) => TinyColumn::Int(repeat_values(v, each, times)),
+            TinyColumn::Float(v) => TinyColumn::Float(repeat_values(v, each, times)),
+            TinyColumn::Str(v) => TinyColumn::Str(repeat_values(v, each, times)),
+            TinyColumn::Bool(v) => TinyColumn::Bool(repeat_values(v, each, times)),
+            TinyColumn::PyObject(v) => TinyColumn::PyObject(repeat_values(v, each, times)),
+            TinyColumn::Mixed(v) => TinyColumn::Mixed(repeat_values(v, each, times)),
+            TinyColumn::OptInt(v) => TinyColumn::OptInt(repeat_values(v, each, times)),
+            TinyColumn::OptFloat(v) => TinyColumn::OptFloat(repeat_values(v, each, times)),
+            TinyColumn::OptStr(v) => TinyColumn::OptStr(repeat_values(v, each, times)),
+            TinyColumn::OptBool(v) => TinyColumn::OptBool(repeat_values(v, each, times)),
+            TinyColumn::OptPyObject(v) => TinyColumn::OptPyObject(repeat_values(v, each, times)),
+            TinyColumn::OptMixed(v) => TinyColumn::OptMixed(repeat_values(v, each, times)),
+        }
+    }
+
+    // Build a nullable column taking each row from `left` when it has a left
+    // index and from `right` otherwise
+    fn coalesce_column(
+        left: &TinyColumn,
+        left_idx: &[Option<usize>],
+        right: &TinyColumn,
+        right_idx: &[Option<usize>],
+    ) -> PyResult<TinyColumn> {
+        let fill: Vec<Option<usize>> = left_idx
+            .iter()
+            .zip(right_idx)
+            .map(|(l, r)| if l.is_some() { None } else { *r })
+            .collect();
+        match (Self::take_column(left, left_idx, true), Self::take_column(right, &fill, true)) {
+            (TinyColumn::OptInt(a), TinyColumn::OptInt(b)) => Ok(TinyColumn::OptInt(coalesce(a, b))),
+            (TinyColumn::OptFloat(a), TinyColumn::OptFloat(b)) => Ok(TinyColumn::OptFloat(coalesce(a, b))),
+            (TinyColumn::OptStr(a), TinyColumn::OptStr(b)) => Ok(TinyColumn::OptStr(coalesce(a, b))),
+            (TinyColumn::OptBool(a), TinyColumn::OptBool(b)) => Ok(TinyColumn::OptBool(coalesce(a, b))),
+            (TinyColumn::OptPyObject(a), TinyColumn::OptPyObject(b)) => Ok(TinyColumn::OptPyObject(coalesce(a, b))),
+            (TinyColumn::OptMixed(a), TinyColumn::OptMixed(b)) => Ok(TinyColumn::OptMixed(coalesce(a, b))),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+                "Column type mismatch in join operation"
+            )),
         }
-        Ok(())
     }
 }
 
@@ -714,50 +743,203 @@ impl JoinOps {
 impl JoinOps {
     pub fn cross_join(left: &TinyFrame, right: &TinyFrame) -> PyResult<TinyFrame> {
         let mut result_columns: HashMap<String, TinyColumn> = HashMap::new();
-        let mut result_length = 0;
 
-        // Add all columns from both frames
+        // Every left row paired with every right row, left-major: each left
+        // value repeats once per right row and the right column is tiled once
+        // per left row, so both sides are copied straight from their buffers
+        // without materializing row indices
         for (col_name, col_data) in &left.columns {
-            let mut new_col = Self::create_empty_column(col_data)?;
-            result_columns.insert(col_name.clone(), new_col);
+            result_columns.insert(col_name.clone(), Self::repeat_column(col_data, right.length, 1));
         }
 
+        // Left wins on a name clash
         for (col_name, col_data) in &right.columns {
             if !result_columns.contains_key(col_name) {
-                let mut new_col = Self::create_empty_column(col_data)?;
-                result_columns.insert(col_name.clone(), new_col);
+                result_columns.insert(col_name.clone(), Self::repeat_column(col_data, 1, left.length));
             }
         }
 
-        // Perform cross join
-        for left_idx in 0..left.length {
-            for right_idx in 0..right.length {
-                // Add left row data
-                for (col_name, col_data) in &left.columns {
-                    Self::append_value_to_column(
-                        result_columns.get_mut(col_name).unwrap(),
-                        col_data,
-                        left_idx,
-                    )?;
-                }
+        Ok(TinyFrame {
+            columns: result_columns,
+            length: left.length * right.length,
+            py_objects: left.py_objects.clone(),
+        })
+    }
+}
 
-                // Add right row data
-                for (col_name, col_data) in &right.columns {
-                    Self::append_value_to_column(
-                        result_columns.get_mut(col_name).unwrap(),
-                        col_data,
-                        right_idx,
-                    )?;
-                }
+// Give every distinct key the next free code, in order of first appearance,
+// and return the code of each row. Null keys get None.
+fn assign_codes<'a, Q, K>(keys: impl Iterator<Item = Option<&'a Q>>, dictionary: &mut KeyMap<K>) -> Vec<Option<u32>>
+where
+    Q: Hash + Eq + ToOwned<Owned = K> + ?Sized + 'a,
+    K: Borrow<Q> + Hash + Eq,
+{
+    keys.map(|key| {
+        key.map(|key| match dictionary.get(key) {
+            Some(&code) => code,
+            None => {
+                let code = dictionary.len() as u32;
+                dictionary.insert(key.to_owned(), code);
+                code
+            }
+        })
+    })
+    .collect()
+}
+
+// Float join key as bits, with -0.0 folded into 0.0 so the two match as
+// they compare equal. NaN equals nothing, so it gets no key, like a null.
+#[inline]
+pub(crate) fn float_key(x: f64) -> Option<u64> {
+    if x.is_nan() { None } else { Some((x + 0.0).to_bits()) }
+}
+
+// Rows whose key columns are all non-null, 64 rows per word: the AND of
+// every nullable column's validity
+fn valid_key_rows(cols: &[&TinyColumn], length: usize) -> Vec<u64> {
+    let mut words = vec![u64::MAX; (length + 63) / 64];
+    if length % 64 != 0 {
+        if let Some(last) = words.last_mut() {
+            *last = (1u64 << (length % 64)) - 1;
+        }
+    }
+    for col in cols {
+        match col {
+            TinyColumn::OptInt(v) => and_validity(&mut words, v),
+            TinyColumn::OptFloat(v) => and_validity(&mut words, v),
+            TinyColumn::OptStr(v) => and_validity(&mut words, v),
+            TinyColumn::OptBool(v) => and_validity(&mut words, v),
+            TinyColumn::OptMixed(v) => and_validity(&mut words, v),
+            TinyColumn::OptPyObject(v) => and_validity(&mut words, v),
+            _ => {}
+        }
+    }
+    words
+}
 
-                result_length += 1;
+fn and_validity<T>(words: &mut [u64], values: &[Option<T>]) {
+    for (word, chunk) in words.iter_mut().zip(values.chunks(64)) {
+        let mut valid = 0u64;
+        for (bit, value) in chunk.iter().enumerate() {
+            valid |= (value.is_some() as u64) << bit;
+        }
+        *word &= valid;
+    }
+}
+
+// Code of each row's key in `dictionary`; None for null or unknown keys
+fn lookup_codes<'a, Q, K>(keys: impl Iterator<Item = Option<&'a Q>>, dictionary: &KeyMap<K>) -> Vec<Option<u32>>
+where
+    Q: Hash + Eq + ?Sized + 'a,
+    K: Borrow<Q> + Hash + Eq,
+{
+    keys.map(|key| key.and_then(|key| dictionary.get(key).copied())).collect()
+}
+
+// Merge two key columns with two cursors, emitting the cross product of
+// each run of equal keys. Null keys never match. A side flagged as sorted
+// is walked in row order without sorting.
+fn merge_sorted_keys<K: Ord>(
+    left: &[Option<K>],
+    right: &[Option<K>],
+    left_sorted: bool,
+    right_sorted: bool,
+) -> (Vec<Option<usize>>, Vec<Option<usize>>) {
+    let left_order = sorted_order(left, left_sorted);
+    let right_order = sorted_order(right, right_sorted);
+
+    let mut left_idx = Vec::new();
+    let mut right_idx = Vec::new();
+    let (mut i, mut j) = (0, 0);
+    while i < left_order.len() && j < right_order.len() {
+        let key = &left[left_order[i]];
+        match key.cmp(&right[right_order[j]]) {
+            std::cmp::Ordering::Less => i += 1,
+            std::cmp::Ordering::Greater => j += 1,
+            std::cmp::Ordering::Equal => {
+                let i_end = i + left_order[i..].iter().take_while(|&&row| left[row] == *key).count();
+                let j_end = j + right_order[j..].iter().take_while(|&&row| right[row] == *key).count();
+                for &l in &left_order[i..i_end] {
+                    for &r in &right_order[j..j_end] {
+                        left_idx.push(Some(l));
+                        right_idx.push(Some(r));
+                    }
+                }
+                i = i_end;
+                j = j_end;
             }
         }
+    }
+    (left_idx, right_idx)
+}
 
-        Ok(TinyFrame {
-            columns: result_columns,
-            length: result_length,
-            py_objects: left.py_objects.clone(),
-        })
+// Non-null rows in ascending key order, ties kept in row order; rows are
+// only sorted when `sorted` says they are not already in order
+fn sorted_order<K: Ord>(keys: &[Option<K>], sorted: bool) -> Vec<usize> {
+    let mut order: Vec<usize> = (0..keys.len()).filter(|&row| keys[row].is_some()).collect();
+    if !sorted {
+        order.sort_by(|&a, &b| keys[a].cmp(&keys[b]));
+    }
+    order
+}
+
+// Whether a single integer or string key column has its non-null values in
+// ascending order, stopping at the first descent. Other columns report false.
+fn keys_ascending(col: &TinyColumn) -> bool {
+    match col {
+        TinyColumn::Int(v) => v.windows(2).all(|w| w[0] <= w[1]),
+        TinyColumn::Str(v) => v.windows(2).all(|w| w[0] <= w[1]),
+        TinyColumn::OptInt(v) => ascending(v.iter().flatten()),
+        TinyColumn::OptStr(v) => ascending(v.iter().flatten()),
+        _ => false,
+    }
+}
+
+// Whether values arrive in ascending order, stopping at the first descent
+fn ascending<K: Ord>(mut values: impl Iterator<Item = K>) -> bool {
+    let mut prev = match values.next() {
+        Some(value) => value,
+        None => return true,
+    };
+    values.all(|value| {
+        let in_order = prev <= value;
+        prev = value;
+        in_order
+    })
+}
+
+// Gather rows that are all present
+fn take_values<T: Clone>(values: &[T], indices: &[Option<usize>]) -> Vec<T> {
+    indices.iter().flatten().map(|&idx| values[idx].clone()).collect()
+}
+
+// Repeat each value `each` times, then copy that run until it occurs
+// `times` times
+fn repeat_values<T: Clone>(values: &[T], each: usize, times: usize) -> Vec<T> {
+    if times == 0 {
+        return Vec::new();
     }
+    let mut out = Vec::with_capacity(values.len() * each * times);
+    for value in values {
+        out.extend(std::iter::repeat(value).take(each).cloned());
+    }
+    let run = out.len();
+    for _ in 1..times {
+        out.extend_from_within(..run);
+    }
+    out
+}
+
+// Gather rows into a nullable buffer, None entries becoming nulls
+fn take_optional<T: Clone>(values: &[T], indices: &[Option<usize>]) -> Vec<Option<T>> {
+    indices.iter().map(|idx| idx.map(|idx| values[idx].clone())).collect()
+}
+
+// Gather rows of a nullable buffer, None entries becoming nulls
+fn take_nullable<T: Clone>(values: &[Option<T>], indices: &[Option<usize>]) -> Vec<Option<T>> {
+    indices.iter().map(|idx| idx.and_then(|idx| values[idx].clone())).collect()
+}
+
+fn coalesce<T>(first: Vec<Option<T>>, second: Vec<Option<T>>) -> Vec<Option<T>> {
+    first.into_iter().zip(second).map(|(a, b)| a.or(b)).collect()
 }
@@ -149,8 +149,24 @@ fn init_logging_with_config(level: &str, log_memory: bool, log_performance: bool
 }
 
 #[pyfunction]
-fn log_operation(operation: &str, details: &str) {
-    crate::logging::log_operation(operation, details);
+fn is_logging_enabled(level: &str) -> bool {
+    crate::logging::LogLevel::parse(level).map_or(false, crate::logging::is_level_enabled)
+}
+
+/// `details` may be a string or a zero-argument callable returning one; the
+/// callable is only invoked when info-level logging is enabled.
+#[pyfunction]
+fn log_operation(operation: &str, details: &PyAny) -> PyResult<()> {
+    if !crate::logging::is_level_enabled(crate::logging::LogLevel::Info) {
+        return Ok(());
+    }
+    if details.is_callable() {
+        let message: String = details.call0()?.extract()?;
+        crate::logging::log_operation(operation, &message);
+    } else {
+        crate::logging::log_operation(operation, details.extract::<&str>()?);
+    }
+    Ok(())
 }
 
 #[pyfunction]
@@ -173,6 +189,16 @@ fn log_warning(operation: &str, warning: &str, context: Option<&str>) {
     crate::logging::log_warning(operation, warning, context);
 }
 
+/// Write out all buffered log records, from every thread.
+///
+/// Records sent to a terminal are written as they are logged, and errors
+/// and warnings always are; other records are batched until this is
+/// called, the batch fills up, or the interpreter exits.
+#[pyfunction]
+fn flush_logs() {
+    crate::logging::flush_logs();
+}
+
 // Debug function wrappers
 #[pyfunction]
 fn enable_debug() {
@@ -244,18 +270,22 @@ fn print_profiling_report() {
 }
 
 #[pymodule]
-fn feathertail(_py: Python, m: &PyModule) -> PyResult<()> {
+fn feathertail(py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<TinyFrame>()?;
     m.add_class::<TinyGroupBy>()?;
     
     // Add logging functions
     m.add_function(wrap_pyfunction!(init_logging, m)?)?;
     m.add_function(wrap_pyfunction!(init_logging_with_config, m)?)?;
+    m.add_function(wrap_pyfunction!(is_logging_enabled, m)?)?;
     m.add_function(wrap_pyfunction!(log_operation, m)?)?;
     m.add_function(wrap_pyfunction!(log_memory_usage, m)?)?;
     m.add_function(wrap_pyfunction!(log_performance, m)?)?;
     m.add_function(wrap_pyfunction!(log_error, m)?)?;
     m.add_function(wrap_pyfunction!(log_warning, m)?)?;
+    m.add_function(wrap_pyfunction!(flush_logs, m)?)?;
+    // Records still buffered would otherwise be lost at exit
+    py.import("atexit")?.call_method1("register", (m.getattr("flush_logs")?,))?;
     
     // Add debug functions
     m.add_function(wrap_pyfunction!(enable_debug, m)?)?;
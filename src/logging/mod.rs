@@ -1,5 +1,44 @@
 use pyo3::prelude::*;
 use std::collections::HashMap;
+use std::io::{IsTerminal, Write};
+use std::sync::atomic::{AtomicU8, Ordering};
+use std::sync::{Mutex, PoisonError};
+
+/// Environment variable read for the initial log level
+pub const LOG_LEVEL_ENV_VAR: &str = "FEATHERTAIL_LOG_LEVEL";
+
+/// Log levels ordered from least to most verbose
+#[derive(Clone, Copy, Debug, PartialEq, Eq, PartialOrd, Ord)]
+#[repr(u8)]
+pub enum LogLevel {
+    Error = 1,
+    Warn = 2,
+    Info = 3,
+    Debug = 4,
+    Trace = 5,
+}
+
+impl LogLevel {
+    /// Parse a level name, returning None for unknown names
+    pub fn parse(level: &str) -> Option<Self> {
+        match level {
+            "error" => Some(LogLevel::Error),
+            "warn" => Some(LogLevel::Warn),
+            "info" => Some(LogLevel::Info),
+            "debug" => Some(LogLevel::Debug),
+            "trace" => Some(LogLevel::Trace),
+            _ => None,
+        }
+    }
+}
+
+/// Level used when neither the config nor the environment names a valid one
+fn default_level_name() -> String {
+    std::env::var(LOG_LEVEL_ENV_VAR)
+        .ok()
+        .filter(|level| LogLevel::parse(level).is_some())
+        .unwrap_or_else(|| "info".to_string())
+}
 
 /// Simple logging configuration for feathertail
 pub struct LoggingConfig {
@@ -12,7 +51,7 @@ pub struct LoggingConfig {
 impl Default for LoggingConfig {
     fn default() -> Self {
         Self {
-            level: "info".to_string(),
+            level: default_level_name(),
             log_memory: false,
             log_performance: false,
             log_operations: false,
@@ -22,12 +61,90 @@ impl Default for LoggingConfig {
 
 lazy_static::lazy_static! {
     static ref LOGGING_CONFIG: std::sync::Mutex<LoggingConfig> = std::sync::Mutex::new(LoggingConfig::default());
+    // Most verbose enabled level, mirrored from LOGGING_CONFIG so the per-call
+    // check is a single atomic load instead of a lock and string compare
+    static ref MAX_LOG_LEVEL: AtomicU8 = AtomicU8::new(level_threshold(&default_level_name()) as u8);
+}
+
+/// Threshold for a configured level name; unknown names fall back to info
+fn level_threshold(level: &str) -> LogLevel {
+    LogLevel::parse(level).unwrap_or(LogLevel::Info)
+}
+
+/// Bytes buffered before log records are written out
+const LOG_FLUSH_BYTES: usize = 64 * 1024;
+
+/// Formatted log records waiting to be written, kept apart by destination
+/// stream so each stream gets one locked write per batch instead of one per
+/// record. A single buffer is shared by every thread, so records logged off
+/// the main thread are written by whichever thread flushes next.
+#[derive(Default)]
+struct LogBuffer {
+    stdout: Vec<u8>,
+    stderr: Vec<u8>,
+}
+
+impl LogBuffer {
+    fn flush(&mut self) {
+        if !self.stdout.is_empty() {
+            let mut out = std::io::stdout().lock();
+            let _ = out.write_all(&self.stdout).and_then(|_| out.flush());
+            self.stdout.clear();
+        }
+        if !self.stderr.is_empty() {
+            let _ = std::io::stderr().lock().write_all(&self.stderr);
+            self.stderr.clear();
+        }
+    }
+}
+
+lazy_static::lazy_static! {
+    static ref LOG_BUFFER: Mutex<LogBuffer> = Mutex::new(LogBuffer::default());
+    // Records bound for a terminal are written as they are logged, since
+    // someone is watching; only redirected output is batched
+    static ref STDOUT_IS_TERMINAL: bool = std::io::stdout().is_terminal();
+    static ref STDERR_IS_TERMINAL: bool = std::io::stderr().is_terminal();
+}
+
+#[derive(Clone, Copy)]
+enum Stream {
+    Stdout,
+    Stderr,
+}
+
+/// Queue one log line. The batch is written right away when the line is
+/// `urgent` (errors and warnings), when its stream is a terminal, or once
+/// the buffer is full.
+fn emit(stream: Stream, urgent: bool, args: std::fmt::Arguments) {
+    // A panic mid-write leaves at worst a partial line; keep logging
+    let mut buffer = LOG_BUFFER.lock().unwrap_or_else(PoisonError::into_inner);
+    let (target, interactive) = match stream {
+        Stream::Stdout => (&mut buffer.stdout, *STDOUT_IS_TERMINAL),
+        Stream::Stderr => (&mut buffer.stderr, *STDERR_IS_TERMINAL),
+    };
+    let _ = writeln!(target, "{}", args);
+    if urgent || interactive || buffer.stdout.len() + buffer.stderr.len() >= LOG_FLUSH_BYTES {
+        buffer.flush();
+    }
+}
+
+/// Write out every buffered log record, whichever thread logged it.
+///
+/// Registered with `atexit` when the module is imported. Call it directly
+/// before reading redirected output mid-run.
+pub fn flush_logs() {
+    LOG_BUFFER.lock().unwrap_or_else(PoisonError::into_inner).flush();
+}
+
+fn apply_config(config: LoggingConfig) {
+    flush_logs();
+    MAX_LOG_LEVEL.store(level_threshold(&config.level) as u8, Ordering::Relaxed);
+    *LOGGING_CONFIG.lock().unwrap() = config;
 }
 
 /// Initialize logging with default settings
 pub fn init_logging() -> PyResult<()> {
-    let config = LoggingConfig::default();
-    *LOGGING_CONFIG.lock().unwrap() = config;
+    apply_config(LoggingConfig::default());
     Ok(())
 }
 
@@ -38,54 +155,45 @@ pub fn init_logging_with_config(
     log_performance: bool,
     log_operations: bool,
 ) -> PyResult<()> {
-    let config = LoggingConfig {
+    apply_config(LoggingConfig {
         level: level.to_string(),
         log_memory,
         log_performance,
         log_operations,
-    };
-    *LOGGING_CONFIG.lock().unwrap() = config;
+    });
     Ok(())
 }
 
-/// Check if logging is enabled for the given level
-fn should_log(level: &str) -> bool {
-    let config = LOGGING_CONFIG.lock().unwrap();
-    match config.level.as_str() {
-        "trace" => true,
-        "debug" => level != "trace",
-        "info" => matches!(level, "info" | "warn" | "error"),
-        "warn" => matches!(level, "warn" | "error"),
-        "error" => level == "error",
-        _ => level == "info",
-    }
+/// Check if messages at the given level are currently emitted
+#[inline]
+pub fn is_level_enabled(level: LogLevel) -> bool {
+    level as u8 <= MAX_LOG_LEVEL.load(Ordering::Relaxed)
 }
 
 /// Log a DataFrame operation
 pub fn log_operation(operation: &str, details: &str) {
-    if should_log("info") {
-        // Use eprintln! for faster output and avoid stdout buffering
-        eprintln!("🔧 Operation: {} - {}", operation, details);
+    if is_level_enabled(LogLevel::Info) {
+        emit(Stream::Stderr, false, format_args!("🔧 Operation: {} - {}", operation, details));
     }
 }
 
 /// Log memory usage
 pub fn log_memory_usage(operation: &str, memory_mb: f64) {
     // Fast path: check if we should log at all before acquiring lock
-    if !should_log("info") {
+    if !is_level_enabled(LogLevel::Info) {
         return;
     }
     
     let config = LOGGING_CONFIG.lock().unwrap();
     if config.log_memory {
-        eprintln!("💾 Memory: {} - {:.2} MB", operation, memory_mb);
+        emit(Stream::Stderr, false, format_args!("💾 Memory: {} - {:.2} MB", operation, memory_mb));
     }
 }
 
 /// Log performance metrics
 pub fn log_performance(operation: &str, duration_ms: f64, rows_processed: usize) {
     // Fast path: check if we should log at all before acquiring lock
-    if !should_log("info") {
+    if !is_level_enabled(LogLevel::Info) {
         return;
     }
     
@@ -96,49 +204,49 @@ pub fn log_performance(operation: &str, duration_ms: f64, rows_processed: usize)
         } else {
             0.0
         };
-        eprintln!(
+        emit(Stream::Stderr, false, format_args!(
             "⚡ Performance: {} - {:.2}ms, {} rows, {:.0} rows/sec",
             operation,
             duration_ms,
             rows_processed,
             rows_per_second
-        );
+        ));
     }
 }
 
 /// Log error with context
 pub fn log_error(operation: &str, error: &str, context: Option<&str>) {
-    if should_log("error") {
+    if is_level_enabled(LogLevel::Error) {
         if let Some(ctx) = context {
-            println!("❌ Error in {}: {} (Context: {})", operation, error, ctx);
+            emit(Stream::Stdout, true, format_args!("❌ Error in {}: {} (Context: {})", operation, error, ctx));
         } else {
-            println!("❌ Error in {}: {}", operation, error);
+            emit(Stream::Stdout, true, format_args!("❌ Error in {}: {}", operation, error));
         }
     }
 }
 
 /// Log warning with context
 pub fn log_warning(operation: &str, warning: &str, context: Option<&str>) {
-    if should_log("warn") {
+    if is_level_enabled(LogLevel::Warn) {
         if let Some(ctx) = context {
-            println!("⚠️  Warning in {}: {} (Context: {})", operation, warning, ctx);
+            emit(Stream::Stdout, true, format_args!("⚠️  Warning in {}: {} (Context: {})", operation, warning, ctx));
         } else {
-            println!("⚠️  Warning in {}: {}", operation, warning);
+            emit(Stream::Stdout, true, format_args!("⚠️  Warning in {}: {}", operation, warning));
         }
     }
 }
 
 /// Log debug information
 pub fn log_debug(operation: &str, info: &str) {
-    if should_log("debug") {
-        println!("🐛 Debug {}: {}", operation, info);
+    if is_level_enabled(LogLevel::Debug) {
+        emit(Stream::Stdout, false, format_args!("🐛 Debug {}: {}", operation, info));
     }
 }
 
 /// Log trace information
 pub fn log_trace(operation: &str, info: &str) {
-    if should_log("trace") {
-        println!("🔍 Trace {}: {}", operation, info);
+    if is_level_enabled(LogLevel::Trace) {
+        emit(Stream::Stdout, false, format_args!("🔍 Trace {}: {}", operation, info));
     }
 }
 
@@ -151,59 +259,59 @@ pub fn get_memory_usage() -> f64 {
 
 /// Log DataFrame statistics
 pub fn log_dataframe_stats(operation: &str, rows: usize, cols: usize, memory_mb: f64) {
-    if should_log("info") {
-        println!(
+    if is_level_enabled(LogLevel::Info) {
+        emit(Stream::Stdout, false, format_args!(
             "📊 DataFrame Stats: {} - {} rows, {} cols, {:.2} MB",
             operation,
             rows,
             cols,
             memory_mb
-        );
+        ));
     }
 }
 
 /// Log operation timing
 pub fn log_timing(operation: &str, start_time: std::time::Instant) {
-    if should_log("debug") {
+    if is_level_enabled(LogLevel::Debug) {
         let duration = start_time.elapsed();
-        println!("⏱️  Timing: {} completed in {:?}", operation, duration);
+        emit(Stream::Stdout, false, format_args!("⏱️  Timing: {} completed in {:?}", operation, duration));
     }
 }
 
 /// Log configuration
 pub fn log_config(config: &HashMap<String, String>) {
-    if should_log("info") {
-        println!("⚙️  Configuration: {:?}", config);
+    if is_level_enabled(LogLevel::Info) {
+        emit(Stream::Stdout, false, format_args!("⚙️  Configuration: {:?}", config));
     }
 }
 
 /// Log feature usage
 pub fn log_feature_usage(feature: &str, usage_count: usize) {
-    if should_log("info") {
-        println!("🔧 Feature Usage: {} used {} times", feature, usage_count);
+    if is_level_enabled(LogLevel::Info) {
+        emit(Stream::Stdout, false, format_args!("🔧 Feature Usage: {} used {} times", feature, usage_count));
     }
 }
 
 /// Log performance warning
 pub fn log_performance_warning(operation: &str, duration_ms: f64, threshold_ms: f64) {
-    if duration_ms > threshold_ms && should_log("warn") {
-        println!(
+    if duration_ms > threshold_ms && is_level_enabled(LogLevel::Warn) {
+        emit(Stream::Stdout, true, format_args!(
             "⚠️  Performance Warning: {} took {:.2}ms (threshold: {:.2}ms)",
             operation,
             duration_ms,
             threshold_ms
-        );
+        ));
     }
 }
 
 /// Log memory warning
 pub fn log_memory_warning(operation: &str, memory_mb: f64, threshold_mb: f64) {
-    if memory_mb > threshold_mb && should_log("warn") {
-        println!(
+    if memory_mb > threshold_mb && is_level_enabled(LogLevel::Warn) {
+        emit(Stream::Stdout, true, format_args!(
             "⚠️  Memory Warning: {} used {:.2}MB (threshold: {:.2}MB)",
             operation,
             memory_mb,
             threshold_mb
-        );
+        ));
     }
 }
\ No newline at end of file
@@ -3,6 +3,28 @@ use std::collections::HashMap;
 use pyo3::prelude::*;
 use crate::frame::{TinyFrame, TinyColumn, ValueEnum};
 
+// Inputs below this many rows are processed on the calling thread by every
+// operation that can switch to rayon, so the cutoff is the same everywhere
+pub const PARALLEL_MIN_ROWS: usize = 16_384;
+// Rows mapped by each parallel task in `map_rows`
+const MAP_CHUNK_ROWS: usize = 4_096;
+
+// Map `values` in order, splitting large inputs into parallel stripes that
+// each write their own range of the output. Collects into a Vec, or into a
+// Result of one when `f` can fail.
+pub fn map_rows<S, T, C>(values: &[S], f: impl Fn(&S) -> T + Sync) -> C
+where
+    S: Sync,
+    T: Send,
+    C: FromIterator<T> + FromParallelIterator<T>,
+{
+    if values.len() < PARALLEL_MIN_ROWS {
+        values.iter().map(f).collect()
+    } else {
+        values.par_iter().with_min_len(MAP_CHUNK_ROWS).map(&f).collect()
+    }
+}
+
 // Parallel processing operations for TinyFrame
 pub struct ParallelOps;
 
@@ -1,7 +1,13 @@
 use pyo3::prelude::*;
 use crate::frame::{TinyFrame, TinyColumn};
+use crate::frame::sort::{numeric_sort_keys, radix_sort_indices};
+use crate::simd::SimdOps;
 use std::collections::HashMap;
 
+// A column has few enough distinct values to rank them directly when there
+// are at least this many rows per distinct value
+const DISTINCT_RANK_RATIO: usize = 8;
+
 /// Ranking method for rank function
 #[derive(Clone, Debug)]
 pub enum RankMethod {
@@ -12,6 +18,22 @@ pub enum RankMethod {
     Dense,
 }
 
+impl RankMethod {
+    /// Parse a method name as accepted by `TinyFrame.rank`
+    pub fn parse(method: &str) -> PyResult<Self> {
+        match method {
+            "average" => Ok(RankMethod::Average),
+            "min" => Ok(RankMethod::Min),
+            "max" => Ok(RankMethod::Max),
+            "first" => Ok(RankMethod::First),
+            "dense" => Ok(RankMethod::Dense),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Invalid ranking method. Must be one of: average, min, max, first, dense"
+            )),
+        }
+    }
+}
+
 /// Ranking functions for TinyFrame
 pub struct RankingOps;
 
@@ -22,63 +44,7 @@ impl RankingOps {
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
-
-        let mut ranks = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                let indexed_values: Vec<(usize, f64)> = v.iter().enumerate().map(|(i, &val)| (i, val)).collect();
-                let mut sorted_values = indexed_values.clone();
-                sorted_values.sort_by(|a, b| a.1.partial_cmp(&b.1).unwrap());
-                
-                ranks = Self::calculate_ranks(&sorted_values, &method, v.len());
-            },
-            TinyColumn::Int(v) => {
-                let indexed_values: Vec<(usize, i64)> = v.iter().enumerate().map(|(i, &val)| (i, val)).collect();
-                let mut sorted_values = indexed_values.clone();
-                sorted_values.sort_by(|a, b| a.1.cmp(&b.1));
-                
-                // Convert to f64 for consistent ranking
-                let float_values: Vec<(usize, f64)> = sorted_values.iter()
-                    .map(|(idx, val)| (*idx, *val as f64))
-                    .collect();
-                ranks = Self::calculate_ranks(&float_values, &method, v.len());
-            },
-            TinyColumn::OptFloat(v) => {
-                let indexed_values: Vec<(usize, Option<f64>)> = v.iter().enumerate().map(|(i, &val)| (i, val)).collect();
-                let mut sorted_values = indexed_values.clone();
-                sorted_values.sort_by(|a, b| {
-                    match (a.1, b.1) {
-                        (Some(x), Some(y)) => x.partial_cmp(&y).unwrap(),
-                        (Some(_), None) => std::cmp::Ordering::Less,
-                        (None, Some(_)) => std::cmp::Ordering::Greater,
-                        (None, None) => std::cmp::Ordering::Equal,
-                    }
-                });
-                
-                ranks = Self::calculate_ranks_optional(&sorted_values, &method, v.len());
-            },
-            TinyColumn::OptInt(v) => {
-                let indexed_values: Vec<(usize, Option<i64>)> = v.iter().enumerate().map(|(i, &val)| (i, val)).collect();
-                let mut sorted_values = indexed_values.clone();
-                sorted_values.sort_by(|a, b| {
-                    match (a.1, b.1) {
-                        (Some(x), Some(y)) => x.cmp(&y),
-                        (Some(_), None) => std::cmp::Ordering::Less,
-                        (None, Some(_)) => std::cmp::Ordering::Greater,
-                        (None, None) => std::cmp::Ordering::Equal,
-                    }
-                });
-                
-                // Convert to f64 for consistent ranking
-                let float_values: Vec<(usize, Option<f64>)> = sorted_values.iter()
-                    .map(|(idx, val)| (*idx, val.map(|v| v as f64)))
-                    .collect();
-                ranks = Self::calculate_ranks_optional(&float_values, &method, v.len());
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Ranking only supported on numeric columns"
-            )),
-        }
+        let ranks = Self::rank_values(col, &method)?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_rank", column), TinyColumn::OptFloat(ranks));
@@ -96,19 +62,130 @@ impl RankingOps {
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
+        let pct_changes = Self::pct_change_values(col)?;
+
+        let mut new_columns = frame.columns.clone();
+        new_columns.insert(format!("{}_pct_change", column), TinyColumn::OptFloat(pct_changes));
+        
+        Ok(TinyFrame {
+            columns: new_columns,
+            length: frame.length,
+            py_objects: frame.py_objects.clone(),
+        })
+    }
+
+    /// Rank one column and take the percentage change of another, producing
+    /// the frame `rank_impl` followed by `pct_change_impl` would, but copying
+    /// the source columns once instead of once per step
+    pub fn rank_pct_change_impl(
+        frame: &TinyFrame,
+        rank_column: &str,
+        method: RankMethod,
+        pct_column: &str,
+    ) -> PyResult<TinyFrame> {
+        let get = |column: &str| frame.columns.get(column)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
+                format!("Column '{}' not found", column)
+            ));
+
+        let rank_name = format!("{}_rank", rank_column);
+        let ranks = TinyColumn::OptFloat(Self::rank_values(get(rank_column)?, &method)?);
+        // The second step may read the column the first one just added
+        let pct_changes = if pct_column == rank_name {
+            Self::pct_change_values(&ranks)?
+        } else {
+            Self::pct_change_values(get(pct_column)?)?
+        };
+
+        let mut new_columns = frame.columns.clone();
+        new_columns.insert(rank_name, ranks);
+        new_columns.insert(format!("{}_pct_change", pct_column), TinyColumn::OptFloat(pct_changes));
+
+        Ok(TinyFrame {
+            columns: new_columns,
+            length: frame.length,
+            py_objects: frame.py_objects.clone(),
+        })
+    }
+
+    /// Rank values of a numeric column, leaving nulls and NaN unranked
+    fn rank_values(col: &TinyColumn, method: &RankMethod) -> PyResult<Vec<Option<f64>>> {
+        // Order-preserving integer keys; nulls and NaN are keyed as None
+        let keys = numeric_sort_keys(col, true).ok_or_else(|| PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "Ranking only supported on numeric columns"
+        ))?;
+        if let Some(ranks) = Self::distinct_value_ranks(&keys, method) {
+            return Ok(ranks);
+        }
+
+        // Sort row indices with a radix sort; None keys land after every value
+        let mut order: Vec<usize> = (0..keys.len()).collect();
+        radix_sort_indices(&mut order, &keys, false);
+        let valid = order.iter().take_while(|&&row| keys[row].is_some()).count();
+        Ok(Self::calculate_ranks(&order[..valid], &keys, method))
+    }
+
+    /// Ranks for the methods where a row's rank depends only on its value:
+    /// each distinct value is ranked once from the sorted distinct values and
+    /// their counts. Returns `None` for 'first', or as soon as the column has
+    /// too many distinct values for this to beat sorting every row.
+    fn distinct_value_ranks(keys: &[Option<u64>], method: &RankMethod) -> Option<Vec<Option<f64>>> {
+        if let RankMethod::First = method {
+            return None;
+        }
+        let limit = keys.len() / DISTINCT_RANK_RATIO;
 
+        let mut ids: HashMap<u64, usize> = HashMap::new();
+        let mut distinct: Vec<u64> = Vec::new();
+        let mut counts: Vec<usize> = Vec::new();
+        let mut row_ids = Vec::with_capacity(keys.len());
+        for key in keys {
+            row_ids.push(key.map(|key| {
+                let id = *ids.entry(key).or_insert_with(|| {
+                    distinct.push(key);
+                    counts.push(0);
+                    distinct.len() - 1
+                });
+                counts[id] += 1;
+                id
+            }));
+            if distinct.len() > limit {
+                return None;
+            }
+        }
+
+        let mut order: Vec<usize> = (0..distinct.len()).collect();
+        order.sort_unstable_by_key(|&id| distinct[id]);
+        let mut rank_of = vec![0.0; distinct.len()];
+        let mut below = 0;
+        for (dense_rank, &id) in order.iter().enumerate() {
+            let count = counts[id];
+            rank_of[id] = match method {
+                RankMethod::Average => below as f64 + (count + 1) as f64 / 2.0,
+                RankMethod::Min => (below + 1) as f64,
+                RankMethod::Max => (below + count) as f64,
+                RankMethod::Dense | RankMethod::First => (dense_rank + 1) as f64,
+            };
+            below += count;
+        }
+        Some(row_ids.iter().map(|id| id.map(|id| rank_of[id])).collect())
+    }
+
+    /// Percentage change of each value from the previous row
+    fn pct_change_values(col: &TinyColumn) -> PyResult<Vec<Option<f64>>> {
         let mut pct_changes = Vec::new();
         match col {
             TinyColumn::Float(v) => {
-                pct_changes.push(None); // First value is always None
-                for i in 1..v.len() {
-                    if v[i-1] != 0.0 {
-                        let pct_change = (v[i] - v[i-1]) / v[i-1] * 100.0;
-                        pct_changes.push(Some(pct_change));
-                    } else {
-                        pct_changes.push(None);
-                    }
+                // Compute every change in one vectorizable pass, then null out
+                // the ones measured from a zero
+                let changes = SimdOps::pct_change_f64(v);
+                pct_changes.reserve(v.len());
+                if !v.is_empty() {
+                    pct_changes.push(None); // First value is always None
                 }
+                pct_changes.extend(v.iter().zip(changes).map(|(&prev, change)| {
+                    if prev != 0.0 { Some(change) } else { None }
+                }));
             },
             TinyColumn::Int(v) => {
                 pct_changes.push(None); // First value is always None
@@ -160,142 +237,36 @@ impl RankingOps {
             )),
         }
 
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_pct_change", column), TinyColumn::OptFloat(pct_changes));
-        
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Ok(pct_changes)
     }
 
-    /// Calculate ranks for non-optional values
-    fn calculate_ranks(
-        sorted_values: &[(usize, f64)], 
-        method: &RankMethod, 
-        total_len: usize
-    ) -> Vec<Option<f64>> {
-        let mut result_ranks = vec![None; total_len];
-        
-        match method {
-            RankMethod::Average => {
-                let mut i = 0;
-                while i < sorted_values.len() {
-                    let current_value = sorted_values[i].1;
-                    let mut j = i;
-                    while j < sorted_values.len() && sorted_values[j].1 == current_value {
-                        j += 1;
-                    }
-                    
-                    // Calculate average rank for tied values
-                    let avg_rank = (i + j + 1) as f64 / 2.0;
-                    for k in i..j {
-                        let original_idx = sorted_values[k].0;
-                        if original_idx < result_ranks.len() {
-                            result_ranks[original_idx] = Some(avg_rank);
-                        }
-                    }
-                    i = j;
-                }
-            },
-            RankMethod::Min => {
-                let mut i = 0;
-                while i < sorted_values.len() {
-                    let current_value = sorted_values[i].1;
-                    let mut j = i;
-                    while j < sorted_values.len() && sorted_values[j].1 == current_value {
-                        j += 1;
-                    }
-                    
-                    // Use minimum rank for tied values
-                    let min_rank = (i + 1) as f64;
-                    for k in i..j {
-                        let original_idx = sorted_values[k].0;
-                        if original_idx < result_ranks.len() {
-                            result_ranks[original_idx] = Some(min_rank);
-                        }
-                    }
-                    i = j;
-                }
-            },
-            RankMethod::Max => {
-                let mut i = 0;
-                while i < sorted_values.len() {
-                    let current_value = sorted_values[i].1;
-                    let mut j = i;
-                    while j < sorted_values.len() && sorted_values[j].1 == current_value {
-                        j += 1;
-                    }
-                    
-                    // Use maximum rank for tied values
-                    let max_rank = j as f64;
-                    for k in i..j {
-                        let original_idx = sorted_values[k].0;
-                        if original_idx < result_ranks.len() {
-                            result_ranks[original_idx] = Some(max_rank);
-                        }
-                    }
-                    i = j;
-                }
-            },
-            RankMethod::First => {
-                for (rank, (original_index, _)) in sorted_values.iter().enumerate() {
-                    if *original_index < result_ranks.len() {
-                        result_ranks[*original_index] = Some((rank + 1) as f64);
-                    }
-                }
-            },
-            RankMethod::Dense => {
-                let mut dense_rank = 1.0;
-                let mut i = 0;
-                while i < sorted_values.len() {
-                    let current_value = sorted_values[i].1;
-                    let mut j = i;
-                    while j < sorted_values.len() && sorted_values[j].1 == current_value {
-                        j += 1;
-                    }
-                    
-                    // Use dense ranking (no gaps)
-                    for k in i..j {
-                        let original_idx = sorted_values[k].0;
-                        if original_idx < result_ranks.len() {
-                            result_ranks[original_idx] = Some(dense_rank);
-                        }
-                    }
-                    dense_rank += 1.0;
-                    i = j;
-                }
-            },
-        }
-        
-        result_ranks
-    }
+    /// Assign ranks to rows given in sorted order. Rows in `order` with equal
+    /// keys form a tied run; rows left out of `order` keep a null rank.
+    fn calculate_ranks(order: &[usize], keys: &[Option<u64>], method: &RankMethod) -> Vec<Option<f64>> {
+        let mut result_ranks = vec![None; keys.len()];
+        let mut dense_rank = 0.0;
+        let mut i = 0;
+        while i < order.len() {
+            let current_key = keys[order[i]];
+            let mut j = i + 1;
+            while j < order.len() && keys[order[j]] == current_key {
+                j += 1;
+            }
+            dense_rank += 1.0;
 
-    /// Calculate ranks for optional values
-    fn calculate_ranks_optional(
-        sorted_values: &[(usize, Option<f64>)], 
-        method: &RankMethod, 
-        total_len: usize
-    ) -> Vec<Option<f64>> {
-        let mut result_ranks = vec![None; total_len];
-        
-        // Separate null and non-null values
-        let non_null_values: Vec<(usize, f64)> = sorted_values.iter()
-            .filter_map(|(idx, val)| val.map(|v| (*idx, v)))
-            .collect();
-        
-        // Calculate ranks for non-null values only
-        let non_null_ranks = Self::calculate_ranks(&non_null_values, method, total_len);
-        
-        // Assign ranks to non-null values
-        for (i, (original_idx, _)) in non_null_values.iter().enumerate() {
-            if i < non_null_ranks.len() && *original_idx < result_ranks.len() {
-                result_ranks[*original_idx] = non_null_ranks[*original_idx];
+            // Positions i..j share a value and take ranks i + 1 ..= j
+            for (k, &row) in order[i..j].iter().enumerate() {
+                let rank = match method {
+                    RankMethod::Average => (i + j + 1) as f64 / 2.0,
+                    RankMethod::Min => (i + 1) as f64,
+                    RankMethod::Max => j as f64,
+                    RankMethod::First => (i + k + 1) as f64,
+                    RankMethod::Dense => dense_rank,
+                };
+                result_ranks[row] = Some(rank);
             }
+            i = j;
         }
-        
-        // Null values remain None (already initialized)
         result_ranks
     }
 }
@@ -117,6 +117,11 @@ impl SimdOps {
         simd_dispatch!(mul_f64, a, b)
     }
 
+    // Percentage change between consecutive values; only a scalar kernel exists
+    pub fn pct_change_f64(data: &[f64]) -> Vec<f64> {
+        simd_dispatch!(pct_change_f64, data)
+    }
+
     // Get SIMD capabilities
     #[cfg(feature = "simd")]
     pub fn get_capabilities() -> SimdCapabilities {
@@ -84,20 +84,34 @@ impl ScalarOps {
         }
         a.iter().zip(b.iter()).map(|(x, y)| x * y).collect()
     }
+
+    // Scalar percentage change between consecutive values
+    pub fn pct_change_f64(data: &[f64]) -> Vec<f64> {
+        data.windows(2).map(|w| (w[1] - w[0]) / w[0] * 100.0).collect()
+    }
 }
 
 // Scalar string operations
 pub struct ScalarStringOps;
 
 impl ScalarStringOps {
-    // Scalar string upper case
+    // Scalar string upper case; ASCII input is flipped byte-wise in one
+    // copy, which the compiler vectorizes, skipping Unicode case mapping
     pub fn to_uppercase_simd(input: &str) -> String {
-        input.to_uppercase()
+        if input.is_ascii() {
+            input.to_ascii_uppercase()
+        } else {
+            input.to_uppercase()
+        }
     }
 
-    // Scalar string lower case
+    // Scalar string lower case, with the same ASCII fast path
     pub fn to_lowercase_simd(input: &str) -> String {
-        input.to_lowercase()
+        if input.is_ascii() {
+            input.to_ascii_lowercase()
+        } else {
+            input.to_lowercase()
+        }
     }
 
     // Scalar string contains
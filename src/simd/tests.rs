@@ -221,6 +221,28 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_simd_pct_change_f64() {
+        let test_cases = vec![
+            vec![],
+            vec![5.0],
+            vec![100.0, 110.0, 99.0],
+            vec![2.0, 0.0, 4.0, -8.0, 1.5],
+            generate_test_data_f64(100),
+            generate_test_data_f64(1001),
+        ];
+
+        for data in test_cases {
+            let expected: Vec<f64> = data.windows(2).map(|w| (w[1] - w[0]) / w[0] * 100.0).collect();
+            let actual = SimdOps::pct_change_f64(&data);
+            assert_eq!(actual.len(), expected.len(), "pct_change_f64 length mismatch");
+            for (i, (exp, act)) in expected.iter().zip(actual.iter()).enumerate() {
+                assert!(act == exp || (act - exp).abs() < 1e-10,
+                    "pct_change_f64 failed at index {}: expected {}, actual {}", i, exp, act);
+            }
+        }
+    }
+
     #[test]
     fn test_simd_mul_f64() {
         let test_cases = vec![
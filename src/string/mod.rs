@@ -1,33 +1,82 @@
 use pyo3::prelude::*;
 use crate::frame::{TinyFrame, TinyColumn};
+use crate::parallel::map_rows;
+use crate::simd::SimdStringOps;
+use std::borrow::Cow;
 use std::collections::HashMap;
 
+// A string column is transformed once per distinct value, rather than once
+// per row, when there are at least this many rows per distinct value
+const DISTINCT_STRING_RATIO: usize = 8;
+
 /// String operations for TinyFrame
 pub struct StringOps;
 
 impl StringOps {
-    /// Helper to extract string values from a column
-    fn extract_string_values(frame: &TinyFrame, column: &str) -> PyResult<Vec<Option<String>>> {
+    /// Helper to borrow the string values of a column
+    fn extract_string_values<'a>(frame: &'a TinyFrame, column: &str) -> PyResult<Vec<Option<&'a str>>> {
         let col = frame.columns.get(column)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
 
         match col {
-            TinyColumn::Str(v) => Ok(v.iter().map(|s| Some(s.clone())).collect()),
-            TinyColumn::OptStr(v) => Ok(v.clone()),
+            TinyColumn::Str(v) => Ok(v.iter().map(|s| Some(s.as_str())).collect()),
+            TinyColumn::OptStr(v) => Ok(v.iter().map(|s| s.as_deref()).collect()),
             _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                 "String operations only supported on string columns"
             )),
         }
     }
 
+    /// Helper to apply `f` to each string of a column without cloning it first
+    fn map_string_values<T: Send>(frame: &TinyFrame, column: &str, f: impl Fn(&str) -> T + Sync) -> PyResult<Vec<Option<T>>> {
+        let col = frame.columns.get(column)
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
+                format!("Column '{}' not found", column)
+            ))?;
+
+        match col {
+            TinyColumn::Str(v) => Ok(map_rows(v, |s| Some(f(s)))),
+            TinyColumn::OptStr(v) => Ok(map_rows(v, |s| s.as_deref().map(&f))),
+            _ => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+                "String operations only supported on string columns"
+            )),
+        }
+    }
+
+    /// Helper like `map_string_values` for string results. When the column
+    /// repeats its values, `f` runs once per distinct string and the rows
+    /// copy its result; it falls back to one call per row as soon as the
+    /// distinct count shows the column is not low-cardinality.
+    fn map_distinct_string_values(frame: &TinyFrame, column: &str, f: impl Fn(&str) -> String + Sync) -> PyResult<Vec<Option<String>>> {
+        let values = Self::extract_string_values(frame, column)?;
+        let limit = values.len() / DISTINCT_STRING_RATIO;
+
+        // The map never holds more than limit + 1 entries before bailing out,
+        // so sizing it for that up front means it never rehashes
+        let mut ids: HashMap<&str, usize> = HashMap::with_capacity(limit + 1);
+        let mut row_ids = Vec::with_capacity(values.len());
+        for value in &values {
+            row_ids.push(value.map(|s| {
+                let next = ids.len();
+                *ids.entry(s).or_insert(next)
+            }));
+            if ids.len() > limit {
+                return Ok(map_rows(&values, |s| s.map(&f)));
+            }
+        }
+
+        let mut results = vec![String::new(); ids.len()];
+        for (s, id) in ids {
+            results[id] = f(s);
+        }
+        Ok(map_rows(&row_ids, |id| id.map(|id| results[id].clone())))
+    }
+
     /// Convert strings to uppercase
     pub fn str_upper_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<String>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.to_uppercase()))
-            .collect();
+        let result_values = Self::map_distinct_string_values(frame, column, SimdStringOps::to_uppercase_simd)?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_upper", column), TinyColumn::OptStr(result_values));
@@ -41,10 +90,7 @@ impl StringOps {
 
     /// Convert strings to lowercase
     pub fn str_lower_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<String>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.to_lowercase()))
-            .collect();
+        let result_values = Self::map_distinct_string_values(frame, column, SimdStringOps::to_lowercase_simd)?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_lower", column), TinyColumn::OptStr(result_values));
@@ -56,12 +102,26 @@ impl StringOps {
         })
     }
 
+    /// Apply a chain of string steps to each row in a single pass, adding
+    /// only the final result as `output`
+    pub fn str_pipe_impl(frame: &TinyFrame, column: &str, steps: &[StringStep], output: &str) -> PyResult<TinyFrame> {
+        let result_values = Self::map_distinct_string_values(frame, column, |s| {
+            steps.iter().fold(Cow::Borrowed(s), |value, step| step.apply(value)).into_owned()
+        })?;
+
+        let mut new_columns = frame.columns.clone();
+        new_columns.insert(output.to_string(), TinyColumn::OptStr(result_values));
+
+        Ok(TinyFrame {
+            columns: new_columns,
+            length: frame.length,
+            py_objects: frame.py_objects.clone(),
+        })
+    }
+
     /// Strip whitespace from strings
     pub fn str_strip_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<String>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.trim().to_string()))
-            .collect();
+        let result_values = Self::map_string_values(frame, column, |s| s.trim().to_string())?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_strip", column), TinyColumn::OptStr(result_values));
@@ -75,10 +135,14 @@ impl StringOps {
 
     /// Replace substrings in strings
     pub fn str_replace_impl(frame: &TinyFrame, column: &str, from: &str, to: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<String>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.replace(from, to)))
-            .collect();
+        // An empty pattern matches at every char boundary, which only the
+        // std replace handles; otherwise one searcher serves every row
+        let result_values = if from.is_empty() {
+            Self::map_distinct_string_values(frame, column, |s| s.replace(from, to))?
+        } else {
+            let finder = memchr::memmem::Finder::new(from);
+            Self::map_distinct_string_values(frame, column, |s| Self::replace_with(&finder, s, to))?
+        };
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_replace", column), TinyColumn::OptStr(result_values));
@@ -90,20 +154,40 @@ impl StringOps {
         })
     }
 
+    /// Replace every non-overlapping match of `finder`'s needle in `s` with `to`
+    fn replace_with(finder: &memchr::memmem::Finder, s: &str, to: &str) -> String {
+        let needle_len = finder.needle().len();
+        let mut result = String::with_capacity(s.len());
+        let mut last = 0;
+        for start in finder.find_iter(s.as_bytes()) {
+            result.push_str(&s[last..start]);
+            result.push_str(to);
+            last = start + needle_len;
+        }
+        result.push_str(&s[last..]);
+        result
+    }
+
     /// Split strings by delimiter
     pub fn str_split_impl(frame: &TinyFrame, column: &str, delimiter: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<Vec<String>>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.split(delimiter).map(|part| part.to_string()).collect()))
-            .collect();
+        // Parts are joined with '|' as a list of strings representation,
+        // which is the same as replacing each delimiter match with '|'. A
+        // one-byte delimiter is ASCII, so that is a byte-for-byte swap that
+        // keeps the string valid UTF-8 and needs no search.
+        let result_values = match delimiter.as_bytes() {
+            &[delim] => Self::map_string_values(frame, column, |s| {
+                let bytes: Vec<u8> = s.bytes().map(|b| if b == delim { b'|' } else { b }).collect();
+                String::from_utf8(bytes).expect("swapping ASCII bytes keeps UTF-8 valid")
+            })?,
+            [] => Self::map_string_values(frame, column, |s| s.split(delimiter).collect::<Vec<_>>().join("|"))?,
+            _ => {
+                let finder = memchr::memmem::Finder::new(delimiter);
+                Self::map_string_values(frame, column, |s| Self::replace_with(&finder, s, "|"))?
+            }
+        };
 
-        // Convert to a list of strings representation
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_split", column), TinyColumn::OptStr(
-            result_values.iter()
-                .map(|opt_vec| opt_vec.as_ref().map(|vec| vec.join("|")))
-                .collect()
-        ));
+        new_columns.insert(format!("{}_split", column), TinyColumn::OptStr(result_values));
 
         Ok(TinyFrame {
             columns: new_columns,
@@ -114,10 +198,10 @@ impl StringOps {
 
     /// Check if strings contain substring
     pub fn str_contains_impl(frame: &TinyFrame, column: &str, substring: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<bool>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.contains(substring)))
-            .collect();
+        // Build the searcher once and reuse it for every row; it filters
+        // candidate offsets on the needle's first and last bytes with SIMD
+        let finder = memchr::memmem::Finder::new(substring);
+        let result_values = Self::map_string_values(frame, column, |s| finder.find(s.as_bytes()).is_some())?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_contains", column), TinyColumn::OptBool(result_values));
@@ -131,10 +215,7 @@ impl StringOps {
 
     /// Get string length
     pub fn str_len_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
-        let values = Self::extract_string_values(frame, column)?;
-        let result_values: Vec<Option<i64>> = values.iter()
-            .map(|opt_str| opt_str.as_ref().map(|s| s.len() as i64))
-            .collect();
+        let result_values = Self::map_string_values(frame, column, |s| s.len() as i64)?;
 
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_len", column), TinyColumn::OptInt(result_values));
@@ -149,9 +230,7 @@ impl StringOps {
     /// Concatenate strings
     pub fn str_cat_impl(frame: &TinyFrame, column: &str, separator: &str) -> PyResult<TinyFrame> {
         let values = Self::extract_string_values(frame, column)?;
-        let non_null_values: Vec<String> = values.iter()
-            .filter_map(|opt_str| opt_str.as_ref().cloned())
-            .collect();
+        let non_null_values: Vec<&str> = values.into_iter().flatten().collect();
         
         let concatenated = non_null_values.join(separator);
         
@@ -165,3 +244,87 @@ impl StringOps {
         })
     }
 }
+
+/// One step of a fused string pipeline
+#[derive(Clone, Debug)]
+pub enum StringStep {
+    Strip,
+    Lower,
+    Upper,
+    Replace(String, String),
+}
+
+impl StringStep {
+    /// Apply this step to one value; strip narrows a borrowed value
+    /// without copying, and the case steps reuse an owned buffer in place
+    fn apply<'a>(&self, value: Cow<'a, str>) -> Cow<'a, str> {
+        match self {
+            StringStep::Strip => match value {
+                Cow::Borrowed(s) => Cow::Borrowed(s.trim()),
+                Cow::Owned(s) if s.trim().len() == s.len() => Cow::Owned(s),
+                Cow::Owned(s) => Cow::Owned(s.trim().to_string()),
+            },
+            StringStep::Lower if value.is_ascii() => {
+                let mut s = value.into_owned();
+                s.make_ascii_lowercase();
+                Cow::Owned(s)
+            }
+            StringStep::Lower => Cow::Owned(value.to_lowercase()),
+            StringStep::Upper if value.is_ascii() => {
+                let mut s = value.into_owned();
+                s.make_ascii_uppercase();
+                Cow::Owned(s)
+            }
+            StringStep::Upper => Cow::Owned(value.to_uppercase()),
+            StringStep::Replace(from, to) => Cow::Owned(value.replace(from.as_str(), to)),
+        }
+    }
+}
+
+/// Builder for a chain of string operations on one column of a frame
+/// snapshot, run as a single pass per row by `finish` instead of
+/// materializing a column per step
+#[pyclass]
+pub struct TinyStringPipeline {
+    pub frame: TinyFrame,
+    pub column: String,
+    pub steps: Vec<StringStep>,
+}
+
+#[pymethods]
+impl TinyStringPipeline {
+    /// Strip leading and trailing whitespace.
+    fn strip(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.steps.push(StringStep::Strip);
+        slf
+    }
+
+    /// Convert to lowercase.
+    fn lower(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.steps.push(StringStep::Lower);
+        slf
+    }
+
+    /// Convert to uppercase.
+    fn upper(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.steps.push(StringStep::Upper);
+        slf
+    }
+
+    /// Replace every occurrence of `from` with `to`.
+    fn replace(mut slf: PyRefMut<Self>, from: String, to: String) -> PyRefMut<Self> {
+        slf.steps.push(StringStep::Replace(from, to));
+        slf
+    }
+
+    /// Run the pipeline.
+    ///
+    /// Args:
+    ///     output: Name of the column to add
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with the transformed string column added
+    fn finish(&self, output: String) -> PyResult<TinyFrame> {
+        StringOps::str_pipe_impl(&self.frame, &self.column, &self.steps, &output)
+    }
+}
@@ -1,22 +1,43 @@
 use pyo3::prelude::*;
 use time::{OffsetDateTime, PrimitiveDateTime, Date, Time, Month, Weekday};
+use time::format_description::BorrowedFormatItem;
+use time::macros::format_description;
 use std::collections::HashMap;
 use crate::frame::{TinyFrame, TinyColumn};
+use crate::parallel::map_rows;
+
+// Range of timestamps OffsetDateTime accepts: -9999-01-01 to 9999-12-31
+const MIN_TIMESTAMP: i64 = -377_705_116_800;
+const MAX_TIMESTAMP: i64 = 253_402_300_799;
+
+// Formats tried, in order, for strings the fixed-width readers do not take;
+// compiled once rather than re-parsed for every row
+const DATETIME_FORMATS: [&[BorrowedFormatItem<'static>]; 6] = [
+    format_description!("[year]-[month]-[day] [hour]:[minute]:[second]"),
+    format_description!("[year]-[month]-[day]"),
+    format_description!("[year]-[month]-[day]T[hour]:[minute]:[second]"),
+    format_description!("[year]-[month]-[day]T[hour]:[minute]:[second].[subsecond]"),
+    format_description!("[year]-[month]-[day]T[hour]:[minute]:[second].[subsecond]Z"),
+    format_description!("[year]-[month]-[day]T[hour]:[minute]:[second]Z"),
+];
 
 /// Time series operations for TinyFrame
 pub struct TimeSeriesOps;
 
 impl TimeSeriesOps {
-    /// Parse datetime strings and convert to timestamps
-    pub fn parse_datetime_strings(strings: Vec<String>) -> PyResult<Vec<i64>> {
-        let mut timestamps = Vec::new();
-        
-        for s in strings {
-            let timestamp = Self::parse_datetime_string(&s)?;
-            timestamps.push(timestamp);
-        }
-        
-        Ok(timestamps)
+    /// Parse datetime strings and convert to timestamps; nulls become 0,
+    /// the same value as an empty or unparseable string
+    pub fn parse_datetime_strings<'a>(strings: impl IntoIterator<Item = Option<&'a str>>) -> PyResult<Vec<i64>> {
+        strings.into_iter()
+            .map(|s| s.map_or(Ok(0), Self::parse_datetime_string))
+            .collect()
+    }
+
+    /// Parse a column of datetime strings in row order, nulls to 0, splitting
+    /// large columns into parallel stripes
+    fn parse_datetime_column<S: Sync>(values: &[S], as_str: impl Fn(&S) -> Option<&str> + Sync) -> PyResult<Vec<i64>> {
+        let parse = |value: &S| as_str(value).map_or(Ok(0), Self::parse_datetime_string);
+        map_rows(values, parse)
     }
 
     /// Parse a single datetime string to timestamp
@@ -26,17 +47,12 @@ impl TimeSeriesOps {
             return Ok(0);
         }
 
+        if let Some(timestamp) = Self::parse_fixed_datetime(input.as_bytes()) {
+            return Ok(timestamp);
+        }
+
         // Try common datetime formats using time crate
-        let formats = [
-            time::format_description::parse("[year]-[month]-[day] [hour]:[minute]:[second]").unwrap(),
-            time::format_description::parse("[year]-[month]-[day]").unwrap(),
-            time::format_description::parse("[year]-[month]-[day]T[hour]:[minute]:[second]").unwrap(),
-            time::format_description::parse("[year]-[month]-[day]T[hour]:[minute]:[second].[subsecond]").unwrap(),
-            time::format_description::parse("[year]-[month]-[day]T[hour]:[minute]:[second].[subsecond]Z").unwrap(),
-            time::format_description::parse("[year]-[month]-[day]T[hour]:[minute]:[second]Z").unwrap(),
-        ];
-
-        for format in &formats {
+        for format in DATETIME_FORMATS {
             if let Ok(dt) = PrimitiveDateTime::parse(input, format) {
                 return Ok(dt.assume_utc().unix_timestamp());
             }
@@ -46,86 +62,175 @@ impl TimeSeriesOps {
         Ok(0)
     }
 
+    /// Parse the fixed-width shapes straight from byte positions, picking
+    /// the reader by length. Strings shorter than any format, date-only ones
+    /// included, read as 0 as the format list would give them. Returns None
+    /// for any other shape or an out-of-range field, leaving those to the
+    /// format list.
+    fn parse_fixed_datetime(input: &[u8]) -> Option<i64> {
+        match input.len() {
+            0..=18 => Some(0),
+            19 => Self::parse_datetime_seconds(input),
+            20 if input[10] == b'T' && input[19] == b'Z' => Self::parse_datetime_seconds(&input[..19]),
+            21..=30 => Self::parse_datetime_subseconds(input),
+            _ => None,
+        }
+    }
+
+    /// Read `YYYY-MM-DDTHH:MM:SS.f` with 1-9 fractional digits and an
+    /// optional trailing `Z`; the fraction is dropped as the format list does
+    fn parse_datetime_subseconds(input: &[u8]) -> Option<i64> {
+        let digits = input[20..].strip_suffix(b"Z").unwrap_or(&input[20..]);
+        if input[10] != b'T' || input[19] != b'.' || !(1..=9).contains(&digits.len()) || !digits.iter().all(u8::is_ascii_digit) {
+            return None;
+        }
+        Self::parse_datetime_seconds(&input[..19])
+    }
+
+    /// Read `YYYY-MM-DD HH:MM:SS` (or `T`-separated) from exactly 19 bytes
+    fn parse_datetime_seconds(b: &[u8]) -> Option<i64> {
+        let sep = b[10];
+        if b[4] != b'-' || b[7] != b'-' || (sep != b' ' && sep != b'T') || b[13] != b':' || b[16] != b':' {
+            return None;
+        }
+
+        let num = |start: usize, end: usize| -> Option<i64> {
+            b[start..end].iter().try_fold(0i64, |acc, &d| d.is_ascii_digit().then(|| acc * 10 + (d - b'0') as i64))
+        };
+        let (year, month, day) = (num(0, 4)?, num(5, 7)?, num(8, 10)?);
+        let (hour, minute, second) = (num(11, 13)?, num(14, 16)?, num(17, 19)?);
+
+        // Checked without short-circuiting; an out-of-range month reads a
+        // clamped table entry but is rejected by the month check itself
+        let valid = (1..=12).contains(&month)
+            & (day >= 1)
+            & (day <= Self::days_in_month(year, month.clamp(1, 12)))
+            & (hour <= 23)
+            & (minute <= 59)
+            & (second <= 59);
+        if !valid {
+            return None;
+        }
+
+        Some(Self::days_from_civil(year, month, day) * 86_400 + hour * 3_600 + minute * 60 + second)
+    }
+
+    /// Number of days in `month` (1-12) of the proleptic Gregorian `year`
+    fn days_in_month(year: i64, month: i64) -> i64 {
+        const DAYS_IN_MONTH: [i64; 12] = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+        let leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0));
+        DAYS_IN_MONTH[(month - 1) as usize] + ((month == 2) & leap) as i64
+    }
+
+    /// Days since 1970-01-01 for a proleptic Gregorian date
+    fn days_from_civil(year: i64, month: i64, day: i64) -> i64 {
+        let year = if month <= 2 { year - 1 } else { year };
+        let era = year.div_euclid(400);
+        let year_of_era = year - era * 400;
+        let day_of_year = (153 * ((month + 9) % 12) + 2) / 5 + day - 1;
+        let day_of_era = year_of_era * 365 + year_of_era / 4 - year_of_era / 100 + day_of_year;
+        era * 146_097 + day_of_era - 719_468
+    }
+
+    /// Split a timestamp into its UTC (year, month, day) with integer
+    /// arithmetic, or None outside the years OffsetDateTime supports
+    fn civil_date(ts: i64) -> Option<(i64, i64, i64)> {
+        if !(MIN_TIMESTAMP..=MAX_TIMESTAMP).contains(&ts) {
+            return None;
+        }
+
+        let days = ts.div_euclid(86_400) + 719_468;
+        let era = days.div_euclid(146_097);
+        let day_of_era = days - era * 146_097;
+        let year_of_era = (day_of_era - day_of_era / 1_460 + day_of_era / 36_524 - day_of_era / 146_096) / 365;
+        let day_of_year = day_of_era - (365 * year_of_era + year_of_era / 4 - year_of_era / 100);
+        let shifted_month = (5 * day_of_year + 2) / 153;
+        let day = day_of_year - (153 * shifted_month + 2) / 5 + 1;
+        let month = if shifted_month < 10 { shifted_month + 3 } else { shifted_month - 9 };
+        let year = year_of_era + era * 400 + (month <= 2) as i64;
+        Some((year, month, day))
+    }
+
     /// Extract year from datetime timestamps
-    pub fn extract_year(timestamps: &[i64]) -> Vec<i32> {
+    pub fn extract_year(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.year()).unwrap_or(0)
+                    Self::civil_date(ts).map_or(0, |(year, _, _)| year)
                 }
             })
             .collect()
     }
 
     /// Extract month from datetime timestamps
-    pub fn extract_month(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_month(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.month() as u32).unwrap_or(0)
+                    Self::civil_date(ts).map_or(0, |(_, month, _)| month)
                 }
             })
             .collect()
     }
 
     /// Extract day from datetime timestamps
-    pub fn extract_day(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_day(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.day() as u32).unwrap_or(0)
+                    Self::civil_date(ts).map_or(0, |(_, _, day)| day)
                 }
             })
             .collect()
     }
 
     /// Extract hour from datetime timestamps
-    pub fn extract_hour(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_hour(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.hour() as u32).unwrap_or(0)
+                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.hour() as i64).unwrap_or(0)
                 }
             })
             .collect()
     }
 
     /// Extract minute from datetime timestamps
-    pub fn extract_minute(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_minute(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.minute() as u32).unwrap_or(0)
+                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.minute() as i64).unwrap_or(0)
                 }
             })
             .collect()
     }
 
     /// Extract second from datetime timestamps
-    pub fn extract_second(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_second(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.second() as u32).unwrap_or(0)
+                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.second() as i64).unwrap_or(0)
                 }
             })
             .collect()
     }
 
     /// Extract day of week from datetime timestamps (0 = Sunday, 1 = Monday, ..., 6 = Saturday)
-    pub fn extract_day_of_week(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_day_of_week(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
@@ -134,7 +239,7 @@ impl TimeSeriesOps {
                     OffsetDateTime::from_unix_timestamp(ts).map(|dt| {
                         // Convert time crate weekday (Sunday=6) to standard (Sunday=0)
                         let weekday = dt.weekday() as u8;
-                        if weekday == 6 { 0 } else { (weekday + 1) as u32 }
+                        if weekday == 6 { 0 } else { (weekday + 1) as i64 }
                     }).unwrap_or(0)
                 }
             })
@@ -142,13 +247,13 @@ impl TimeSeriesOps {
     }
 
     /// Extract day of year from datetime timestamps (1-366)
-    pub fn extract_day_of_year(timestamps: &[i64]) -> Vec<u32> {
+    pub fn extract_day_of_year(timestamps: &[i64]) -> Vec<i64> {
         timestamps.iter()
             .map(|&ts| {
                 if ts == 0 {
                     0  // Invalid date should return 0
                 } else {
-                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.ordinal() as u32).unwrap_or(0)
+                    OffsetDateTime::from_unix_timestamp(ts).map(|dt| dt.ordinal() as i64).unwrap_or(0)
                 }
             })
             .collect()
@@ -156,14 +261,13 @@ impl TimeSeriesOps {
 
     /// Calculate time differences between consecutive timestamps
     pub fn calculate_time_diffs(timestamps: &[i64]) -> Vec<Option<i64>> {
-        if timestamps.len() < 2 {
-            return vec![None; timestamps.len()];
+        if timestamps.is_empty() {
+            return Vec::new();
         }
 
-        let mut diffs = vec![None];
-        for i in 1..timestamps.len() {
-            diffs.push(Some(timestamps[i] - timestamps[i - 1]));
-        }
+        let mut diffs = Vec::with_capacity(timestamps.len());
+        diffs.push(None);
+        diffs.extend(timestamps.windows(2).map(|pair| Some(pair[1] - pair[0])));
         diffs
     }
 
@@ -183,19 +287,10 @@ impl TimeSeriesOps {
                 format!("Column '{}' not found", column)
             ))?;
 
-        let strings = match col {
-            TinyColumn::Str(v) => v.clone(),
-            TinyColumn::OptStr(v) => {
-                v.iter()
-                    .map(|opt| opt.as_ref().map(|s| s.clone()).unwrap_or_else(|| "".to_string()))
-                    .collect()
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+        let timestamps = Self::parsed_timestamps(col)?
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                 "to_timestamps only supported on string columns"
-            )),
-        };
-
-        let timestamps = Self::parse_datetime_strings(strings)?;
+            ))?;
         
         let mut new_columns = frame.columns.clone();
         new_columns.insert(format!("{}_timestamp", column), TinyColumn::Int(timestamps));
@@ -213,7 +308,7 @@ impl TimeSeriesOps {
         let years = Self::extract_year(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_year", column), TinyColumn::Int(years.into_iter().map(|y| y as i64).collect()));
+        new_columns.insert(format!("{}_year", column), TinyColumn::Int(years));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -228,7 +323,7 @@ impl TimeSeriesOps {
         let months = Self::extract_month(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_month", column), TinyColumn::Int(months.into_iter().map(|m| m as i64).collect()));
+        new_columns.insert(format!("{}_month", column), TinyColumn::Int(months));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -243,7 +338,7 @@ impl TimeSeriesOps {
         let days = Self::extract_day(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_day", column), TinyColumn::Int(days.into_iter().map(|d| d as i64).collect()));
+        new_columns.insert(format!("{}_day", column), TinyColumn::Int(days));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -258,7 +353,7 @@ impl TimeSeriesOps {
         let hours = Self::extract_hour(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_hour", column), TinyColumn::Int(hours.into_iter().map(|h| h as i64).collect()));
+        new_columns.insert(format!("{}_hour", column), TinyColumn::Int(hours));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -273,7 +368,7 @@ impl TimeSeriesOps {
         let minutes = Self::extract_minute(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_minute", column), TinyColumn::Int(minutes.into_iter().map(|m| m as i64).collect()));
+        new_columns.insert(format!("{}_minute", column), TinyColumn::Int(minutes));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -288,7 +383,7 @@ impl TimeSeriesOps {
         let seconds = Self::extract_second(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_second", column), TinyColumn::Int(seconds.into_iter().map(|s| s as i64).collect()));
+        new_columns.insert(format!("{}_second", column), TinyColumn::Int(seconds));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -303,7 +398,7 @@ impl TimeSeriesOps {
         let days_of_week = Self::extract_day_of_week(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_day_of_week", column), TinyColumn::Int(days_of_week.into_iter().map(|d| d as i64).collect()));
+        new_columns.insert(format!("{}_day_of_week", column), TinyColumn::Int(days_of_week));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -318,7 +413,7 @@ impl TimeSeriesOps {
         let days_of_year = Self::extract_day_of_year(&timestamps);
         
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_day_of_year", column), TinyColumn::Int(days_of_year.into_iter().map(|d| d as i64).collect()));
+        new_columns.insert(format!("{}_day_of_year", column), TinyColumn::Int(days_of_year));
         
         Ok(TinyFrame {
             columns: new_columns,
@@ -376,6 +471,16 @@ impl TimeSeriesOps {
         })
     }
 
+    /// Helper method to parse a string column to timestamps, or None for
+    /// other column types
+    fn parsed_timestamps(col: &TinyColumn) -> PyResult<Option<Vec<i64>>> {
+        match col {
+            TinyColumn::Str(v) => Self::parse_datetime_column(v, |s| Some(s.as_str())).map(Some),
+            TinyColumn::OptStr(v) => Self::parse_datetime_column(v, |s| s.as_deref()).map(Some),
+            _ => Ok(None),
+        }
+    }
+
     /// Helper method to get timestamps from a column
     fn get_timestamps_from_column(frame: &TinyFrame, column: &str) -> PyResult<Vec<i64>> {
         let col = frame.columns.get(column)
@@ -383,14 +488,11 @@ impl TimeSeriesOps {
                 format!("Column '{}' not found", column)
             ))?;
 
+        if let Some(timestamps) = Self::parsed_timestamps(col)? {
+            return Ok(timestamps);
+        }
+
         match col {
-            TinyColumn::Str(v) => Self::parse_datetime_strings(v.clone()),
-            TinyColumn::OptStr(v) => {
-                let strings: Vec<String> = v.iter()
-                    .map(|opt| opt.as_ref().map(|s| s.clone()).unwrap_or_else(|| "".to_string()))
-                    .collect();
-                Self::parse_datetime_strings(strings)
-            },
             TinyColumn::Int(v) => Ok(v.clone()), // Already timestamps
             TinyColumn::OptInt(v) => {
                 let timestamps: Vec<i64> = v.iter()
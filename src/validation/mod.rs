@@ -1,6 +1,53 @@
 use pyo3::prelude::*;
-use crate::frame::{TinyFrame, TinyColumn, ValueEnum};
-use std::collections::HashMap;
+use rayon::prelude::*;
+use crate::frame::{TinyFrame, TinyColumn};
+use crate::joins::float_key;
+use crate::parallel::PARALLEL_MIN_ROWS;
+use std::collections::{HashMap, HashSet};
+use std::hash::Hash;
+
+// Rows indexed by each parallel task
+const PARALLEL_CHUNK_ROWS: usize = 8_192;
+
+// Mark each row true the first time its key is seen. Rows without a key,
+// nulls and NaN, never repeat and are always true.
+fn first_occurrences<'a, S: Sync, K: Hash + Eq + Send + Sync>(values: &'a [S], key: impl Fn(&'a S) -> Option<K> + Sync) -> Vec<bool> {
+    if values.len() < PARALLEL_MIN_ROWS {
+        let mut seen = HashSet::with_capacity(values.len());
+        return values.iter().map(|value| key(value).map_or(true, |k| seen.insert(k))).collect();
+    }
+
+    // Each stripe maps its keys to the first row holding them and merging
+    // keeps the earliest row, so a row is a first occurrence exactly when
+    // it is its key's first row
+    let first_rows = values
+        .par_chunks(PARALLEL_CHUNK_ROWS)
+        .enumerate()
+        .map(|(chunk, rows)| {
+            let mut first = HashMap::with_capacity(rows.len());
+            for (i, value) in rows.iter().enumerate() {
+                if let Some(k) = key(value) {
+                    first.entry(k).or_insert(chunk * PARALLEL_CHUNK_ROWS + i);
+                }
+            }
+            first
+        })
+        .reduce(HashMap::new, |a, b| {
+            let (mut into, from) = if a.len() >= b.len() { (a, b) } else { (b, a) };
+            for (k, row) in from {
+                let first = into.entry(k).or_insert(row);
+                *first = (*first).min(row);
+            }
+            into
+        });
+
+    values
+        .par_iter()
+        .with_min_len(PARALLEL_CHUNK_ROWS)
+        .enumerate()
+        .map(|(row, value)| key(value).map_or(true, |k| first_rows[&k] == row))
+        .collect()
+}
 
 /// Validation operations for TinyFrame
 pub struct ValidationOps;
@@ -8,276 +55,153 @@ pub struct ValidationOps;
 impl ValidationOps {
     /// Validate that all values in a column are not null
     pub fn validate_not_null_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
+        Self::run_checks(frame, &[ValidationCheck::NotNull(column.to_string())])
+    }
+
+    /// Validate that all values in a numeric column are within a range
+    pub fn validate_range_impl(frame: &TinyFrame, column: &str, min: Option<f64>, max: Option<f64>) -> PyResult<TinyFrame> {
+        Self::run_checks(frame, &[ValidationCheck::Range(column.to_string(), min, max)])
+    }
+
+    /// Validate that all values in a string column match a pattern
+    pub fn validate_pattern_impl(frame: &TinyFrame, column: &str, pattern: &str) -> PyResult<TinyFrame> {
+        Self::run_checks(frame, &[ValidationCheck::Pattern(column.to_string(), pattern.to_string())])
+    }
+
+    /// Validate that all values in a column are unique
+    pub fn validate_unique_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
+        Self::run_checks(frame, &[ValidationCheck::Unique(column.to_string())])
+    }
+
+    /// Run `checks` in order on a single copy of the frame, each check
+    /// seeing the columns added by the ones before it
+    pub fn run_checks(frame: &TinyFrame, checks: &[ValidationCheck]) -> PyResult<TinyFrame> {
+        let mut result = TinyFrame {
+            columns: frame.columns.clone(),
+            length: frame.length,
+            py_objects: frame.py_objects.clone(),
+        };
+
+        for check in checks {
+            let validation_results = check.evaluate(&result)?;
+            result.columns.insert(check.output_name(), TinyColumn::Bool(validation_results));
+        }
+
+        Ok(result)
+    }
+
+    /// Per-row not-null results for a column
+    fn not_null_mask(frame: &TinyFrame, column: &str) -> PyResult<Vec<bool>> {
         let col = frame.columns.get(column)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
 
-        let mut validation_results = Vec::new();
-        let mut _error_count = 0;
-
-        match col {
+        // Each optional column's Option tags already are the answer, read in
+        // one pass with no per-row branching or bookkeeping
+        let validation_results = match col {
             TinyColumn::Int(_) | TinyColumn::Float(_) | TinyColumn::Str(_) | TinyColumn::Bool(_) => {
                 // Non-optional columns are always not null
-                validation_results = vec![true; frame.length];
-            },
-            TinyColumn::OptInt(v) => {
-                for val in v {
-                    let is_valid = val.is_some();
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for val in v {
-                    let is_valid = val.is_some();
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptStr(v) => {
-                for val in v {
-                    let is_valid = val.is_some();
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptBool(v) => {
-                for val in v {
-                    let is_valid = val.is_some();
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
+                vec![true; frame.length]
             },
+            TinyColumn::OptInt(v) => v.iter().map(Option::is_some).collect(),
+            TinyColumn::OptFloat(v) => v.iter().map(Option::is_some).collect(),
+            TinyColumn::OptStr(v) => v.iter().map(Option::is_some).collect(),
+            TinyColumn::OptBool(v) => v.iter().map(Option::is_some).collect(),
             _ => {
                 return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Validation not supported for this column type"
                 ));
             }
-        }
+        };
 
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_not_null", column), TinyColumn::Bool(validation_results));
-
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Ok(validation_results)
     }
 
-    /// Validate that all values in a numeric column are within a range
-    pub fn validate_range_impl(frame: &TinyFrame, column: &str, min: Option<f64>, max: Option<f64>) -> PyResult<TinyFrame> {
+    /// Per-row range results for a numeric column
+    fn range_mask(frame: &TinyFrame, column: &str, min: Option<f64>, max: Option<f64>) -> PyResult<Vec<bool>> {
         let col = frame.columns.get(column)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
 
-        let mut validation_results = Vec::new();
-        let mut _error_count = 0;
-
-        match col {
-            TinyColumn::Int(v) => {
-                for val in v {
-                    let val_f64 = *val as f64;
-                    let is_valid = (min.is_none() || val_f64 >= min.unwrap()) && 
-                                  (max.is_none() || val_f64 <= max.unwrap());
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::Float(v) => {
-                for val in v {
-                    let is_valid = (min.is_none() || *val >= min.unwrap()) && 
-                                  (max.is_none() || *val <= max.unwrap());
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => {
-                            let val_f64 = *val as f64;
-                            (min.is_none() || val_f64 >= min.unwrap()) && 
-                            (max.is_none() || val_f64 <= max.unwrap())
-                        },
-                        None => true, // null values are considered valid for range validation
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => {
-                            (min.is_none() || *val >= min.unwrap()) && 
-                            (max.is_none() || *val <= max.unwrap())
-                        },
-                        None => true, // null values are considered valid for range validation
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
+        // Open bounds compare against infinity so each row is one branch-free
+        // pair of compares; with neither bound every row passes, NaN included
+        let unbounded = min.is_none() && max.is_none();
+        let lo = min.unwrap_or(f64::NEG_INFINITY);
+        let hi = max.unwrap_or(f64::INFINITY);
+        let in_range = |x: f64| unbounded | ((x >= lo) & (x <= hi));
+
+        let validation_results: Vec<bool> = match col {
+            TinyColumn::Int(v) => v.iter().map(|&x| in_range(x as f64)).collect(),
+            TinyColumn::Float(v) => v.iter().map(|&x| in_range(x)).collect(),
+            // null values are considered valid for range validation; a null
+            // is compared as 0 and then OR-ed with its null flag, so rows take
+            // no branch on whether they hold a value
+            TinyColumn::OptInt(v) => v.iter().map(|x| x.is_none() | in_range(x.unwrap_or_default() as f64)).collect(),
+            TinyColumn::OptFloat(v) => v.iter().map(|x| x.is_none() | in_range(x.unwrap_or_default())).collect(),
             _ => {
                 return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Range validation only supported for numeric columns"
                 ));
             }
-        }
-
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_in_range", column), TinyColumn::Bool(validation_results));
+        };
 
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Ok(validation_results)
     }
 
-    /// Validate that all values in a string column match a pattern
-    pub fn validate_pattern_impl(frame: &TinyFrame, column: &str, pattern: &str) -> PyResult<TinyFrame> {
+    /// Per-row pattern results for a string column
+    fn pattern_mask(frame: &TinyFrame, column: &str, pattern: &str) -> PyResult<Vec<bool>> {
         let col = frame.columns.get(column)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
 
-        let mut validation_results = Vec::new();
-        let mut _error_count = 0;
+        // The pattern is a literal substring; its searcher is built once
+        // and reused for every row
+        let finder = memchr::memmem::Finder::new(pattern);
+        let matches = |s: &str| finder.find(s.as_bytes()).is_some();
 
-        match col {
-            TinyColumn::Str(v) => {
-                for val in v {
-                    let is_valid = val.contains(pattern);
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptStr(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => val.contains(pattern),
-                        None => true, // null values are considered valid for pattern validation
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
+        let validation_results: Vec<bool> = match col {
+            TinyColumn::Str(v) => v.iter().map(|s| matches(s)).collect(),
+            // null values are considered valid for pattern validation
+            TinyColumn::OptStr(v) => v.iter().map(|s| s.as_deref().map_or(true, matches)).collect(),
             _ => {
                 return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Pattern validation only supported for string columns"
                 ));
             }
-        }
+        };
 
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_matches_pattern", column), TinyColumn::Bool(validation_results));
-
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Ok(validation_results)
     }
 
-    /// Validate that all values in a column are unique
-    pub fn validate_unique_impl(frame: &TinyFrame, column: &str) -> PyResult<TinyFrame> {
+    /// Per-row uniqueness results for a column
+    fn unique_mask(frame: &TinyFrame, column: &str) -> PyResult<Vec<bool>> {
         let col = frame.columns.get(column)
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                 format!("Column '{}' not found", column)
             ))?;
 
-        let mut validation_results = Vec::new();
-        let mut seen_values = std::collections::HashSet::new();
-        let mut _error_count = 0;
-
-        match col {
-            TinyColumn::Int(v) => {
-                for val in v {
-                    let is_valid = seen_values.insert(ValueEnum::Int(*val));
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::Float(v) => {
-                for val in v {
-                    let is_valid = seen_values.insert(ValueEnum::Float(*val));
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::Str(v) => {
-                for val in v {
-                    let is_valid = seen_values.insert(ValueEnum::Str(val.clone()));
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::Bool(v) => {
-                for val in v {
-                    let is_valid = seen_values.insert(ValueEnum::Bool(*val));
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => seen_values.insert(ValueEnum::Int(*val)),
-                        None => true, // null values are considered valid for uniqueness
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => seen_values.insert(ValueEnum::Float(*val)),
-                        None => true, // null values are considered valid for uniqueness
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptStr(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => seen_values.insert(ValueEnum::Str(val.clone())),
-                        None => true, // null values are considered valid for uniqueness
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
-            TinyColumn::OptBool(v) => {
-                for val in v {
-                    let is_valid = match val {
-                        Some(val) => seen_values.insert(ValueEnum::Bool(*val)),
-                        None => true, // null values are considered valid for uniqueness
-                    };
-                    if !is_valid { _error_count += 1; }
-                    validation_results.push(is_valid);
-                }
-            },
+        // Keyed on the column's own values, borrowing strings and folding
+        // floats to bits, rather than boxing each row into a ValueEnum
+        let validation_results = match col {
+            TinyColumn::Int(v) => first_occurrences(v, Some),
+            TinyColumn::Float(v) => first_occurrences(v, |&x| float_key(x)),
+            TinyColumn::Str(v) => first_occurrences(v, |s| Some(s.as_str())),
+            TinyColumn::Bool(v) => first_occurrences(v, Some),
+            TinyColumn::OptInt(v) => first_occurrences(v, Option::as_ref),
+            TinyColumn::OptFloat(v) => first_occurrences(v, |x| x.and_then(float_key)),
+            TinyColumn::OptStr(v) => first_occurrences(v, |s| s.as_deref()),
+            TinyColumn::OptBool(v) => first_occurrences(v, Option::as_ref),
             _ => {
                 return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Uniqueness validation not supported for this column type"
                 ));
             }
-        }
+        };
 
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_unique", column), TinyColumn::Bool(validation_results));
-
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Ok(validation_results)
     }
 
     /// Get validation summary for a column
@@ -287,34 +211,20 @@ impl ValidationOps {
                 format!("Column '{}' not found", column)
             ))?;
 
-        let mut summary = HashMap::new();
-        let mut null_count = 0;
-        let total_count = frame.length;
-
-        match col {
-            TinyColumn::Int(_) | TinyColumn::Float(_) | TinyColumn::Str(_) | TinyColumn::Bool(_) => {
-                summary.insert("null_count".to_string(), 0.0);
-                summary.insert("null_percentage".to_string(), 0.0);
-            },
-            TinyColumn::OptInt(v) => {
-                null_count = v.iter().filter(|x| x.is_none()).count();
-            },
-            TinyColumn::OptFloat(v) => {
-                null_count = v.iter().filter(|x| x.is_none()).count();
-            },
-            TinyColumn::OptStr(v) => {
-                null_count = v.iter().filter(|x| x.is_none()).count();
-            },
-            TinyColumn::OptBool(v) => {
-                null_count = v.iter().filter(|x| x.is_none()).count();
-            },
+        // Every other figure follows from the row count and the null count,
+        // which is the only pass over the column
+        let null_count = match col {
+            TinyColumn::Int(_) | TinyColumn::Float(_) | TinyColumn::Str(_) | TinyColumn::Bool(_)
+            | TinyColumn::OptInt(_) | TinyColumn::OptFloat(_) | TinyColumn::OptStr(_) | TinyColumn::OptBool(_) => col.null_count(),
             _ => {
                 return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
                     "Validation summary not supported for this column type"
                 ));
             }
-        }
+        };
+        let total_count = frame.length;
 
+        let mut summary = HashMap::with_capacity(4);
         summary.insert("null_count".to_string(), null_count as f64);
         summary.insert("null_percentage".to_string(), (null_count as f64 / total_count as f64) * 100.0);
         summary.insert("total_count".to_string(), total_count as f64);
@@ -323,3 +233,101 @@ impl ValidationOps {
         Ok(summary)
     }
 }
+
+/// One check of a validation plan
+pub enum ValidationCheck {
+    NotNull(String),
+    Range(String, Option<f64>, Option<f64>),
+    Pattern(String, String),
+    Unique(String),
+}
+
+impl ValidationCheck {
+    /// Name of the column this check reads
+    fn column(&self) -> &str {
+        match self {
+            ValidationCheck::NotNull(column)
+            | ValidationCheck::Range(column, _, _)
+            | ValidationCheck::Pattern(column, _)
+            | ValidationCheck::Unique(column) => column,
+        }
+    }
+
+    /// Name of the boolean column this check adds
+    fn output_name(&self) -> String {
+        match self {
+            ValidationCheck::NotNull(column) => format!("{}_not_null", column),
+            ValidationCheck::Range(column, _, _) => format!("{}_in_range", column),
+            ValidationCheck::Pattern(column, _) => format!("{}_matches_pattern", column),
+            ValidationCheck::Unique(column) => format!("{}_unique", column),
+        }
+    }
+
+    fn evaluate(&self, frame: &TinyFrame) -> PyResult<Vec<bool>> {
+        match self {
+            ValidationCheck::NotNull(column) => ValidationOps::not_null_mask(frame, column),
+            ValidationCheck::Range(column, min, max) => ValidationOps::range_mask(frame, column, *min, *max),
+            ValidationCheck::Pattern(column, pattern) => ValidationOps::pattern_mask(frame, column, pattern),
+            ValidationCheck::Unique(column) => ValidationOps::unique_mask(frame, column),
+        }
+    }
+}
+
+/// Builder for several validations of a frame snapshot, run together by
+/// `run` into one new frame instead of one copy per chained call
+#[pyclass]
+pub struct TinyValidationPlan {
+    pub frame: TinyFrame,
+    pub checks: Vec<ValidationCheck>,
+}
+
+impl TinyValidationPlan {
+    // Queue `check`, failing now unless its column is in the frame or is
+    // added by an earlier check
+    fn push(&mut self, check: ValidationCheck) -> PyResult<()> {
+        let column = check.column();
+        if !self.frame.columns.contains_key(column) && !self.checks.iter().any(|c| c.output_name() == column) {
+            return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
+                format!("Column '{}' not found", column)
+            ));
+        }
+        self.checks.push(check);
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl TinyValidationPlan {
+    /// Check that values are not null.
+    fn not_null(mut slf: PyRefMut<Self>, column: String) -> PyResult<PyRefMut<Self>> {
+        slf.push(ValidationCheck::NotNull(column))?;
+        Ok(slf)
+    }
+
+    /// Check that numeric values lie within `min` and `max`; either may be None.
+    fn range(mut slf: PyRefMut<Self>, column: String, min: Option<f64>, max: Option<f64>) -> PyResult<PyRefMut<Self>> {
+        slf.push(ValidationCheck::Range(column, min, max))?;
+        Ok(slf)
+    }
+
+    /// Check that string values contain `pattern`.
+    fn pattern(mut slf: PyRefMut<Self>, column: String, pattern: String) -> PyResult<PyRefMut<Self>> {
+        slf.push(ValidationCheck::Pattern(column, pattern))?;
+        Ok(slf)
+    }
+
+    /// Check that values are unique.
+    fn unique(mut slf: PyRefMut<Self>, column: String) -> PyResult<PyRefMut<Self>> {
+        slf.push(ValidationCheck::Unique(column))?;
+        Ok(slf)
+    }
+
+    /// Run the plan.
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with one boolean column added per check, named
+    ///     as by the matching `validate_*` method
+    fn run(&self) -> PyResult<TinyFrame> {
+        ValidationOps::run_checks(&self.frame, &self.checks)
+    }
+}
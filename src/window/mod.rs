@@ -1,5 +1,7 @@
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use crate::frame::{TinyFrame, TinyColumn};
+use crate::parallel::PARALLEL_MIN_ROWS;
 use std::collections::HashMap;
 
 /// Rolling window configuration
@@ -40,456 +42,367 @@ impl ExpandingWindow {
     }
 }
 
+// What a rolling kernel keeps about the non-null values inside the window
+trait WindowState: Default {
+    fn push(&mut self, x: f64);
+    fn pop(&mut self, x: f64);
+    fn count(&self) -> usize;
+
+    // Whether a removal cancelled so much of the state that it should be
+    // rebuilt from the values still in the window
+    fn needs_rebuild(&self) -> bool {
+        false
+    }
+}
+
+// Running total of the non-null values inside a window. NaN and infinities
+// are counted instead of added, so the finite total is still exact once
+// they leave the window rather than staying NaN for the rest of the column.
+// The finite total carries Neumaier's compensation for the low-order bits
+// each addition rounds away, so long expanding sums and windows that a
+// large value has passed through stay accurate.
+#[derive(Default)]
+struct WindowSum {
+    finite: f64,
+    compensation: f64,
+    count: usize,
+    nan: usize,
+    pos_inf: usize,
+    neg_inf: usize,
+}
+
+impl WindowState for WindowSum {
+    fn push(&mut self, x: f64) {
+        self.count += 1;
+        if x.is_finite() {
+            self.add_finite(x);
+        } else if x.is_nan() {
+            self.nan += 1;
+        } else if x > 0.0 {
+            self.pos_inf += 1;
+        } else {
+            self.neg_inf += 1;
+        }
+    }
+
+    fn pop(&mut self, x: f64) {
+        self.count -= 1;
+        if x.is_finite() {
+            self.add_finite(-x);
+        } else if x.is_nan() {
+            self.nan -= 1;
+        } else if x > 0.0 {
+            self.pos_inf -= 1;
+        } else {
+            self.neg_inf -= 1;
+        }
+    }
+
+    fn count(&self) -> usize {
+        self.count
+    }
+}
+
+impl WindowSum {
+    fn add_finite(&mut self, x: f64) {
+        let total = self.finite + x;
+        self.compensation += if self.finite.abs() >= x.abs() {
+            (self.finite - total) + x
+        } else {
+            (x - total) + self.finite
+        };
+        self.finite = total;
+    }
+
+    fn sum(&self) -> f64 {
+        if self.nan > 0 || (self.pos_inf > 0 && self.neg_inf > 0) {
+            f64::NAN
+        } else if self.pos_inf > 0 {
+            f64::INFINITY
+        } else if self.neg_inf > 0 {
+            f64::NEG_INFINITY
+        } else {
+            self.finite + self.compensation
+        }
+    }
+}
+
+// Mean and sum of squared deviations of the finite values inside a window,
+// updated one value at a time with Welford's method. This avoids the
+// cancellation of subtracting a squared sum, so constant windows give
+// exactly zero. Any NaN or infinity makes the deviation NaN, so those
+// are only counted.
+#[derive(Default)]
+struct WindowMoments {
+    count: usize,
+    non_finite: usize,
+    mean: f64,
+    m2: f64,
+    cancelled: bool,
+}
+
+impl WindowState for WindowMoments {
+    fn push(&mut self, x: f64) {
+        self.count += 1;
+        if !x.is_finite() {
+            self.non_finite += 1;
+            return;
+        }
+        let n = (self.count - self.non_finite) as f64;
+        let delta = x - self.mean;
+        self.mean += delta / n;
+        self.m2 += delta * (x - self.mean);
+    }
+
+    fn pop(&mut self, x: f64) {
+        self.count -= 1;
+        if !x.is_finite() {
+            self.non_finite -= 1;
+            return;
+        }
+        let n = self.count - self.non_finite;
+        if n == 0 {
+            self.mean = 0.0;
+            self.m2 = 0.0;
+            return;
+        }
+        let delta = x - self.mean;
+        let m2 = self.m2;
+        self.mean -= delta / n as f64;
+        self.m2 -= delta * (x - self.mean);
+        // Removing an outlier can leave m2 far smaller than the rounding
+        // error it carried, e.g. a window going from [1e6, 5] to [5, 8]
+        self.cancelled |= self.m2 < m2 * 1e-6;
+    }
+
+    fn count(&self) -> usize {
+        self.count
+    }
+
+    fn needs_rebuild(&self) -> bool {
+        self.cancelled
+    }
+}
+
+impl WindowMoments {
+    // Population standard deviation, dividing by the number of values
+    fn std(&self) -> f64 {
+        if self.non_finite > 0 {
+            return f64::NAN;
+        }
+        (self.m2.max(0.0) / self.count as f64).sqrt()
+    }
+}
+
+/// Statistic a window op computes over each window
+#[derive(Clone, Copy, Debug)]
+pub enum WindowStat {
+    Mean,
+    Sum,
+    Std,
+}
+
+/// One window op of a window plan
+#[derive(Clone, Debug)]
+pub enum WindowOp {
+    Rolling(WindowStat, RollingWindow),
+    Expanding(WindowStat, ExpandingWindow),
+}
+
+impl WindowOp {
+    /// Name of the column this op adds
+    fn output_name(&self, column: &str) -> String {
+        let (kind, stat) = match self {
+            WindowOp::Rolling(stat, _) => ("rolling", stat),
+            WindowOp::Expanding(stat, _) => ("expanding", stat),
+        };
+        let stat = match stat {
+            WindowStat::Mean => "mean",
+            WindowStat::Sum => "sum",
+            WindowStat::Std => "std",
+        };
+        format!("{}_{}_{}", column, kind, stat)
+    }
+
+    fn cursor(&self, len: usize) -> WindowCursor {
+        // An expanding window is a rolling window that never drops a value,
+        // so each row costs one addition instead of a re-sum of the prefix
+        let (stat, window) = match self {
+            WindowOp::Rolling(stat, window) => (*stat, window.clone()),
+            WindowOp::Expanding(stat, window) => (*stat, RollingWindow::new(usize::MAX).min_periods(window.min_periods)),
+        };
+        // No window of a column this short holds min_periods values, e.g. a
+        // window larger than the frame, so every result is null
+        if window.min_periods > len {
+            return WindowCursor::Unfilled(len);
+        }
+        match stat {
+            WindowStat::Mean => WindowCursor::Sum(FoldCursor::new(window, len, |acc| acc.sum() / acc.count as f64)),
+            WindowStat::Sum => WindowCursor::Sum(FoldCursor::new(window, len, WindowSum::sum)),
+            WindowStat::Std => WindowCursor::Moments(FoldCursor::new(window, len, WindowMoments::std)),
+        }
+    }
+}
+
+// Results of one op so far, and the state of its window, while a pass over
+// the column moves every op's window forward one row at a time
+struct FoldCursor<S> {
+    acc: S,
+    window: RollingWindow,
+    finish: fn(&S) -> f64,
+    result_values: Vec<Option<f64>>,
+}
+
+impl<S: WindowState> FoldCursor<S> {
+    fn new(window: RollingWindow, len: usize, finish: fn(&S) -> f64) -> Self {
+        FoldCursor { acc: S::default(), window, finish, result_values: Vec::with_capacity(len) }
+    }
+
+    // Slide the window to end at row `i` and record its result: the new
+    // value is added to the state and the one leaving is removed, rather
+    // than re-reading the whole window
+    fn step<T: Copy>(&mut self, values: &[T], i: usize, value: &impl Fn(T) -> Option<f64>) {
+        let window_size = self.window.window_size;
+        if let Some(x) = value(values[i]) {
+            self.acc.push(x);
+        }
+        if i >= window_size {
+            if let Some(x) = value(values[i - window_size]) {
+                self.acc.pop(x);
+            }
+        }
+        if self.acc.needs_rebuild() {
+            self.acc = S::default();
+            for &v in &values[(i + 1).saturating_sub(window_size)..=i] {
+                if let Some(x) = value(v) {
+                    self.acc.push(x);
+                }
+            }
+        }
+        // Only non-null values count towards min_periods
+        let result = if self.acc.count() >= self.window.min_periods { Some((self.finish)(&self.acc)) } else { None };
+        self.result_values.push(result);
+    }
+}
+
+enum WindowCursor {
+    Sum(FoldCursor<WindowSum>),
+    Moments(FoldCursor<WindowMoments>),
+    // All `len` results are null, known without reading the column
+    Unfilled(usize),
+}
+
+impl WindowCursor {
+    fn into_result_values(self) -> Vec<Option<f64>> {
+        match self {
+            WindowCursor::Sum(cursor) => cursor.result_values,
+            WindowCursor::Moments(cursor) => cursor.result_values,
+            WindowCursor::Unfilled(len) => vec![None; len],
+        }
+    }
+}
+
+// One pass over the column, moving every cursor forward at each row
+fn fold_values<T: Copy>(values: &[T], value: impl Fn(T) -> Option<f64>, cursors: &mut [WindowCursor]) {
+    if cursors.iter().all(|cursor| matches!(cursor, WindowCursor::Unfilled(_))) {
+        return;
+    }
+    for i in 0..values.len() {
+        for cursor in cursors.iter_mut() {
+            match cursor {
+                WindowCursor::Sum(cursor) => cursor.step(values, i, &value),
+                WindowCursor::Moments(cursor) => cursor.step(values, i, &value),
+                WindowCursor::Unfilled(_) => {}
+            }
+        }
+    }
+}
+
+// Results of every op in `ops` over one column, from a single pass
+fn window_results(col: &TinyColumn, ops: &[WindowOp], len: usize) -> PyResult<Vec<Vec<Option<f64>>>> {
+    let mut cursors: Vec<WindowCursor> = ops.iter().map(|op| op.cursor(len)).collect();
+    match col {
+        TinyColumn::Float(v) => fold_values(v, Some, &mut cursors),
+        TinyColumn::Int(v) => fold_values(v, |x| Some(x as f64), &mut cursors),
+        TinyColumn::OptFloat(v) => fold_values(v, |x| x, &mut cursors),
+        TinyColumn::OptInt(v) => fold_values(v, |x| x.map(|x| x as f64), &mut cursors),
+        _ => {
+            let message = match ops.first() {
+                Some(WindowOp::Expanding(..)) => "Expanding operations only supported on numeric columns",
+                _ => "Rolling operations only supported on numeric columns",
+            };
+            return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(message));
+        }
+    }
+    Ok(cursors.into_iter().map(WindowCursor::into_result_values).collect())
+}
+
 /// Window functions for TinyFrame
 pub struct WindowOps;
 
 impl WindowOps {
     /// Calculate rolling mean
     pub fn rolling_mean_impl(frame: &TinyFrame, column: &str, window: RollingWindow) -> PyResult<TinyFrame> {
-        let col = frame.columns.get(column)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
-                format!("Column '{}' not found", column)
-            ))?;
-
-        let mut result_values = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values = &v[start..=i];
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::Int(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter().map(|&x| x as f64).collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_slice = &v[start..=i];
-                    let non_null_count = window_slice.iter().filter(|&&x| x.is_some()).count();
-                    
-                    if non_null_count >= window.min_periods {
-                        let window_values: Vec<f64> = window_slice.iter()
-                            .filter_map(|&x| x)
-                            .collect();
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_slice = &v[start..=i];
-                    let non_null_count = window_slice.iter().filter(|&&x| x.is_some()).count();
-                    
-                    if non_null_count >= window.min_periods {
-                        let window_values: Vec<f64> = window_slice.iter()
-                            .filter_map(|&x| x.map(|v| v as f64))
-                            .collect();
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Rolling operations only supported on numeric columns"
-            )),
-        }
-
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_rolling_mean", column), TinyColumn::OptFloat(result_values));
-        
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Self::run_ops(frame, column, &[WindowOp::Rolling(WindowStat::Mean, window)])
     }
 
     /// Calculate rolling sum
     pub fn rolling_sum_impl(frame: &TinyFrame, column: &str, window: RollingWindow) -> PyResult<TinyFrame> {
-        let col = frame.columns.get(column)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
-                format!("Column '{}' not found", column)
-            ))?;
-
-        let mut result_values = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values = &v[start..=i];
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::Int(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter().map(|&x| x as f64).collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_slice = &v[start..=i];
-                    let non_null_count = window_slice.iter().filter(|&&x| x.is_some()).count();
-                    
-                    if non_null_count >= window.min_periods {
-                        let window_values: Vec<f64> = window_slice.iter()
-                            .filter_map(|&x| x)
-                            .collect();
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter()
-                        .filter_map(|&x| x.map(|v| v as f64))
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Rolling operations only supported on numeric columns"
-            )),
-        }
-
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_rolling_sum", column), TinyColumn::OptFloat(result_values));
-        
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Self::run_ops(frame, column, &[WindowOp::Rolling(WindowStat::Sum, window)])
     }
 
     /// Calculate rolling standard deviation
     pub fn rolling_std_impl(frame: &TinyFrame, column: &str, window: RollingWindow) -> PyResult<TinyFrame> {
-        let col = frame.columns.get(column)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
-                format!("Column '{}' not found", column)
-            ))?;
-
-        let mut result_values = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values = &v[start..=i];
-                    if window_values.len() >= window.min_periods {
-                        let mean = window_values.iter().sum::<f64>() / window_values.len() as f64;
-                        let variance = window_values.iter()
-                            .map(|&x| (x - mean).powi(2))
-                            .sum::<f64>() / window_values.len() as f64;
-                        result_values.push(Some(variance.sqrt()));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::Int(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter().map(|&x| x as f64).collect();
-                    if window_values.len() >= window.min_periods {
-                        let mean = window_values.iter().sum::<f64>() / window_values.len() as f64;
-                        let variance = window_values.iter()
-                            .map(|&x| (x - mean).powi(2))
-                            .sum::<f64>() / window_values.len() as f64;
-                        result_values.push(Some(variance.sqrt()));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter()
-                        .filter_map(|&x| x)
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let mean = window_values.iter().sum::<f64>() / window_values.len() as f64;
-                        let variance = window_values.iter()
-                            .map(|&x| (x - mean).powi(2))
-                            .sum::<f64>() / window_values.len() as f64;
-                        result_values.push(Some(variance.sqrt()));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for i in 0..v.len() {
-                    let start = if i + 1 >= window.window_size {
-                        i + 1 - window.window_size
-                    } else {
-                        0
-                    };
-                    
-                    let window_values: Vec<f64> = v[start..=i].iter()
-                        .filter_map(|&x| x.map(|v| v as f64))
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let mean = window_values.iter().sum::<f64>() / window_values.len() as f64;
-                        let variance = window_values.iter()
-                            .map(|&x| (x - mean).powi(2))
-                            .sum::<f64>() / window_values.len() as f64;
-                        result_values.push(Some(variance.sqrt()));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Rolling operations only supported on numeric columns"
-            )),
-        }
-
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_rolling_std", column), TinyColumn::OptFloat(result_values));
-        
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+        Self::run_ops(frame, column, &[WindowOp::Rolling(WindowStat::Std, window)])
     }
 
     /// Calculate expanding mean
     pub fn expanding_mean_impl(frame: &TinyFrame, column: &str, window: ExpandingWindow) -> PyResult<TinyFrame> {
-        let col = frame.columns.get(column)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
-                format!("Column '{}' not found", column)
-            ))?;
-
-        let mut result_values = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                for i in 0..v.len() {
-                    let window_values = &v[0..=i];
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::Int(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter().map(|&x| x as f64).collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter()
-                        .filter_map(|&x| x)
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter()
-                        .filter_map(|&x| x.map(|v| v as f64))
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum / window_values.len() as f64));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Expanding operations only supported on numeric columns"
-            )),
-        }
+        Self::run_ops(frame, column, &[WindowOp::Expanding(WindowStat::Mean, window)])
+    }
 
-        let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_expanding_mean", column), TinyColumn::OptFloat(result_values));
-        
-        Ok(TinyFrame {
-            columns: new_columns,
-            length: frame.length,
-            py_objects: frame.py_objects.clone(),
-        })
+    /// Calculate rolling mean for several columns
+    pub fn rolling_mean_many_impl(frame: &TinyFrame, columns: &[String], window: RollingWindow) -> PyResult<TinyFrame> {
+        Self::run_ops_many(frame, columns, &[WindowOp::Rolling(WindowStat::Mean, window)])
     }
 
     /// Calculate expanding sum
     pub fn expanding_sum_impl(frame: &TinyFrame, column: &str, window: ExpandingWindow) -> PyResult<TinyFrame> {
-        let col = frame.columns.get(column)
-            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
-                format!("Column '{}' not found", column)
-            ))?;
-
-        let mut result_values = Vec::new();
-        match col {
-            TinyColumn::Float(v) => {
-                for i in 0..v.len() {
-                    let window_values = &v[0..=i];
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::Int(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter().map(|&x| x as f64).collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptFloat(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter()
-                        .filter_map(|&x| x)
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            TinyColumn::OptInt(v) => {
-                for i in 0..v.len() {
-                    let window_values: Vec<f64> = v[0..=i].iter()
-                        .filter_map(|&x| x.map(|v| v as f64))
-                        .collect();
-                    if window_values.len() >= window.min_periods {
-                        let sum: f64 = window_values.iter().sum();
-                        result_values.push(Some(sum));
-                    } else {
-                        result_values.push(None);
-                    }
-                }
-            },
-            _ => return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
-                "Expanding operations only supported on numeric columns"
-            )),
-        }
+        Self::run_ops(frame, column, &[WindowOp::Expanding(WindowStat::Sum, window)])
+    }
+
+    /// Run `ops` over `column` in a single pass, adding one column per op to
+    /// a single copy of the frame
+    pub fn run_ops(frame: &TinyFrame, column: &str, ops: &[WindowOp]) -> PyResult<TinyFrame> {
+        Self::run_ops_many(frame, &[column.to_string()], ops)
+    }
+
+    /// Run `ops` over each of `columns`, adding one column per column and op
+    /// to a single copy of the frame. Columns are independent, so on large
+    /// frames each one is folded on its own thread.
+    pub fn run_ops_many(frame: &TinyFrame, columns: &[String], ops: &[WindowOp]) -> PyResult<TinyFrame> {
+        let cols = columns
+            .iter()
+            .map(|column| {
+                frame.columns.get(column).ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>(
+                    format!("Column '{}' not found", column)
+                ))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+
+        let results = if frame.length >= PARALLEL_MIN_ROWS && cols.len() > 1 {
+            cols.par_iter().map(|col| window_results(col, ops, frame.length)).collect::<PyResult<Vec<_>>>()?
+        } else {
+            cols.iter().map(|col| window_results(col, ops, frame.length)).collect::<PyResult<Vec<_>>>()?
+        };
 
         let mut new_columns = frame.columns.clone();
-        new_columns.insert(format!("{}_expanding_sum", column), TinyColumn::OptFloat(result_values));
-        
+        for (column, result_columns) in columns.iter().zip(results) {
+            for (op, result_values) in ops.iter().zip(result_columns) {
+                new_columns.insert(op.output_name(column), TinyColumn::OptFloat(result_values));
+            }
+        }
+
         Ok(TinyFrame {
             columns: new_columns,
             length: frame.length,
@@ -497,3 +410,54 @@ impl WindowOps {
         })
     }
 }
+
+/// Builder for several window ops over one column of a frame snapshot,
+/// computed together by `run` in a single pass over the column
+#[pyclass]
+pub struct TinyWindowPlan {
+    pub frame: TinyFrame,
+    pub column: String,
+    pub ops: Vec<WindowOp>,
+}
+
+#[pymethods]
+impl TinyWindowPlan {
+    /// Add a rolling mean over `window_size` rows.
+    fn rolling_mean(mut slf: PyRefMut<Self>, window_size: usize) -> PyRefMut<Self> {
+        slf.ops.push(WindowOp::Rolling(WindowStat::Mean, RollingWindow::new(window_size)));
+        slf
+    }
+
+    /// Add a rolling sum over `window_size` rows.
+    fn rolling_sum(mut slf: PyRefMut<Self>, window_size: usize) -> PyRefMut<Self> {
+        slf.ops.push(WindowOp::Rolling(WindowStat::Sum, RollingWindow::new(window_size)));
+        slf
+    }
+
+    /// Add a rolling standard deviation over `window_size` rows.
+    fn rolling_std(mut slf: PyRefMut<Self>, window_size: usize) -> PyRefMut<Self> {
+        slf.ops.push(WindowOp::Rolling(WindowStat::Std, RollingWindow::new(window_size)));
+        slf
+    }
+
+    /// Add an expanding mean.
+    fn expanding_mean(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.ops.push(WindowOp::Expanding(WindowStat::Mean, ExpandingWindow::new()));
+        slf
+    }
+
+    /// Add an expanding sum.
+    fn expanding_sum(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.ops.push(WindowOp::Expanding(WindowStat::Sum, ExpandingWindow::new()));
+        slf
+    }
+
+    /// Run the plan.
+    ///
+    /// Returns:
+    ///     TinyFrame: New frame with one column added per op, named as by the
+    ///     matching `rolling_*` or `expanding_*` method
+    fn run(&self) -> PyResult<TinyFrame> {
+        WindowOps::run_ops(&self.frame, &self.column, &self.ops)
+    }
+}
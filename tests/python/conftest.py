@@ -4,12 +4,10 @@ Pytest configuration and fixtures for feathertail tests.
 
 import pytest
 import feathertail as ft
-import pandas as pd
-import numpy as np
 from typing import List, Dict, Any
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_records() -> List[Dict[str, Any]]:
     """Sample data for testing."""
     return [
@@ -23,32 +21,37 @@ def sample_records() -> List[Dict[str, Any]]:
 
 @pytest.fixture
 def sample_frame(sample_records):
-    """Sample TinyFrame for testing."""
+    """Sample TinyFrame for testing.
+
+    Function-scoped on purpose: tests mutate it in place (fillna, cast_column, ...).
+    """
     return ft.TinyFrame.from_dicts(sample_records)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_pandas_frame(sample_records):
     """Sample pandas DataFrame for comparison testing."""
+    import pandas as pd
+
     return pd.DataFrame(sample_records)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_records() -> List[Dict[str, Any]]:
     """Large dataset for performance testing."""
-    np.random.seed(42)
+    import numpy as np
+
+    n = 1000
+    rng = np.random.default_rng(42)
+    values = rng.standard_normal(n).tolist()
+    categories = rng.choice(["A", "B", "C", "D", "E"], size=n).tolist()
     return [
-        {
-            "id": i,
-            "value": np.random.randn(),
-            "category": np.random.choice(["A", "B", "C", "D", "E"]),
-            "text": f"text_{i}",
-        }
-        for i in range(1000)
+        {"id": i, "value": value, "category": category, "text": f"text_{i}"}
+        for i, (value, category) in enumerate(zip(values, categories))
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_type_records() -> List[Dict[str, Any]]:
     """Records with mixed data types for type inference testing."""
     return [
@@ -59,13 +62,13 @@ def mixed_type_records() -> List[Dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_records() -> List[Dict[str, Any]]:
     """Empty records for edge case testing."""
     return []
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_record() -> List[Dict[str, Any]]:
     """Single record for edge case testing."""
     return [{"name": "Alice", "age": 30}]
@@ -2,7 +2,7 @@ import pytest
 import math
 from feathertail import TinyFrame
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_numeric_frame():
     """Create a sample frame with numeric data for testing."""
     data = [
@@ -14,7 +14,7 @@ def sample_numeric_frame():
     ]
     return TinyFrame.from_dicts(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_mixed_frame():
     """Create a sample frame with mixed data types for testing."""
     data = [
@@ -26,7 +26,7 @@ def sample_mixed_frame():
     ]
     return TinyFrame.from_dicts(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_with_nulls():
     """Create a sample frame with null values for testing."""
     data = [
@@ -4,14 +4,12 @@ Unit tests for filtering and sorting functionality.
 
 import pytest
 import feathertail as ft
-import pandas as pd
-import numpy as np
 
 
 class TestFiltering:
     """Test filtering operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_data(self):
         """Sample data for filtering testing."""
         return [
@@ -22,7 +20,7 @@ class TestFiltering:
             {"name": "Eve", "age": 22, "score": 95.0, "city": "Tokyo"},
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_frame(self, sample_data):
         """Sample TinyFrame for filtering testing."""
         return ft.TinyFrame.from_dicts(sample_data)
@@ -32,54 +30,59 @@ class TestFiltering:
         result = sample_frame.filter("city", "==", "New York")
         
         assert result.len() == 2
-        data = result.to_dicts()
-        for row in data:
-            assert row["city"] == "New York"
+        assert all(v == "New York" for v in result.col("city").to_list())
 
     def test_filter_not_equals(self, sample_frame):
         """Test filtering with not equals condition."""
         result = sample_frame.filter("city", "!=", "New York")
         
         assert result.len() == 3
-        data = result.to_dicts()
-        for row in data:
-            assert row["city"] != "New York"
+        assert all(v != "New York" for v in result.col("city").to_list())
 
     def test_filter_greater_than(self, sample_frame):
         """Test filtering with greater than condition."""
         result = sample_frame.filter("age", ">", 28)
         
         assert result.len() == 2
-        data = result.to_dicts()
-        for row in data:
-            assert row["age"] > 28
+        assert all(v > 28 for v in result.col("age").to_list())
 
     def test_filter_less_than(self, sample_frame):
         """Test filtering with less than condition."""
         result = sample_frame.filter("age", "<", 30)
         
         assert result.len() == 3
-        data = result.to_dicts()
-        for row in data:
-            assert row["age"] < 30
+        assert all(v < 30 for v in result.col("age").to_list())
 
     def test_filter_greater_equal(self, sample_frame):
         """Test filtering with greater than or equal condition."""
         result = sample_frame.filter("age", ">=", 30)
         
         assert result.len() == 2
-        data = result.to_dicts()
-        for row in data:
-            assert row["age"] >= 30
+        assert all(v >= 30 for v in result.col("age").to_list())
 
     def test_filter_less_equal(self, sample_frame):
         """Test filtering with less than or equal condition."""
         result = sample_frame.filter("age", "<=", 28)
         
         assert result.len() == 3
-        data = result.to_dicts()
-        for row in data:
-            assert row["age"] <= 28
+        assert all(v <= 28 for v in result.col("age").to_list())
+
+    def test_filter_skips_nulls(self):
+        """Test filtering an optional column matches rows after a null."""
+        data = [{"age": 30}, {"age": None}, {"age": 35}, {"age": 20}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.filter("age", ">", 28)
+
+        assert [row["age"] for row in result.to_dicts()] == [30, 35]
+
+    def test_filter_against_none(self):
+        """Test comparing with None keeps exactly the non-null rows for '!='."""
+        data = [{"age": 30}, {"age": None}, {"age": 35}, {"age": None}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert frame.filter("age", "!=", None).col("age").to_list() == [30, 35]
+        assert frame.filter("age", "==", None).len() == 0
 
     def test_filter_nonexistent_column(self, sample_frame):
         """Test filtering with non-existent column should raise error."""
@@ -114,9 +117,7 @@ class TestFiltering:
         result = frame.dropna("age")
         assert result.len() == 3  # Bob should be removed
         
-        data = result.to_dicts()
-        for row in data:
-            assert row["age"] is not None
+        assert all(v is not None for v in result.col("age").to_list())
 
     def test_dropna_nonexistent_column(self, sample_frame):
         """Test dropna with non-existent column should raise error."""
@@ -127,7 +128,7 @@ class TestFiltering:
 class TestSorting:
     """Test sorting operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_data(self):
         """Sample data for sorting testing."""
         return [
@@ -138,7 +139,7 @@ class TestSorting:
             {"name": "Eve", "age": 22, "score": 95.0},
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_frame(self, sample_data):
         """Sample TinyFrame for sorting testing."""
         return ft.TinyFrame.from_dicts(sample_data)
@@ -151,8 +152,7 @@ class TestSorting:
         assert result.shape == sample_frame.shape
         
         # Check that ages are in ascending order
-        data = result.to_dicts()
-        ages = [row["age"] for row in data]
+        ages = result.col("age").to_list()
         assert ages == sorted(ages)
 
     def test_sort_single_column_descending(self, sample_frame):
@@ -163,8 +163,7 @@ class TestSorting:
         assert result.shape == sample_frame.shape
         
         # Check that ages are in descending order
-        data = result.to_dicts()
-        ages = [row["age"] for row in data]
+        ages = result.col("age").to_list()
         assert ages == sorted(ages, reverse=True)
 
     def test_sort_default_ascending(self, sample_frame):
@@ -172,8 +171,7 @@ class TestSorting:
         result = sample_frame.sort_values(["age"])
         
         # Should be ascending by default
-        data = result.to_dicts()
-        ages = [row["age"] for row in data]
+        ages = result.col("age").to_list()
         assert ages == sorted(ages)
 
     def test_sort_multiple_columns(self, sample_frame):
@@ -249,6 +247,16 @@ class TestFilteringEdgeCases:
         assert result.len() == frame.len()
         assert result.shape == frame.shape
 
+    def test_filter_int_column_fractional_value(self):
+        """Test integer columns compared against float constants."""
+        data = [{"age": age} for age in [30, None, 27, 28, -1]]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert frame.filter("age", ">", 27.5).col("age").to_list() == [30, 28]
+        assert frame.filter("age", "<=", -0.5).col("age").to_list() == [-1]
+        assert frame.filter("age", "==", 28.0).col("age").to_list() == [28]
+        assert frame.filter("age", "==", 27.5).len() == 0
+
     def test_sort_with_nulls(self):
         """Test sorting with null values."""
         data_with_nulls = [
@@ -267,3 +275,52 @@ class TestFilteringEdgeCases:
         # Check that non-null ages are sorted
         non_null_ages = [row["age"] for row in data if row["age"] is not None]
         assert non_null_ages == sorted(non_null_ages)
+
+    def test_sort_integer_columns_descending(self):
+        """Test descending sort by several integer columns."""
+        data = [
+            {"age": 25, "rank": 2},
+            {"age": None, "rank": 1},
+            {"age": 30, "rank": 1},
+            {"age": 25, "rank": 3},
+            {"age": -5, "rank": 9},
+        ]
+
+        frame = ft.TinyFrame.from_dicts(data)
+        result = frame.sort_values(["age", "rank"], ascending=False)
+
+        rows = [(row["age"], row["rank"]) for row in result.to_dicts()]
+        assert rows == [(None, 1), (30, 1), (25, 3), (25, 2), (-5, 9)]
+
+    def test_filter_after_sort(self):
+        """Test range filters on a column that is already sorted."""
+        data = [{"age": age} for age in [40, 25, 30, 25, 35]]
+        frame = ft.TinyFrame.from_dicts(data).sort_values(["age"])
+
+        assert [row["age"] for row in frame.filter("age", "==", 25).to_dicts()] == [25, 25]
+        assert [row["age"] for row in frame.filter("age", ">", 30).to_dicts()] == [35, 40]
+        assert [row["age"] for row in frame.filter("age", "<=", 30).to_dicts()] == [25, 25, 30]
+
+    def test_filter_partly_sorted_column(self):
+        """Test filters on a column whose sorted run ends partway through."""
+        ages = [20, 25, 25, 30, 22, 40, 25, 18]
+        frame = ft.TinyFrame.from_dicts([{"age": age, "row": i} for i, age in enumerate(ages)])
+
+        for op, check in [
+            ("==", lambda a: a == 25),
+            ("!=", lambda a: a != 25),
+            (">", lambda a: a > 25),
+            (">=", lambda a: a >= 25),
+            ("<", lambda a: a < 25),
+            ("<=", lambda a: a <= 25),
+        ]:
+            result = frame.filter("age", op, 25)
+            assert result.col("row").to_list() == [i for i, a in enumerate(ages) if check(a)]
+
+    def test_filter_large_integers_in_and_after_sorted_run(self):
+        """Test integers beyond 2**53 compare exactly wherever their row sits."""
+        big = 2**53 + 1
+        frame = ft.TinyFrame.from_dicts([{"n": n, "row": i} for i, n in enumerate([1, big, 0, big])])
+
+        assert frame.filter("n", "==", 2**53).len() == 0
+        assert frame.filter("n", ">", 2**53).col("row").to_list() == [1, 3]
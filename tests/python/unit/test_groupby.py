@@ -4,14 +4,12 @@ Unit tests for TinyGroupBy functionality.
 
 import pytest
 import feathertail as ft
-import pandas as pd
-import numpy as np
 
 
 class TestTinyGroupBy:
     """Test TinyGroupBy operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_data(self):
         """Sample data for GroupBy testing."""
         return [
@@ -23,20 +21,24 @@ class TestTinyGroupBy:
             {"category": "C", "value": 30, "score": 95.0},
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_frame(self, sample_data):
         """Sample TinyFrame for GroupBy testing."""
         return ft.TinyFrame.from_dicts(sample_data)
 
+    @pytest.fixture(scope="class")
+    def groupby(self, sample_frame):
+        """GroupBy on category, shared by the aggregation tests."""
+        return ft.TinyGroupBy(sample_frame, ["category"])
+
     def test_groupby_creation(self, sample_frame):
         """Test creating a GroupBy object."""
         groupby = ft.TinyGroupBy(sample_frame, ["category"])
         assert groupby.keys == ["category"]
         assert len(groupby.groups) == 3  # A, B, C
 
-    def test_groupby_count(self, sample_frame):
+    def test_groupby_count(self, sample_frame, groupby):
         """Test count aggregation."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         result = groupby.count(sample_frame)
         
         assert result.len() == 3
@@ -49,9 +51,8 @@ class TestTinyGroupBy:
         assert "B" in categories
         assert "C" in categories
 
-    def test_groupby_sum(self, sample_frame):
+    def test_groupby_sum(self, sample_frame, groupby):
         """Test sum aggregation."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         result = groupby.sum(sample_frame, "value")
         
         assert result.len() == 3
@@ -67,9 +68,8 @@ class TestTinyGroupBy:
             elif row["category"] == "C":
                 assert row["value_sum"] == 30
 
-    def test_groupby_mean(self, sample_frame):
+    def test_groupby_mean(self, sample_frame, groupby):
         """Test mean aggregation."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         result = groupby.mean(sample_frame, "score")
         
         assert result.len() == 3
@@ -86,9 +86,8 @@ class TestTinyGroupBy:
             elif row["category"] == "C":
                 assert row["score_mean"] == 95.0
 
-    def test_groupby_min_max(self, sample_frame):
+    def test_groupby_min_max(self, sample_frame, groupby):
         """Test min and max aggregations."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         
         min_result = groupby.min(sample_frame, "value")
         max_result = groupby.max(sample_frame, "value")
@@ -116,9 +115,8 @@ class TestTinyGroupBy:
             elif row["category"] == "C":
                 assert row["value_max"] == 30
 
-    def test_groupby_std_var(self, sample_frame):
+    def test_groupby_std_var(self, sample_frame, groupby):
         """Test standard deviation and variance aggregations."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         
         std_result = groupby.std(sample_frame, "score")
         var_result = groupby.var(sample_frame, "score")
@@ -134,9 +132,19 @@ class TestTinyGroupBy:
             if std_row["score_std"] is not None and var_row["score_var"] is not None:
                 assert abs(std_row["score_std"]**2 - var_row["score_var"]) < 1e-10
 
-    def test_groupby_median(self, sample_frame):
+    def test_groupby_std_var_combined(self, sample_frame, groupby):
+        """Test std and var are returned together from one call."""
+        result = groupby.std_var(sample_frame, "score")
+
+        assert result.shape == (3, 3)  # category + score_std + score_var
+        rows = {row["category"]: row for row in result.to_dicts()}
+        assert abs(rows["A"]["score_var"] - 28.222222222222222) < 1e-10
+        assert abs(rows["B"]["score_var"] - 4.0) < 1e-10
+        assert abs(rows["B"]["score_std"] - 2.0) < 1e-10
+        assert rows["C"]["score_var"] == 0.0
+
+    def test_groupby_median(self, sample_frame, groupby):
         """Test median aggregation."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         result = groupby.median(sample_frame, "value")
         
         assert result.len() == 3
@@ -151,9 +159,8 @@ class TestTinyGroupBy:
             elif row["category"] == "C":
                 assert row["value_median"] == 30
 
-    def test_groupby_first_last(self, sample_frame):
+    def test_groupby_first_last(self, sample_frame, groupby):
         """Test first and last aggregations."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         
         first_result = groupby.first(sample_frame, "value")
         last_result = groupby.last(sample_frame, "value")
@@ -171,9 +178,8 @@ class TestTinyGroupBy:
             elif row["category"] == "C":
                 assert row["value_first"] == 30  # first C value
 
-    def test_groupby_size(self, sample_frame):
+    def test_groupby_size(self, sample_frame, groupby):
         """Test size aggregation (same as count)."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         result = groupby.size(sample_frame)
         
         assert result.len() == 3
@@ -210,14 +216,36 @@ class TestTinyGroupBy:
         result = groupby.count(frame)
         assert result.len() > 3
 
+    def test_groupby_first_appearance_order(self, sample_frame, groupby):
+        """Test groups are emitted in order of first appearance."""
+        result = groupby.sum(sample_frame, "value")
+
+        data = result.to_dicts()
+        assert [row["category"] for row in data] == ["A", "B", "C"]
+        assert [row["value_sum"] for row in data] == [37.0, 45.0, 30.0]
+
+    def test_groupby_large_frame(self):
+        """Test aggregations over enough rows to be split across threads."""
+        data = [{"category": "ABC"[i % 3], "value": i} for i in range(30000)]
+        frame = ft.TinyFrame.from_dicts(data)
+        groupby = ft.TinyGroupBy(frame, ["category"])
+
+        sums = {row["category"]: row["value_sum"] for row in groupby.sum(frame, "value").to_dicts()}
+        assert sums == {"A": sum(range(0, 30000, 3)), "B": sum(range(1, 30000, 3)), "C": sum(range(2, 30000, 3))}
+
+        maxes = {row["category"]: row["value_max"] for row in groupby.max(frame, "value").to_dicts()}
+        assert maxes == {"A": 29997, "B": 29998, "C": 29999}
+
+        variances = [row["value_var"] for row in groupby.var(frame, "value").to_dicts()]
+        assert all(abs(var - 9 * (10000 ** 2 - 1) / 12) < 1e-3 for var in variances)
+
     def test_groupby_nonexistent_column(self, sample_frame):
         """Test GroupBy with non-existent column should raise error."""
         with pytest.raises(Exception):  # Should raise KeyError
             ft.TinyGroupBy(sample_frame, ["nonexistent"])
 
-    def test_groupby_aggregation_nonexistent_column(self, sample_frame):
+    def test_groupby_aggregation_nonexistent_column(self, sample_frame, groupby):
         """Test aggregation with non-existent column should raise error."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         
         with pytest.raises(Exception):  # Should raise KeyError
             groupby.sum(sample_frame, "nonexistent")
@@ -229,9 +257,8 @@ class TestTinyGroupBy:
         with pytest.raises(Exception):  # Should raise error
             ft.TinyGroupBy(empty_frame, ["category"])
 
-    def test_groupby_groups_property(self, sample_frame):
+    def test_groupby_groups_property(self, sample_frame, groupby):
         """Test accessing groups property."""
-        groupby = ft.TinyGroupBy(sample_frame, ["category"])
         groups = groupby.groups
         
         assert isinstance(groups, dict)
@@ -242,3 +269,7 @@ class TestTinyGroupBy:
             assert isinstance(key, tuple)
             assert isinstance(indices, list)
             assert all(isinstance(i, int) for i in indices)
+
+    def test_groupby_groups_row_indices(self, groupby):
+        """Test each group maps to its row indices in row order."""
+        assert groupby.groups == {("A",): [0, 2, 4], ("B",): [1, 3], ("C",): [5]}
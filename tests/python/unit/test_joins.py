@@ -104,6 +104,24 @@ class TestJoinOperations:
         assert "dept_id" in result.columns
         assert "dept_name" in result.columns
 
+    def test_cross_join_row_order(self, left_frame, right_frame):
+        """Test cross join pairs every left row with every right row."""
+        result = left_frame.cross_join(right_frame)
+
+        assert result.col("id").to_list() == [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+        assert result.col("dept_name").to_list() == ["Engineering", "Marketing", "Sales"] * 4
+
+    def test_cross_join_nulls_and_empty_side(self, left_frame):
+        """Test cross join keeps nulls in place and yields nothing for an empty side."""
+        right = TinyFrame.from_dicts([{"flag": "a"}, {"flag": None}])
+
+        result = left_frame.cross_join(right)
+        assert result.col("flag").to_list() == ["a", None] * 4
+
+        empty = right.filter("flag", "==", "missing")
+        assert left_frame.cross_join(empty).len() == 0
+        assert empty.cross_join(left_frame).len() == 0
+
     def test_join_multiple_columns(self, left_frame):
         """Test join on multiple columns."""
         # Create a frame with multiple join columns
@@ -124,6 +142,54 @@ class TestJoinOperations:
         assert result.len() == 2
         assert "dept_name" in result.columns
 
+    def test_inner_join_strategies(self, left_frame, right_frame):
+        """Test every inner join strategy matches the same rows."""
+        expected = sorted(
+            (row["id"], row["dept_name"])
+            for row in left_frame.inner_join(right_frame, ["dept_id"], ["dept_id"], "hash")
+        )
+
+        for strategy in ["sort_merge", "auto"]:
+            result = left_frame.inner_join(right_frame, ["dept_id"], ["dept_id"], strategy)
+            assert sorted((row["id"], row["dept_name"]) for row in result) == expected
+
+        merged = left_frame.inner_join(right_frame, ["dept_id"], ["dept_id"], strategy="sort_merge")
+        assert merged.col("dept_id").to_list() == [10, 10, 20]
+
+    def test_inner_join_strategies_with_null_keys(self):
+        """Test strategies agree when nulls sit between sorted keys."""
+        left = TinyFrame.from_dicts([
+            {"k": 1, "a": "x"}, {"k": None, "a": "y"}, {"k": 2, "a": "z"}, {"k": 2, "a": "w"},
+        ])
+        right = TinyFrame.from_dicts([{"k": None, "b": 0}, {"k": 2, "b": 1}, {"k": 3, "b": 2}])
+
+        for strategy in ["hash", "sort_merge", "auto"]:
+            result = left.inner_join(right, ["k"], ["k"], strategy)
+            assert result.column("a") == ["z", "w"]
+            assert result.column("b") == [1, 1]
+
+    def test_inner_join_unknown_strategy(self, left_frame, right_frame):
+        """Test an unknown join strategy raises error."""
+        with pytest.raises(ValueError):
+            left_frame.inner_join(right_frame, ["dept_id"], ["dept_id"], "nested_loop")
+
+    def test_repeated_joins_on_same_keys(self, left_frame, right_frame):
+        """Test joins that share build keys but not payload columns."""
+        relabeled = TinyFrame.from_dicts([
+            {"dept_id": 10, "dept_name": "Eng"},
+            {"dept_id": 20, "dept_name": "Mkt"},
+            {"dept_id": 40, "dept_name": "Ops"},
+        ])
+
+        first = left_frame.inner_join(right_frame, ["dept_id"], ["dept_id"], strategy="hash")
+        second = left_frame.inner_join(relabeled, ["dept_id"], ["dept_id"], strategy="hash")
+
+        assert first.column("dept_name") == ["Engineering", "Marketing", "Engineering"]
+        assert second.column("dept_name") == ["Eng", "Mkt", "Eng"]
+        assert left_frame.left_join(relabeled, ["dept_id"], ["dept_id"]).column("dept_name") == [
+            "Eng", "Mkt", "Eng", None
+        ]
+
     def test_join_nonexistent_column(self, left_frame, right_frame):
         """Test join with non-existent column raises error."""
         with pytest.raises(KeyError):
@@ -166,6 +232,17 @@ class TestJoinOperations:
         assert "value" in result.columns
         assert "label" in result.columns
 
+    def test_join_float_keys(self):
+        """Test float keys match by value, with NaN and null never matching."""
+        left = TinyFrame.from_dicts([{"k": 1.5}, {"k": -0.0}, {"k": float("nan")}, {"k": 2.0}])
+        right = TinyFrame.from_dicts([
+            {"k": 0.0, "v": 0}, {"k": None, "v": 1}, {"k": float("nan"), "v": 2}, {"k": 1.5, "v": 3},
+        ])
+
+        result = left.inner_join(right, ["k"], ["k"])
+
+        assert result.column("v") == [3, 0]
+
     def test_join_with_nulls(self):
         """Test join with null values in join columns."""
         left_data = [
@@ -191,6 +268,26 @@ class TestJoinOperations:
         assert "Charlie" in names
         assert "Bob" not in names
 
+    def test_join_multiple_columns_with_nulls(self):
+        """Test a null in any part of a composite key keeps the row from matching."""
+        left = TinyFrame.from_dicts([
+            {"id": 1, "loc": "NY", "name": "Alice"},
+            {"id": None, "loc": "NY", "name": "Bob"},
+            {"id": 1, "loc": None, "name": "Carol"},
+            {"id": 2, "loc": "SF", "name": "Dan"},
+        ])
+        right = TinyFrame.from_dicts([
+            {"id": 1, "loc": "NY", "dept": "Eng"},
+            {"id": None, "loc": "NY", "dept": "Ops"},
+            {"id": 2, "loc": "SF", "dept": "Mkt"},
+        ])
+
+        inner = left.inner_join(right, ["id", "loc"], ["id", "loc"])
+        assert [(row["name"], row["dept"]) for row in inner] == [("Alice", "Eng"), ("Dan", "Mkt")]
+
+        left_result = left.left_join(right, ["id", "loc"], ["id", "loc"])
+        assert left_result.column("dept") == ["Eng", None, None, "Mkt"]
+
     def test_join_column_name_conflicts(self):
         """Test join with conflicting column names."""
         left_data = [{"id": 1, "name": "Alice", "value": 100}]
@@ -264,3 +361,49 @@ class TestJoinEdgeCases:
         
         # Should have 50 matching rows (id 50-99)
         assert result.len() == 50
+
+    def test_join_preserves_left_row_order(self):
+        """Test matched rows follow left row order, then right row order."""
+        left = TinyFrame.from_dicts([{"id": i % 3, "pos": i} for i in range(6)])
+        right = TinyFrame.from_dicts([{"id": 2, "tag": "x"}, {"id": 0, "tag": "y"}, {"id": 2, "tag": "z"}])
+
+        result = left.inner_join(right, ["id"], ["id"])
+
+        assert [(row["pos"], row["tag"]) for row in result] == [
+            (0, "y"), (2, "x"), (2, "z"), (3, "y"), (5, "x"), (5, "z"),
+        ]
+
+    def test_join_smaller_left_keeps_left_row_order(self):
+        """Test a left frame smaller than the right still drives row order."""
+        left = TinyFrame.from_dicts([{"id": 2, "pos": 0}, {"id": 0, "pos": 1}, {"id": 2, "pos": 2}])
+        right = TinyFrame.from_dicts([{"id": i % 3, "tag": i} for i in range(7)])
+
+        result = left.inner_join(right, ["id"], ["id"], strategy="hash")
+
+        assert [(row["pos"], row["tag"]) for row in result] == [
+            (0, 2), (0, 5), (1, 0), (1, 3), (1, 6), (2, 2), (2, 5),
+        ]
+
+    def test_outer_join_fills_keys_from_right(self):
+        """Test right-only rows of an outer join keep their join key."""
+        left = TinyFrame.from_dicts([{"id": 1, "name": "Alice"}])
+        right = TinyFrame.from_dicts([{"id": 1, "dept": "Eng"}, {"id": 2, "dept": "Ops"}])
+
+        result = left.outer_join(right, ["id"], ["id"])
+
+        assert [(row["id"], row["name"], row["dept"]) for row in result] == [
+            (1, "Alice", "Eng"), (2, None, "Ops"),
+        ]
+
+    def test_left_join_many_rows(self):
+        """Test a left join large enough to probe in parallel stripes."""
+        left = TinyFrame.from_dicts([{"id": i % 7000, "pos": i} for i in range(20000)])
+        right = TinyFrame.from_dicts([{"id": i * 2, "half": i} for i in range(5000)])
+
+        result = left.left_join(right, ["id"], ["id"])
+
+        assert result.len() == 20000
+        assert result.col("pos").to_list() == list(range(20000))
+        assert result.col("half").to_list() == [
+            (i % 7000) // 2 if (i % 7000) % 2 == 0 else None for i in range(20000)
+        ]
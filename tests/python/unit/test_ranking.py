@@ -7,8 +7,7 @@ class TestRankingFunctions:
 
     def get_column_data(self, frame, column_name):
         """Helper to get column data from a frame"""
-        data = frame.to_dicts()
-        return [row[column_name] for row in data]
+        return frame.column(column_name)
 
     def test_rank_average_basic(self):
         """Test basic ranking with average method"""
@@ -332,6 +331,24 @@ class TestRankingFunctions:
         assert "value_pct_change" in result.columns
         assert result.len() == 4
 
+    def test_rank_pct_change_matches_chained_calls(self):
+        """Test the fused rank and pct_change matches rank() followed by pct_change()"""
+        data = [{"value": v, "price": p} for v, p in [(3.0, 10.0), (1.0, None), (4.0, 12.5), (None, 10.0), (1.0, 5.0)]]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        cases = [
+            (frame.rank_pct_change("value", "average"), frame.rank("value", "average").pct_change("value")),
+            (frame.rank_pct_change("value", "dense", "price"), frame.rank("value", "dense").pct_change("price")),
+            (frame.rank_pct_change("value", "min", "value_rank"), frame.rank("value", "min").pct_change("value_rank")),
+        ]
+        for fused, chained in cases:
+            assert sorted(fused.columns) == sorted(chained.columns)
+            for name in chained.columns:
+                assert self.get_column_data(fused, name) == self.get_column_data(chained, name)
+
+        with pytest.raises(ValueError):
+            frame.rank_pct_change("value", "bogus")
+
     def test_ranking_large_dataset(self):
         """Test ranking with larger dataset"""
         data = []
@@ -382,3 +399,32 @@ class TestRankingFunctions:
         ranks = self.get_column_data(result, "value_rank")
         # Dense ranking: [1.0, 1.0, 1.0, 2.0, 2.0]
         assert ranks == [1.0, 1.0, 1.0, 2.0, 2.0]
+
+    def test_rank_mixed_sign_integers_and_nulls(self):
+        """Test ranking integers spanning negatives with nulls kept unranked"""
+        data = [{"value": v} for v in [5, None, -3, 10**12, -3, 0, None, -(10**12)]]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        ranks = self.get_column_data(frame.rank("value", "average"), "value_rank")
+        assert ranks == [5.0, None, 2.5, 6.0, 2.5, 4.0, None, 1.0]
+
+        ranks = self.get_column_data(frame.rank("value", "dense"), "value_rank")
+        assert ranks == [4.0, None, 2.0, 5.0, 2.0, 3.0, None, 1.0]
+
+    def test_rank_few_distinct_values(self):
+        """Test every tie method on a column with many rows per distinct value"""
+        values = [(i * 7) % 5 - 2 for i in range(200)]
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in values])
+
+        for method in ["average", "min", "max", "dense"]:
+            ranks = self.get_column_data(frame.rank("value", method), "value_rank")
+            for v, rank in zip(values, ranks):
+                below = sum(1 for x in values if x < v)
+                ties = values.count(v)
+                expected = {
+                    "average": below + (ties + 1) / 2,
+                    "min": below + 1,
+                    "max": below + ties,
+                    "dense": len({x for x in values if x < v}) + 1,
+                }[method]
+                assert rank == expected
@@ -6,8 +6,7 @@ class TestStringOperations:
 
     def get_column_data(self, frame, column_name):
         """Helper to get column data from a frame"""
-        data = frame.to_dicts()
-        return [row[column_name] for row in data]
+        return frame.column(column_name)
 
     def test_str_upper_basic(self):
         """Test basic string uppercase conversion"""
@@ -57,6 +56,33 @@ class TestStringOperations:
         lower_texts = self.get_column_data(result, "text_lower")
         assert lower_texts == ["hello", "world", "python"]
 
+    def test_str_case_mixed_ascii_and_unicode(self):
+        """Test case conversion of ASCII and non-ASCII strings in one column"""
+        data = [
+            {"text": "Hello, World 123"},
+            {"text": None},
+            {"text": "straße Ñandú"},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        upper_texts = self.get_column_data(frame.str_upper("text"), "text_upper")
+        assert upper_texts == ["HELLO, WORLD 123", None, "STRASSE ÑANDÚ"]
+
+        lower_texts = self.get_column_data(frame.str_lower("text"), "text_lower")
+        assert lower_texts == ["hello, world 123", None, "straße ñandú"]
+
+    def test_str_operations_repeated_values(self):
+        """Test transforms on a column with few distinct values and nulls"""
+        texts = [None if i % 7 == 0 else ["red", "Grün", "blue sky"][i % 3] for i in range(200)]
+        frame = ft.TinyFrame.from_dicts([{"text": t} for t in texts])
+
+        def expected(transform):
+            return [None if t is None else transform(t) for t in texts]
+
+        assert self.get_column_data(frame.str_upper("text"), "text_upper") == expected(str.upper)
+        assert self.get_column_data(frame.str_lower("text"), "text_lower") == expected(str.lower)
+        assert self.get_column_data(frame.str_replace("text", " ", "_"), "text_replace") == expected(lambda t: t.replace(" ", "_"))
+
     def test_str_strip_basic(self):
         """Test basic string stripping"""
         data = [
@@ -91,6 +117,15 @@ class TestStringOperations:
         replaced_texts = self.get_column_data(result, "text_replace")
         assert replaced_texts == ["hi world", "world hi", "hi python"]
 
+    def test_str_replace_matches_python_semantics(self):
+        """Test replace on overlapping, multibyte and empty patterns matches str.replace"""
+        texts = ["aaa", "café au lait", "", "no match"]
+        frame = ft.TinyFrame.from_dicts([{"text": t} for t in texts])
+
+        for old, new in [("aa", "X"), ("é", "e"), ("", "-"), ("a", "")]:
+            replaced = self.get_column_data(frame.str_replace("text", old, new), "text_replace")
+            assert replaced == [t.replace(old, new) for t in texts]
+
     def test_str_split_basic(self):
         """Test basic string splitting"""
         data = [
@@ -108,6 +143,15 @@ class TestStringOperations:
         split_texts = self.get_column_data(result, "text_split")
         assert split_texts == ["a|b|c", "x|y|z", "1|2|3"]
 
+    def test_str_split_delimiter_lengths(self):
+        """Test splitting on one-byte, multi-byte and non-ASCII delimiters"""
+        texts = ["a,,b::c", ",édé,", ""]
+        frame = ft.TinyFrame.from_dicts([{"text": t} for t in texts])
+
+        for delimiter in [",", "::", "é"]:
+            split_texts = self.get_column_data(frame.str_split("text", delimiter), "text_split")
+            assert split_texts == ["|".join(t.split(delimiter)) for t in texts]
+
     def test_str_contains_basic(self):
         """Test basic string contains check"""
         data = [
@@ -125,6 +169,19 @@ class TestStringOperations:
         contains_results = self.get_column_data(result, "text_contains")
         assert contains_results == [True, False, False]
 
+    def test_str_contains_needle_edge_cases(self):
+        """Test contains with empty, multibyte and overlong needles"""
+        data = [{"text": "abab"}, {"text": "ab"}, {"text": ""}, {"text": "café au lait"}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        def contains(needle):
+            return self.get_column_data(frame.str_contains("text", needle), "text_contains")
+
+        assert contains("bab") == [True, False, False, False]
+        assert contains("") == [True, True, True, True]
+        assert contains("é a") == [False, False, False, True]
+        assert contains("ababab") == [False, False, False, False]
+
     def test_str_len_basic(self):
         """Test basic string length calculation"""
         data = [
@@ -248,6 +305,32 @@ class TestStringOperations:
         final_texts = self.get_column_data(result, "text_strip_lower_replace")
         assert final_texts == ["hello_world", "python_programming"]
 
+    def test_str_pipe_matches_chained_operations(self):
+        """Test a fused pipeline gives the chained result as a single new column"""
+        data = [
+            {"text": "  Hello World  ", "id": 1},
+            {"text": None, "id": 2},
+            {"text": "  Python Programming  ", "id": 3},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.str_pipe("text").strip().lower().replace(" ", "_").finish("text_out")
+
+        assert set(result.columns) == {"text", "id", "text_out"}
+        assert self.get_column_data(result, "text_out") == ["hello_world", None, "python_programming"]
+
+        with pytest.raises(KeyError):
+            frame.str_pipe("nonexistent")
+
+    def test_str_pipe_ignores_later_changes_to_frame(self):
+        """Test a pipeline finishes on the column as it was when the pipeline was built"""
+        frame = ft.TinyFrame.from_dicts([{"text": "a b"}, {"text": "c"}])
+        pipeline = frame.str_pipe("text").upper()
+
+        frame.edit_column("text", lambda s: s + "!")
+        frame.drop_columns(["text"])
+        assert self.get_column_data(pipeline.finish("out"), "out") == ["A B", "C"]
+
     def test_str_operations_large_dataset(self):
         """Test string operations with larger dataset"""
         data = []
@@ -265,6 +348,17 @@ class TestStringOperations:
         assert all(text.startswith("ITEM_") for text in upper_texts)
         assert all(isinstance(text, str) for text in upper_texts)
 
+    def test_str_operations_above_parallel_threshold(self):
+        """Test per-row string operations keep row order on columns split across threads"""
+        texts = [None if i % 11 == 0 else f"Item_{i}" for i in range(40_000)]
+        frame = ft.TinyFrame.from_dicts([{"text": text} for text in texts])
+
+        assert self.get_column_data(frame.str_upper("text"), "text_upper") == [t and t.upper() for t in texts]
+        assert self.get_column_data(frame.str_len("text"), "text_len") == [t and len(t) for t in texts]
+        assert self.get_column_data(frame.str_contains("text", "_9"), "text_contains") == [
+            None if t is None else "_9" in t for t in texts
+        ]
+
     def test_str_operations_with_nulls(self):
         """Test string operations with null values"""
         data = [
@@ -290,6 +384,16 @@ class TestStringOperations:
         contains_results = self.get_column_data(result, "text_contains")
         assert contains_results == [True, None, False, None]
 
+    def test_str_transforms_with_nulls(self):
+        """Test strip, replace, split and cat keep nulls in place"""
+        data = [{"text": " a-b "}, {"text": None}, {"text": "c--d"}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert self.get_column_data(frame.str_strip("text"), "text_strip") == ["a-b", None, "c--d"]
+        assert self.get_column_data(frame.str_replace("text", "-", "+"), "text_replace") == [" a+b ", None, "c++d"]
+        assert self.get_column_data(frame.str_split("text", "-"), "text_split") == [" a|b ", None, "c||d"]
+        assert self.get_column_data(frame.str_cat("text", ","), "text_cat") == [" a-b ,c--d"] * 3
+
     def test_str_operations_unicode(self):
         """Test string operations with unicode characters"""
         data = [
@@ -12,8 +12,7 @@ class TestTimeSeriesOperations:
     
     def get_column_data(self, frame, column_name):
         """Helper to get column data from a frame"""
-        data = frame.to_dicts()
-        return [row[column_name] for row in data]
+        return frame.column(column_name)
 
     def test_to_timestamps_basic(self):
         """Test basic timestamp conversion"""
@@ -68,6 +67,64 @@ class TestTimeSeriesOperations:
         assert timestamps[2] == 0
         assert timestamps[1] > 0
 
+    def test_to_timestamps_exact_values(self):
+        """Test timestamps match UTC epoch seconds, including leap days and invalid fields"""
+        data = [
+            {"datetime": "2024-02-29 23:59:59"},
+            {"datetime": "1969-12-31T23:59:59"},
+            {"datetime": "2023-01-01T10:30:00Z"},
+            {"datetime": "2023-01-01 10:30:00Z"},
+            {"datetime": "2023-13-01 00:00:00"},
+            {"datetime": "2023-01-01 24:00:00"},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        timestamps = self.get_column_data(frame.to_timestamps("datetime"), "datetime_timestamp")
+        assert timestamps == [1709251199, -1, 1672569000, 0, 0, 0]
+
+    def test_to_timestamps_fractional_seconds(self):
+        """Test fractional seconds are truncated and date-only strings read as 0"""
+        data = [
+            {"datetime": "2023-01-01"},
+            {"datetime": "2023-01-01T10:30:00.123"},
+            {"datetime": "2023-01-01T10:30:00.999999999Z"},
+            {"datetime": "1969-12-31T23:59:59.5"},
+            {"datetime": "2023-01-01 10:30:00.5"},
+            {"datetime": "2023-01-01T10:30:00."},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        timestamps = self.get_column_data(frame.to_timestamps("datetime"), "datetime_timestamp")
+        assert timestamps == [0, 1672569000, 1672569000, -1, 0, 0]
+
+    def test_dt_year_invalid_calendar_dates(self):
+        """Test century leap rules and short months when validating dates"""
+        data = [
+            {"datetime": "2000-02-29 00:00:00"},  # Leap year (divisible by 400)
+            {"datetime": "1900-02-29 00:00:00"},  # Not a leap year (divisible by 100)
+            {"datetime": "2024-04-31 00:00:00"},  # April has 30 days
+            {"datetime": "2024-00-10 00:00:00"},  # Month out of range
+            {"datetime": "2024-12-31 00:00:00"},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        years = self.get_column_data(frame.dt_year("datetime"), "datetime_year")
+        assert years == [2000, 0, 0, 0, 2024]
+
+    def test_to_timestamps_nulls(self):
+        """Test nulls convert to 0 timestamps, like empty strings"""
+        data = [
+            {"datetime": None, "value": 1},
+            {"datetime": "2023-01-01 00:00:00", "value": 2},
+            {"datetime": None, "value": 3},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.to_timestamps("datetime")
+
+        timestamps = self.get_column_data(result, "datetime_timestamp")
+        assert timestamps == [0, 1672531200, 0]
+
     def test_dt_year(self):
         """Test year extraction"""
         data = [
@@ -223,6 +280,15 @@ class TestTimeSeriesOperations:
         assert diffs[1] == 1800  # 30 minutes = 1800 seconds
         assert diffs[2] == 1800  # 30 minutes = 1800 seconds
 
+    def test_dt_diff_short_columns(self):
+        """Test differences on one-row and empty frames"""
+        frame = ft.TinyFrame.from_dicts([{"timestamp": 1672574400, "value": 1}])
+
+        assert self.get_column_data(frame.dt_diff("timestamp"), "timestamp_diff") == [None]
+
+        empty = frame.filter("value", ">", 10)
+        assert self.get_column_data(empty.dt_diff("timestamp"), "timestamp_diff") == []
+
     def test_dt_shift(self):
         """Test timestamp shifting"""
         data = [
@@ -277,6 +343,22 @@ class TestTimeSeriesOperations:
         years = self.get_column_data(result, "timestamp_year")
         assert years == [2023, 2023, 2023]
 
+    def test_dt_date_parts_across_boundaries(self):
+        """Test year/month/day around leap days, the epoch and out-of-range timestamps"""
+        data = [
+            {"timestamp": 951782400},  # 2000-02-29 00:00:00
+            {"timestamp": -1},  # 1969-12-31 23:59:59
+            {"timestamp": -62135596800},  # 0001-01-01 00:00:00
+            {"timestamp": 253402300800},  # past 9999-12-31, unsupported
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.dt_year("timestamp").dt_month("timestamp").dt_day("timestamp")
+
+        assert self.get_column_data(result, "timestamp_year") == [2000, 1969, 1, 0]
+        assert self.get_column_data(result, "timestamp_month") == [2, 12, 1, 0]
+        assert self.get_column_data(result, "timestamp_day") == [29, 31, 1, 0]
+
     def test_time_series_with_optional_strings(self):
         """Test time series operations with optional string column"""
         data = [
@@ -344,6 +426,21 @@ class TestTimeSeriesOperations:
         assert months == [1, 1, 1]
         assert days == [1, 1, 1]
 
+    def test_time_series_alternating_columns(self):
+        """Test interleaved operations on two datetime columns each read their own column"""
+        data = [
+            {"start": "2021-03-04 10:00:00", "end": "2022-11-30 10:00:00"},
+            {"start": "2021-05-06 10:00:00", "end": None},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.dt_year("start").dt_year("end").dt_month("start").dt_month("end")
+
+        assert self.get_column_data(result, "start_year") == [2021, 2021]
+        assert self.get_column_data(result, "end_year") == [2022, 0]
+        assert self.get_column_data(result, "start_month") == [3, 5]
+        assert self.get_column_data(result, "end_month") == [11, 0]
+
     def test_time_series_large_dataset(self):
         """Test time series operations with larger dataset"""
         data = []
@@ -364,6 +461,14 @@ class TestTimeSeriesOperations:
         years = self.get_column_data(result, "datetime_year")
         assert all(year == 2023 for year in years)
 
+    def test_to_timestamps_above_parallel_threshold(self):
+        """Test timestamps keep row order on columns parsed across threads"""
+        data = [{"datetime": f"2023-01-01 {i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}"} for i in range(40_000)]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        timestamps = self.get_column_data(frame.to_timestamps("datetime"), "datetime_timestamp")
+        assert timestamps == [1672531200 + i for i in range(40_000)]
+
     def test_time_series_invalid_datetime_format(self):
         """Test time series operations with invalid datetime format"""
         data = [
@@ -31,6 +31,52 @@ class TestTinyFrameCreation:
         assert frame.len() == 4
         assert frame.shape == (4, 2)
 
+    def test_frame_creation_column_types(self):
+        """Test column types inferred from leading nulls and mixed values."""
+        frame = ft.TinyFrame.from_dicts([
+            {"a": None, "b": 1, "c": True, "d": None},
+            {"a": 2, "b": "x", "c": False, "d": None},
+        ])
+
+        assert frame.col("a").type_str == "OptInt"
+        assert frame.col("a").to_list() == [None, 2]
+        assert frame.col("b").type_str == "Mixed"
+        assert frame.col("b").to_list() == [1, "x"]
+        assert frame.col("c").type_str == "Bool"
+        assert frame.col("d").type_str == "OptMixed"
+
+    def test_frame_creation_from_arrays(self):
+        """Test creating TinyFrame from NumPy arrays and plain sequences."""
+        frame = ft.TinyFrame.from_arrays({
+            "id": np.arange(4, dtype=np.int64),
+            "value": np.array([0.5, np.nan, 2.0, -1.0]),
+            "small": np.arange(4, dtype=np.int32),
+            "flag": np.array([True, False, True, True]),
+            "name": ["a", None, "c", "d"],
+        })
+
+        assert frame.shape == (4, 5)
+        assert frame.col("id").type_str == "Int"
+        assert frame.col("value").type_str == "Float"
+        assert frame.col("small").type_str == "Int"
+        assert frame.col("flag").type_str == "Bool"
+        assert frame.col("name").type_str == "OptStr"
+        assert frame.column("id") == [0, 1, 2, 3]
+        assert frame.column("value")[2:] == [2.0, -1.0]
+        assert np.isnan(frame.column("value")[1])
+        assert frame.column("small") == [0, 1, 2, 3]
+        assert frame.column("flag") == [True, False, True, True]
+
+        # A strided view is copied in element order
+        assert ft.TinyFrame.from_arrays({"x": np.arange(10, dtype=np.int64)[::3]}).column("x") == [0, 3, 6, 9]
+
+    def test_frame_creation_from_arrays_errors(self):
+        """Test from_arrays rejects an empty dict and columns of different lengths."""
+        with pytest.raises(ValueError):
+            ft.TinyFrame.from_arrays({})
+        with pytest.raises(ValueError):
+            ft.TinyFrame.from_arrays({"a": np.arange(3), "b": np.arange(4)})
+
     def test_frame_creation_empty_list(self):
         """Test creating TinyFrame from empty list should raise error."""
         with pytest.raises(Exception):  # Should raise ValueError
@@ -61,6 +107,11 @@ class TestTinyFrameProperties:
         """Test shape property."""
         assert sample_frame.shape == (5, 4)
 
+    def test_schema_property(self, sample_frame):
+        """Test schema pairs each column, in column order, with its type."""
+        assert [name for name, _ in sample_frame.schema] == sample_frame.columns
+        assert all(sample_frame.col(name).type_str == type_str for name, type_str in sample_frame.schema)
+
     def test_repr_method(self, sample_frame):
         """Test string representation."""
         repr_str = repr(sample_frame)
@@ -76,6 +127,13 @@ class TestTinyFrameProperties:
         assert "name" in rows[0]
         assert "age" in rows[0]
 
+    def test_iteration_matches_to_dicts(self):
+        """Test iterating rows yields the same dicts as to_dicts, nulls included."""
+        data = [{"name": "Alice", "age": 25}, {"name": None, "age": None}, {"name": "Bob", "age": 30}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert list(frame) == frame.to_dicts() == data
+
 
 class TestTinyFrameOperations:
     """Test TinyFrame operations."""
@@ -83,27 +141,24 @@ class TestTinyFrameOperations:
     def test_fillna_scalar(self, sample_frame):
         """Test filling missing values with scalar."""
         # First, ensure we have some None values
-        original_data = sample_frame.to_dicts()
-        
+        assert sample_frame.col("age").null_count == 1
+        assert sample_frame.col("score").null_count == 1
+
         # Fill missing values
         sample_frame.fillna({"age": 0, "score": 0.0})
-        
+
         # Check that None values were filled
-        filled_data = sample_frame.to_dicts()
-        for row in filled_data:
-            assert row["age"] is not None
-            assert row["score"] is not None
+        assert sample_frame.col("age").null_count == 0
+        assert sample_frame.col("score").null_count == 0
 
     def test_fillna_dict(self, sample_frame):
         """Test filling missing values with dictionary."""
         sample_frame.fillna({"age": 25, "score": 80.0})
-        
-        filled_data = sample_frame.to_dicts()
-        for row in filled_data:
-            if row["age"] is None:
-                assert row["age"] == 25
-            if row["score"] is None:
-                assert row["score"] == 80.0
+
+        assert sample_frame.col("age").null_count == 0
+        assert sample_frame.col("score").null_count == 0
+        assert sample_frame.column("age")[3] == 25
+        assert sample_frame.column("score")[4] == 80.0
 
     def test_cast_column(self, sample_frame):
         """Test casting column types."""
@@ -111,20 +166,18 @@ class TestTinyFrameOperations:
         sample_frame.cast_column("age", float)
         
         # Check that age column is now float
-        data = sample_frame.to_dicts()
-        for row in data:
-            if row["age"] is not None:
-                assert isinstance(row["age"], float)
+        for age in sample_frame.column("age"):
+            if age is not None:
+                assert isinstance(age, float)
 
     def test_edit_column(self, sample_frame):
         """Test editing column values."""
         # Edit name column to uppercase
         sample_frame.edit_column("name", lambda x: x.upper() if x else x)
         
-        data = sample_frame.to_dicts()
-        for row in data:
-            if row["name"] is not None:
-                assert row["name"].isupper()
+        for name in sample_frame.column("name"):
+            if name is not None:
+                assert name.isupper()
 
     def test_drop_columns(self, sample_frame):
         """Test dropping columns."""
@@ -138,11 +191,31 @@ class TestTinyFrameOperations:
     def test_rename_column(self, sample_frame):
         """Test renaming columns."""
         sample_frame.rename_column("name", "full_name")
-        
-        data = sample_frame.to_dicts()
-        for row in data:
-            assert "full_name" in row
-            assert "name" not in row
+
+        assert "full_name" in sample_frame.columns
+        assert "name" not in sample_frame.columns
+
+    def test_col_unaffected_by_later_changes(self, sample_frame):
+        """Test a column handle keeps the values it was taken with."""
+        age = sample_frame.col("age")
+        before = age.to_list()
+
+        sample_frame.fillna({"age": 0})
+        sample_frame.drop_columns(["age"])
+
+        assert age.to_list() == before
+        assert age.null_count == 1
+        assert list(age) == before
+
+    def test_column_null_count(self):
+        """Test null counts read from the column without converting values."""
+        frame = ft.TinyFrame.from_dicts([
+            {"a": 1, "b": None, "c": "x", "d": None},
+            {"a": 2, "b": 2.5, "c": None, "d": None},
+            {"a": 3, "b": None, "c": "z", "d": None},
+        ])
+
+        assert [frame.col(name).null_count for name in "abcd"] == [0, 2, 1, 3]
 
 
 class TestTinyFrameEdgeCases:
@@ -186,14 +259,15 @@ class TestTinyFrameComparison:
         assert ft_frame.shape == sample_pandas_frame.shape
         assert ft_frame.len() == len(sample_pandas_frame)
         
-        # Compare data
-        ft_data = ft_frame.to_dicts()
-        pd_data = sample_pandas_frame.to_dict("records")
-        
-        # Check that we have the same number of records
-        assert len(ft_data) == len(pd_data)
-        
-        # Check that all keys are present
-        ft_keys = set(ft_data[0].keys()) if ft_data else set()
-        pd_keys = set(pd_data[0].keys()) if pd_data else set()
-        assert ft_keys == pd_keys
+        # Compare schemas without converting any rows
+        assert set(ft_frame.columns) == set(sample_pandas_frame.columns)
+        assert dict(ft_frame.schema) == {"name": "Str", "age": "OptInt", "city": "OptStr", "score": "OptFloat"}
+
+    def test_to_pandas_matches_records(self, sample_records, sample_pandas_frame):
+        """Test to_pandas builds the same DataFrame pandas makes from the records."""
+        ft_frame = ft.TinyFrame.from_dicts(sample_records)
+
+        result = ft_frame.to_pandas()
+
+        assert isinstance(result, pd.DataFrame)
+        pd.testing.assert_frame_equal(result[list(sample_pandas_frame.columns)], sample_pandas_frame)
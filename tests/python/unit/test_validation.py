@@ -1,22 +1,48 @@
+import numpy as np
 import pytest
 import feathertail as ft
 
+# Shared rows for the small validation tests; from_dicts only reads them
+_BASIC_DATA = [
+    {"value": 1, "id": 1},
+    {"value": 2, "id": 2},
+    {"value": 3, "id": 3},
+]
+
+_NULL_DATA = [
+    {"value": 1.0, "id": 1},
+    {"value": None, "id": 2},
+    {"value": 3.0, "id": 3},
+]
+
+# The middle row is above 20
+_RANGE_VIOLATION_DATA = [
+    {"value": 5, "id": 1},
+    {"value": 25, "id": 2},
+    {"value": 15, "id": 3},
+]
+
 class TestValidationOperations:
     """Test validation operations"""
 
     def get_column_data(self, frame, column_name):
         """Helper to get column data from a frame"""
-        data = frame.to_dicts()
-        return [row[column_name] for row in data]
+        return frame.column(column_name)
+
+    @pytest.fixture(scope="class")
+    def large_frame(self):
+        """100-row frame shared by the class; validation never mutates its input."""
+        return ft.TinyFrame.from_arrays({"value": np.arange(100, dtype=np.float64), "id": np.arange(100, dtype=np.int64)})
+
+    @pytest.fixture(scope="class")
+    def duplicate_frame(self):
+        """1000-row frame whose values repeat every 100 rows, shared by the class."""
+        ids = np.arange(1000, dtype=np.int64)
+        return ft.TinyFrame.from_arrays({"value": (ids % 100).astype(np.float64), "id": ids})
 
     def test_validate_not_null_basic(self):
         """Test basic not null validation"""
-        data = [
-            {"value": 1, "id": 1},
-            {"value": 2, "id": 2},
-            {"value": 3, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_BASIC_DATA)
 
         result = frame.validate_not_null("value")
 
@@ -28,18 +54,27 @@ class TestValidationOperations:
 
     def test_validate_not_null_with_nulls(self):
         """Test not null validation with null values"""
-        data = [
-            {"value": 1.0, "id": 1},
-            {"value": None, "id": 2},
-            {"value": 3.0, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_NULL_DATA)
 
         result = frame.validate_not_null("value")
 
         validation_results = self.get_column_data(result, "value_not_null")
         assert validation_results == [True, False, True]
 
+    def test_validate_not_null_optional_columns(self):
+        """Test not null results for string and boolean columns with nulls"""
+        data = [
+            {"name": "a", "flag": None},
+            {"name": None, "flag": True},
+            {"name": "c", "flag": False},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.validate_not_null("name").validate_not_null("flag")
+
+        assert self.get_column_data(result, "name_not_null") == [True, False, True]
+        assert self.get_column_data(result, "flag_not_null") == [False, True, True]
+
     def test_validate_range_basic(self):
         """Test basic range validation"""
         data = [
@@ -59,12 +94,7 @@ class TestValidationOperations:
 
     def test_validate_range_with_violations(self):
         """Test range validation with violations"""
-        data = [
-            {"value": 5, "id": 1},
-            {"value": 25, "id": 2},  # Out of range
-            {"value": 15, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_RANGE_VIOLATION_DATA)
 
         result = frame.validate_range("value", 0, 20)
 
@@ -85,6 +115,18 @@ class TestValidationOperations:
         validation_results = self.get_column_data(result, "value_in_range")
         assert validation_results == [True, True, False]
 
+    def test_validate_range_nulls_with_zero_out_of_range(self):
+        """Test nulls stay valid even when a zero value would fail the range"""
+        data = [{"value": v} for v in [None, 7, 0, None, None, 12, 6]]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.validate_range("value", 5, 10)
+
+        assert self.get_column_data(result, "value_in_range") == [True, True, False, True, True, False, True]
+
+        floats = ft.TinyFrame.from_dicts([{"value": v} for v in [None, 7.5, 0.0, None]])
+        assert self.get_column_data(floats.validate_range("value", 5, None), "value_in_range") == [True, True, False, True]
+
     def test_validate_range_min_only(self):
         """Test range validation with only minimum value"""
         data = [
@@ -101,18 +143,23 @@ class TestValidationOperations:
 
     def test_validate_range_max_only(self):
         """Test range validation with only maximum value"""
-        data = [
-            {"value": 5, "id": 1},
-            {"value": 25, "id": 2},  # Above maximum
-            {"value": 15, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_RANGE_VIOLATION_DATA)
 
         result = frame.validate_range("value", None, 20)
 
         validation_results = self.get_column_data(result, "value_in_range")
         assert validation_results == [True, False, True]
 
+    def test_validate_range_open_bounds_with_nan(self):
+        """Test NaN fails any bound but passes when both bounds are open"""
+        data = [{"value": 1.5}, {"value": float("nan")}, {"value": float("inf")}, {"value": -3.0}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert self.get_column_data(frame.validate_range("value", None, None), "value_in_range") == [True, True, True, True]
+        assert self.get_column_data(frame.validate_range("value", -5, None), "value_in_range") == [True, False, True, True]
+        assert self.get_column_data(frame.validate_range("value", None, 2), "value_in_range") == [True, False, False, True]
+        assert self.get_column_data(frame.validate_range("value", 0, 2), "value_in_range") == [True, False, False, False]
+
     def test_validate_pattern_basic(self):
         """Test basic pattern validation"""
         data = [
@@ -144,6 +191,15 @@ class TestValidationOperations:
         validation_results = self.get_column_data(result, "email_matches_pattern")
         assert validation_results == [True, True, False]
 
+    def test_validate_pattern_is_literal(self):
+        """Test patterns match as literal substrings, regex metacharacters included"""
+        data = [{"code": "a.b"}, {"code": "axb"}, {"code": ""}, {"code": "ü.ß"}]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert self.get_column_data(frame.validate_pattern("code", "."), "code_matches_pattern") == [True, False, False, True]
+        assert self.get_column_data(frame.validate_pattern("code", ""), "code_matches_pattern") == [True, True, True, True]
+        assert self.get_column_data(frame.validate_pattern("code", "ü."), "code_matches_pattern") == [False, False, False, True]
+
     def test_validate_unique_basic(self):
         """Test basic uniqueness validation"""
         data = [
@@ -175,6 +231,29 @@ class TestValidationOperations:
         validation_results = self.get_column_data(result, "name_unique")
         assert validation_results == [True, True, False]
 
+    def test_validate_unique_float_keys(self):
+        """Test -0.0 repeats 0.0 while NaN and nulls never count as duplicates"""
+        data = [{"value": v} for v in [1.0, float("nan"), float("nan"), -0.0, 0.0, None, None, 1.0]]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        result = frame.validate_unique("value")
+
+        assert self.get_column_data(result, "value_unique") == [True, True, True, True, False, True, True, False]
+
+    def test_validate_unique_above_parallel_threshold(self):
+        """Test first occurrences across the stripes of a large column split between threads"""
+        values = [None if i % 7 == 0 else (i * 7919) % 13_001 for i in range(50_000)]
+        frame = ft.TinyFrame.from_dicts([{"value": v, "name": None if v is None else f"n{v}"} for v in values])
+
+        seen = set()
+        expected = []
+        for v in values:
+            expected.append(v is None or v not in seen)
+            seen.add(v)
+
+        assert self.get_column_data(frame.validate_unique("value"), "value_unique") == expected
+        assert self.get_column_data(frame.validate_unique("name"), "name_unique") == expected
+
     def test_validate_unique_numeric(self):
         """Test uniqueness validation with numeric values"""
         data = [
@@ -191,12 +270,7 @@ class TestValidationOperations:
 
     def test_validation_summary_basic(self):
         """Test basic validation summary"""
-        data = [
-            {"value": 1, "id": 1},
-            {"value": 2, "id": 2},
-            {"value": 3, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_BASIC_DATA)
 
         summary = frame.validation_summary("value")
 
@@ -207,12 +281,7 @@ class TestValidationOperations:
 
     def test_validation_summary_with_nulls(self):
         """Test validation summary with null values"""
-        data = [
-            {"value": 1.0, "id": 1},
-            {"value": None, "id": 2},
-            {"value": 3.0, "id": 3},
-        ]
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_dicts(_NULL_DATA)
 
         summary = frame.validation_summary("value")
 
@@ -221,6 +290,27 @@ class TestValidationOperations:
         assert abs(summary["null_percentage"] - 33.333333333333336) < 0.001
         assert summary["non_null_count"] == 2.0
 
+    def test_validation_summary_column_types(self):
+        """Test validation summary counts nulls in string and boolean columns"""
+        data = [
+            {"name": "a", "flag": True},
+            {"name": None, "flag": None},
+            {"name": None, "flag": False},
+            {"name": "d", "flag": True},
+        ]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        assert frame.validation_summary("name") == {
+            "total_count": 4.0, "null_count": 2.0, "null_percentage": 50.0, "non_null_count": 2.0
+        }
+        assert frame.validation_summary("flag") == {
+            "total_count": 4.0, "null_count": 1.0, "null_percentage": 25.0, "non_null_count": 3.0
+        }
+
+        mixed = ft.TinyFrame.from_dicts([{"x": 1}, {"x": "a"}])
+        with pytest.raises(TypeError):
+            mixed.validation_summary("x")
+
     def test_validation_operations_nonexistent_column(self):
         """Test validation operations with non-existent column"""
         data = [{"value": 1}]
@@ -274,15 +364,50 @@ class TestValidationOperations:
         assert range_results == [True, False, True]
         assert unique_results == [True, True, False]
 
-    def test_validation_operations_large_dataset(self):
-        """Test validation operations with larger dataset"""
-        data = []
-        for i in range(100):
-            data.append({"value": float(i), "id": i})
-
+    def test_validation_plan_matches_chained_calls(self):
+        """Test a validation plan adds the same columns as chained validate_* calls"""
+        data = [
+            {"value": 5, "name": "Alice", "email": "a@x.org"},
+            {"value": None, "name": "Bob", "email": "bob"},
+            {"value": 25, "name": "Alice", "email": None},
+        ]
         frame = ft.TinyFrame.from_dicts(data)
 
-        result = frame.validate_range("value", 0.0, 100.0)
+        chained = (
+            frame.validate_not_null("value")
+            .validate_range("value", 0, 20)
+            .validate_pattern("email", "@")
+            .validate_unique("name")
+        )
+        planned = frame.validate().not_null("value").range("value", 0, 20).pattern("email", "@").unique("name").run()
+
+        assert sorted(planned.columns) == sorted(chained.columns)
+        assert planned.to_dicts() == chained.to_dicts()
+        assert "value_in_range" not in frame.columns
+
+        # Later checks see the columns added by earlier ones
+        stacked = frame.validate().range("value", 0, 20).unique("value_in_range").run()
+        assert self.get_column_data(stacked, "value_in_range_unique") == [True, False, True]
+
+        with pytest.raises(KeyError):
+            frame.validate().unique("missing")
+
+    def test_validation_plan_uses_frame_at_build_time(self):
+        """Test a plan checks column names as checks are added and ignores later changes to the frame"""
+        frame = ft.TinyFrame.from_dicts([{"value": 1}, {"value": None}])
+        plan = frame.validate().not_null("value").unique("value_not_null")
+
+        frame.fillna({"value": 0})
+        result = plan.run()
+        assert self.get_column_data(result, "value_not_null") == [True, False]
+        assert self.get_column_data(result, "value_not_null_unique") == [True, True]
+
+        with pytest.raises(KeyError):
+            frame.validate().not_null("value").unique("value_in_range")
+
+    def test_validation_operations_large_dataset(self, large_frame):
+        """Test validation operations with larger dataset"""
+        result = large_frame.validate_range("value", 0.0, 100.0)
 
         assert "value_in_range" in result.columns
         assert result.len() == 100
@@ -360,15 +485,9 @@ class TestValidationOperations:
         assert value_results == [True, False, True]
         assert text_results == [True, True, False]
 
-    def test_validation_operations_performance(self):
+    def test_validation_operations_performance(self, duplicate_frame):
         """Test validation operations performance with large dataset"""
-        data = []
-        for i in range(1000):
-            data.append({"value": float(i % 100), "id": i})  # Some duplicates
-
-        frame = ft.TinyFrame.from_dicts(data)
-
-        result = frame.validate_unique("value")
+        result = duplicate_frame.validate_unique("value")
 
         assert "value_unique" in result.columns
         assert result.len() == 1000
@@ -377,3 +496,11 @@ class TestValidationOperations:
         # First occurrence of each value should be True, subsequent should be False
         assert validation_results[0] == True  # First occurrence of 0.0
         assert validation_results[100] == False  # Second occurrence of 0.0
+
+    def test_validation_leaves_shared_frame_unchanged(self, duplicate_frame):
+        """Test validations add columns to a new frame, so class fixtures stay intact"""
+        duplicate_frame.validate_unique("value")
+        duplicate_frame.validate().range("value", 0, 50).not_null("id").run()
+
+        assert sorted(duplicate_frame.columns) == ["id", "value"]
+        assert duplicate_frame.len() == 1000
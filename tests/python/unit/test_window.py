@@ -1,3 +1,4 @@
+import math
 import pytest
 import feathertail as ft
 
@@ -7,8 +8,7 @@ class TestWindowFunctions:
 
     def get_column_data(self, frame, column_name):
         """Helper to get column data from a frame"""
-        data = frame.to_dicts()
-        return [row[column_name] for row in data]
+        return frame.column(column_name)
 
     def test_rolling_mean_basic(self):
         """Test basic rolling mean calculation"""
@@ -65,6 +65,18 @@ class TestWindowFunctions:
         # All values should be None (insufficient data)
         assert rolling_means == [None, None]
 
+    def test_window_larger_than_data_still_checks_column(self):
+        """Test a window that cannot fill gives nulls but still rejects bad columns"""
+        frame = ft.TinyFrame.from_dicts([{"value": 1.0, "name": "a"}, {"value": 2.0, "name": "b"}])
+
+        result = frame.window("value").rolling_sum(3).rolling_std(5).expanding_sum().run()
+
+        assert self.get_column_data(result, "value_rolling_sum") == [None, None]
+        assert self.get_column_data(result, "value_rolling_std") == [None, None]
+        assert self.get_column_data(result, "value_expanding_sum") == [1.0, 3.0]
+        with pytest.raises(TypeError):
+            frame.rolling_mean("name", 3)
+
     def test_rolling_sum_basic(self):
         """Test basic rolling sum calculation"""
         data = [
@@ -87,6 +99,33 @@ class TestWindowFunctions:
         # Fourth value: sum of [3, 4] = 7.0
         assert rolling_sums[3] == 7.0
 
+    def test_rolling_sum_recovers_after_nan_and_inf(self):
+        """Test NaN and infinity only affect the windows that contain them"""
+        nan, inf = float("nan"), float("inf")
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in [1.0, nan, 2.0, 3.0, inf, 4.0, 5.0]])
+
+        rolling_sums = self.get_column_data(frame.rolling_sum("value", 2), "value_rolling_sum")
+
+        assert rolling_sums[0] is None
+        assert math.isnan(rolling_sums[1]) and math.isnan(rolling_sums[2])
+        assert rolling_sums[3:] == [5.0, inf, inf, 9.0]
+
+    def test_rolling_sum_with_nulls_matches_window_sums(self):
+        """Test a running sum over a long column with nulls matches summing each window"""
+        values = [None if i % 5 == 0 else (i * 37) % 101 - 50 for i in range(500)]
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in values])
+
+        result = frame.rolling_sum("value", 4).rolling_mean("value", 4)
+
+        expected_sums = []
+        expected_means = []
+        for i in range(len(values)):
+            window = [v for v in values[max(0, i - 3):i + 1] if v is not None]
+            expected_sums.append(float(sum(window)) if len(window) >= 4 else None)
+            expected_means.append(sum(window) / len(window) if len(window) >= 4 else None)
+        assert self.get_column_data(result, "value_rolling_sum") == expected_sums
+        assert self.get_column_data(result, "value_rolling_mean") == expected_means
+
     def test_rolling_std_basic(self):
         """Test basic rolling standard deviation calculation"""
         data = [
@@ -108,6 +147,16 @@ class TestWindowFunctions:
         # Fourth value: std of [2, 3, 4] ≈ 0.816
         assert abs(rolling_stds[3] - 0.816) < 0.01
 
+    def test_rolling_std_after_outlier_leaves_window(self):
+        """Test windows after a large outlier are as exact as computing them alone"""
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in [1e6, 5.0, 8.0, 5.0, 5.0]])
+
+        rolling_stds = self.get_column_data(frame.rolling_std("value", 2), "value_rolling_std")
+
+        assert rolling_stds[0] is None
+        assert math.isclose(rolling_stds[1], 499997.5)
+        assert rolling_stds[2:] == [1.5, 1.5, 0.0]
+
     def test_rolling_with_integer_column(self):
         """Test rolling operations with integer column"""
         data = [
@@ -176,6 +225,36 @@ class TestWindowFunctions:
         assert expanding_sums[1] == 3.0  # sum of [1, 2]
         assert expanding_sums[2] == 6.0  # sum of [1, 2, 3]
 
+    def test_expanding_matches_cumulative_sums(self):
+        """Test expanding results over a long column with nulls match running totals"""
+        values = [None if i % 9 == 4 else (i * 13) % 37 - 18 for i in range(1000)]
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in values])
+
+        result = frame.expanding_sum("value").expanding_mean("value")
+
+        expected_sums = []
+        expected_means = []
+        total = count = 0
+        for v in values:
+            if v is not None:
+                total += v
+                count += 1
+            expected_sums.append(float(total))
+            expected_means.append(total / count)
+        assert self.get_column_data(result, "value_expanding_sum") == expected_sums
+        assert self.get_column_data(result, "value_expanding_mean") == expected_means
+
+    def test_window_sums_are_compensated(self):
+        """Test running sums keep the low-order bits plain addition rounds away"""
+        values = [0.1] * 10
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in values])
+
+        expanding_sums = self.get_column_data(frame.expanding_sum("value"), "value_expanding_sum")
+        assert expanding_sums == [math.fsum(values[:i + 1]) for i in range(len(values))]
+
+        frame = ft.TinyFrame.from_dicts([{"value": v} for v in [1e16, 1.0, 1.0, 1.0]])
+        assert self.get_column_data(frame.rolling_sum("value", 2), "value_rolling_sum") == [None, 1e16, 2.0, 2.0]
+
     def test_expanding_with_integer_column(self):
         """Test expanding operations with integer column"""
         data = [
@@ -261,11 +340,7 @@ class TestWindowFunctions:
 
     def test_window_operations_large_dataset(self):
         """Test window operations with larger dataset"""
-        data = []
-        for i in range(100):
-            data.append({"value": float(i), "id": i})
-
-        frame = ft.TinyFrame.from_dicts(data)
+        frame = ft.TinyFrame.from_arrays({"value": [float(i) for i in range(100)], "id": list(range(100))})
 
         result = frame.rolling_mean("value", 10)
 
@@ -296,6 +371,62 @@ class TestWindowFunctions:
         assert "value_expanding_mean" in result.columns
         assert result.len() == 4
 
+    def test_window_plan_matches_chained_calls(self):
+        """Test a window plan adds the same columns as chained window calls"""
+        data = [{"value": v, "id": i} for i, v in enumerate([1.0, None, 3.0, 4.0, -2.0, 6.0])]
+        frame = ft.TinyFrame.from_dicts(data)
+
+        planned = frame.window("value").rolling_mean(2).rolling_std(3).expanding_mean().expanding_sum().run()
+        chained = frame.rolling_mean("value", 2).rolling_std("value", 3).expanding_mean("value").expanding_sum("value")
+
+        assert sorted(planned.columns) == sorted(chained.columns)
+        for name in chained.columns:
+            assert self.get_column_data(planned, name) == self.get_column_data(chained, name)
+
+        with pytest.raises(TypeError):
+            ft.TinyFrame.from_dicts([{"name": "a"}]).window("name").expanding_sum().run()
+
+    def test_window_plan_uses_frame_at_build_time(self):
+        """Test a window plan checks its column up front and ignores later changes to the frame"""
+        frame = ft.TinyFrame.from_dicts([{"value": 1}, {"value": None}, {"value": 3}])
+        plan = frame.window("value").expanding_sum()
+
+        frame.fillna({"value": 10})
+        frame.drop_columns(["value"])
+        assert self.get_column_data(plan.run(), "value_expanding_sum") == [1.0, 1.0, 4.0]
+
+        with pytest.raises(KeyError):
+            frame.window("value")
+
+    def test_rolling_mean_many_matches_single_columns(self):
+        """Test rolling means of several columns, parallel above the threshold, match one call per column"""
+        n = 20_000
+        frame = ft.TinyFrame.from_arrays({
+            "a": [float((i * 37) % 101) for i in range(n)],
+            "b": [None if i % 7 == 0 else i % 13 for i in range(n)],
+            "name": ["x"] * n,
+        })
+
+        result = frame.rolling_mean_many(["a", "b"], 5)
+
+        for name in ["a", "b"]:
+            expected = frame.rolling_mean(name, 5)
+            assert self.get_column_data(result, f"{name}_rolling_mean") == self.get_column_data(expected, f"{name}_rolling_mean")
+
+        with pytest.raises(KeyError):
+            frame.rolling_mean_many(["a", "missing"], 5)
+        with pytest.raises(TypeError):
+            frame.rolling_mean_many(["a", "name"], 5)
+
+    def test_window_result_columns_match_rows(self):
+        """Test reading window results by column gives the same values as reading rows"""
+        data = [{"value": v, "name": n} for v, n in [(1.0, "a"), (None, None), (3.5, "c"), (-2.0, "d")]]
+        result = ft.TinyFrame.from_dicts(data).window("value").rolling_mean(2).expanding_sum().run()
+
+        rows = result.to_dicts()
+        for name in result.columns:
+            assert result.column(name) == [row[name] for row in rows]
+
     def test_window_operations_with_negative_values(self):
         """Test window operations with negative values"""
         data = [